@@ -14,6 +14,8 @@ Attributes:
     MODE_CFB: Cipher Feedback mode.
     MODE_OFB: OutputFeedback mode.
     MODE_CTR: Counter mode.
+    MODE_CTR_ACPKM: Counter mode with the key meshing (ACPKM).
+    MODE_MGM: Multilinear Galois Mode (authenticated encryption).
     MODE_MAC: Message Authentication Code algorithm.
     PAD_MODE_1: Message padding procedure No. 1 (paragraph 4.1.1
       GOST 34.13-2015)
@@ -28,11 +30,16 @@ from .gost_34_12_2015 import (
 
 from .gost_34_13_2015 import (
     new,
+    set_key_cache_size,
+    encrypt_file,
+    decrypt_file,
     MODE_ECB,
     MODE_CBC,
     MODE_CFB,
     MODE_OFB,
     MODE_CTR,
+    MODE_CTR_ACPKM,
+    MODE_MGM,
     MODE_MAC,
     PAD_MODE_1,
     PAD_MODE_2,
@@ -41,11 +48,16 @@ from .gost_34_13_2015 import (
 
 __all__ = (
     'new',
+    'set_key_cache_size',
+    'encrypt_file',
+    'decrypt_file',
     'MODE_ECB',
     'MODE_CBC',
     'MODE_CFB',
     'MODE_OFB',
     'MODE_CTR',
+    'MODE_CTR_ACPKM',
+    'MODE_MGM',
     'MODE_MAC',
     'PAD_MODE_1',
     'PAD_MODE_2',
@@ -16,8 +16,12 @@ encryption and decryption procedures for the 'magma' algorithm.
 """
 # pylint: enable=duplicate-code
 
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
 from struct import pack
-from typing import List
+from typing import Callable, List, Optional
 
 from gostcrypto.utils import add_xor
 from gostcrypto.utils import zero_fill
@@ -28,279 +32,266 @@ _BLOCK_SIZE_MAGMA: int = 8
 _KEY_SIZE: int = 32
 
 # pylint: enable=duplicate-code
-_GF: tuple = ((
-    0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-    0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-    0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-    0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-    0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-    0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-    0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-    0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-    0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-    0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-    0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-    0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-    0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-    0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-    0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-    0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-), (
-    0x00, 0x94, 0xeb, 0x7f, 0x15, 0x81, 0xfe, 0x6a, 0x2a, 0xbe, 0xc1, 0x55, 0x3f, 0xab, 0xd4, 0x40,
-    0x54, 0xc0, 0xbf, 0x2b, 0x41, 0xd5, 0xaa, 0x3e, 0x7e, 0xea, 0x95, 0x01, 0x6b, 0xff, 0x80, 0x14,
-    0xa8, 0x3c, 0x43, 0xd7, 0xbd, 0x29, 0x56, 0xc2, 0x82, 0x16, 0x69, 0xfd, 0x97, 0x03, 0x7c, 0xe8,
-    0xfc, 0x68, 0x17, 0x83, 0xe9, 0x7d, 0x02, 0x96, 0xd6, 0x42, 0x3d, 0xa9, 0xc3, 0x57, 0x28, 0xbc,
-    0x93, 0x07, 0x78, 0xec, 0x86, 0x12, 0x6d, 0xf9, 0xb9, 0x2d, 0x52, 0xc6, 0xac, 0x38, 0x47, 0xd3,
-    0xc7, 0x53, 0x2c, 0xb8, 0xd2, 0x46, 0x39, 0xad, 0xed, 0x79, 0x06, 0x92, 0xf8, 0x6c, 0x13, 0x87,
-    0x3b, 0xaf, 0xd0, 0x44, 0x2e, 0xba, 0xc5, 0x51, 0x11, 0x85, 0xfa, 0x6e, 0x04, 0x90, 0xef, 0x7b,
-    0x6f, 0xfb, 0x84, 0x10, 0x7a, 0xee, 0x91, 0x05, 0x45, 0xd1, 0xae, 0x3a, 0x50, 0xc4, 0xbb, 0x2f,
-    0xe5, 0x71, 0x0e, 0x9a, 0xf0, 0x64, 0x1b, 0x8f, 0xcf, 0x5b, 0x24, 0xb0, 0xda, 0x4e, 0x31, 0xa5,
-    0xb1, 0x25, 0x5a, 0xce, 0xa4, 0x30, 0x4f, 0xdb, 0x9b, 0x0f, 0x70, 0xe4, 0x8e, 0x1a, 0x65, 0xf1,
-    0x4d, 0xd9, 0xa6, 0x32, 0x58, 0xcc, 0xb3, 0x27, 0x67, 0xf3, 0x8c, 0x18, 0x72, 0xe6, 0x99, 0x0d,
-    0x19, 0x8d, 0xf2, 0x66, 0x0c, 0x98, 0xe7, 0x73, 0x33, 0xa7, 0xd8, 0x4c, 0x26, 0xb2, 0xcd, 0x59,
-    0x76, 0xe2, 0x9d, 0x09, 0x63, 0xf7, 0x88, 0x1c, 0x5c, 0xc8, 0xb7, 0x23, 0x49, 0xdd, 0xa2, 0x36,
-    0x22, 0xb6, 0xc9, 0x5d, 0x37, 0xa3, 0xdc, 0x48, 0x08, 0x9c, 0xe3, 0x77, 0x1d, 0x89, 0xf6, 0x62,
-    0xde, 0x4a, 0x35, 0xa1, 0xcb, 0x5f, 0x20, 0xb4, 0xf4, 0x60, 0x1f, 0x8b, 0xe1, 0x75, 0x0a, 0x9e,
-    0x8a, 0x1e, 0x61, 0xf5, 0x9f, 0x0b, 0x74, 0xe0, 0xa0, 0x34, 0x4b, 0xdf, 0xb5, 0x21, 0x5e, 0xca,
-), (
-    0x00, 0x20, 0x40, 0x60, 0x80, 0xa0, 0xc0, 0xe0, 0xc3, 0xe3, 0x83, 0xa3, 0x43, 0x63, 0x03, 0x23,
-    0x45, 0x65, 0x05, 0x25, 0xc5, 0xe5, 0x85, 0xa5, 0x86, 0xa6, 0xc6, 0xe6, 0x06, 0x26, 0x46, 0x66,
-    0x8a, 0xaa, 0xca, 0xea, 0x0a, 0x2a, 0x4a, 0x6a, 0x49, 0x69, 0x09, 0x29, 0xc9, 0xe9, 0x89, 0xa9,
-    0xcf, 0xef, 0x8f, 0xaf, 0x4f, 0x6f, 0x0f, 0x2f, 0x0c, 0x2c, 0x4c, 0x6c, 0x8c, 0xac, 0xcc, 0xec,
-    0xd7, 0xf7, 0x97, 0xb7, 0x57, 0x77, 0x17, 0x37, 0x14, 0x34, 0x54, 0x74, 0x94, 0xb4, 0xd4, 0xf4,
-    0x92, 0xb2, 0xd2, 0xf2, 0x12, 0x32, 0x52, 0x72, 0x51, 0x71, 0x11, 0x31, 0xd1, 0xf1, 0x91, 0xb1,
-    0x5d, 0x7d, 0x1d, 0x3d, 0xdd, 0xfd, 0x9d, 0xbd, 0x9e, 0xbe, 0xde, 0xfe, 0x1e, 0x3e, 0x5e, 0x7e,
-    0x18, 0x38, 0x58, 0x78, 0x98, 0xb8, 0xd8, 0xf8, 0xdb, 0xfb, 0x9b, 0xbb, 0x5b, 0x7b, 0x1b, 0x3b,
-    0x6d, 0x4d, 0x2d, 0x0d, 0xed, 0xcd, 0xad, 0x8d, 0xae, 0x8e, 0xee, 0xce, 0x2e, 0x0e, 0x6e, 0x4e,
-    0x28, 0x08, 0x68, 0x48, 0xa8, 0x88, 0xe8, 0xc8, 0xeb, 0xcb, 0xab, 0x8b, 0x6b, 0x4b, 0x2b, 0x0b,
-    0xe7, 0xc7, 0xa7, 0x87, 0x67, 0x47, 0x27, 0x07, 0x24, 0x04, 0x64, 0x44, 0xa4, 0x84, 0xe4, 0xc4,
-    0xa2, 0x82, 0xe2, 0xc2, 0x22, 0x02, 0x62, 0x42, 0x61, 0x41, 0x21, 0x01, 0xe1, 0xc1, 0xa1, 0x81,
-    0xba, 0x9a, 0xfa, 0xda, 0x3a, 0x1a, 0x7a, 0x5a, 0x79, 0x59, 0x39, 0x19, 0xf9, 0xd9, 0xb9, 0x99,
-    0xff, 0xdf, 0xbf, 0x9f, 0x7f, 0x5f, 0x3f, 0x1f, 0x3c, 0x1c, 0x7c, 0x5c, 0xbc, 0x9c, 0xfc, 0xdc,
-    0x30, 0x10, 0x70, 0x50, 0xb0, 0x90, 0xf0, 0xd0, 0xf3, 0xd3, 0xb3, 0x93, 0x73, 0x53, 0x33, 0x13,
-    0x75, 0x55, 0x35, 0x15, 0xf5, 0xd5, 0xb5, 0x95, 0xb6, 0x96, 0xf6, 0xd6, 0x36, 0x16, 0x76, 0x56,
-), (
-    0x00, 0x85, 0xc9, 0x4c, 0x51, 0xd4, 0x98, 0x1d, 0xa2, 0x27, 0x6b, 0xee, 0xf3, 0x76, 0x3a, 0xbf,
-    0x87, 0x02, 0x4e, 0xcb, 0xd6, 0x53, 0x1f, 0x9a, 0x25, 0xa0, 0xec, 0x69, 0x74, 0xf1, 0xbd, 0x38,
-    0xcd, 0x48, 0x04, 0x81, 0x9c, 0x19, 0x55, 0xd0, 0x6f, 0xea, 0xa6, 0x23, 0x3e, 0xbb, 0xf7, 0x72,
-    0x4a, 0xcf, 0x83, 0x06, 0x1b, 0x9e, 0xd2, 0x57, 0xe8, 0x6d, 0x21, 0xa4, 0xb9, 0x3c, 0x70, 0xf5,
-    0x59, 0xdc, 0x90, 0x15, 0x08, 0x8d, 0xc1, 0x44, 0xfb, 0x7e, 0x32, 0xb7, 0xaa, 0x2f, 0x63, 0xe6,
-    0xde, 0x5b, 0x17, 0x92, 0x8f, 0x0a, 0x46, 0xc3, 0x7c, 0xf9, 0xb5, 0x30, 0x2d, 0xa8, 0xe4, 0x61,
-    0x94, 0x11, 0x5d, 0xd8, 0xc5, 0x40, 0x0c, 0x89, 0x36, 0xb3, 0xff, 0x7a, 0x67, 0xe2, 0xae, 0x2b,
-    0x13, 0x96, 0xda, 0x5f, 0x42, 0xc7, 0x8b, 0x0e, 0xb1, 0x34, 0x78, 0xfd, 0xe0, 0x65, 0x29, 0xac,
-    0xb2, 0x37, 0x7b, 0xfe, 0xe3, 0x66, 0x2a, 0xaf, 0x10, 0x95, 0xd9, 0x5c, 0x41, 0xc4, 0x88, 0x0d,
-    0x35, 0xb0, 0xfc, 0x79, 0x64, 0xe1, 0xad, 0x28, 0x97, 0x12, 0x5e, 0xdb, 0xc6, 0x43, 0x0f, 0x8a,
-    0x7f, 0xfa, 0xb6, 0x33, 0x2e, 0xab, 0xe7, 0x62, 0xdd, 0x58, 0x14, 0x91, 0x8c, 0x09, 0x45, 0xc0,
-    0xf8, 0x7d, 0x31, 0xb4, 0xa9, 0x2c, 0x60, 0xe5, 0x5a, 0xdf, 0x93, 0x16, 0x0b, 0x8e, 0xc2, 0x47,
-    0xeb, 0x6e, 0x22, 0xa7, 0xba, 0x3f, 0x73, 0xf6, 0x49, 0xcc, 0x80, 0x05, 0x18, 0x9d, 0xd1, 0x54,
-    0x6c, 0xe9, 0xa5, 0x20, 0x3d, 0xb8, 0xf4, 0x71, 0xce, 0x4b, 0x07, 0x82, 0x9f, 0x1a, 0x56, 0xd3,
-    0x26, 0xa3, 0xef, 0x6a, 0x77, 0xf2, 0xbe, 0x3b, 0x84, 0x01, 0x4d, 0xc8, 0xd5, 0x50, 0x1c, 0x99,
-    0xa1, 0x24, 0x68, 0xed, 0xf0, 0x75, 0x39, 0xbc, 0x03, 0x86, 0xca, 0x4f, 0x52, 0xd7, 0x9b, 0x1e,
-), (
-    0x00, 0x10, 0x20, 0x30, 0x40, 0x50, 0x60, 0x70, 0x80, 0x90, 0xa0, 0xb0, 0xc0, 0xd0, 0xe0, 0xf0,
-    0xc3, 0xd3, 0xe3, 0xf3, 0x83, 0x93, 0xa3, 0xb3, 0x43, 0x53, 0x63, 0x73, 0x03, 0x13, 0x23, 0x33,
-    0x45, 0x55, 0x65, 0x75, 0x05, 0x15, 0x25, 0x35, 0xc5, 0xd5, 0xe5, 0xf5, 0x85, 0x95, 0xa5, 0xb5,
-    0x86, 0x96, 0xa6, 0xb6, 0xc6, 0xd6, 0xe6, 0xf6, 0x06, 0x16, 0x26, 0x36, 0x46, 0x56, 0x66, 0x76,
-    0x8a, 0x9a, 0xaa, 0xba, 0xca, 0xda, 0xea, 0xfa, 0x0a, 0x1a, 0x2a, 0x3a, 0x4a, 0x5a, 0x6a, 0x7a,
-    0x49, 0x59, 0x69, 0x79, 0x09, 0x19, 0x29, 0x39, 0xc9, 0xd9, 0xe9, 0xf9, 0x89, 0x99, 0xa9, 0xb9,
-    0xcf, 0xdf, 0xef, 0xff, 0x8f, 0x9f, 0xaf, 0xbf, 0x4f, 0x5f, 0x6f, 0x7f, 0x0f, 0x1f, 0x2f, 0x3f,
-    0x0c, 0x1c, 0x2c, 0x3c, 0x4c, 0x5c, 0x6c, 0x7c, 0x8c, 0x9c, 0xac, 0xbc, 0xcc, 0xdc, 0xec, 0xfc,
-    0xd7, 0xc7, 0xf7, 0xe7, 0x97, 0x87, 0xb7, 0xa7, 0x57, 0x47, 0x77, 0x67, 0x17, 0x07, 0x37, 0x27,
-    0x14, 0x04, 0x34, 0x24, 0x54, 0x44, 0x74, 0x64, 0x94, 0x84, 0xb4, 0xa4, 0xd4, 0xc4, 0xf4, 0xe4,
-    0x92, 0x82, 0xb2, 0xa2, 0xd2, 0xc2, 0xf2, 0xe2, 0x12, 0x02, 0x32, 0x22, 0x52, 0x42, 0x72, 0x62,
-    0x51, 0x41, 0x71, 0x61, 0x11, 0x01, 0x31, 0x21, 0xd1, 0xc1, 0xf1, 0xe1, 0x91, 0x81, 0xb1, 0xa1,
-    0x5d, 0x4d, 0x7d, 0x6d, 0x1d, 0x0d, 0x3d, 0x2d, 0xdd, 0xcd, 0xfd, 0xed, 0x9d, 0x8d, 0xbd, 0xad,
-    0x9e, 0x8e, 0xbe, 0xae, 0xde, 0xce, 0xfe, 0xee, 0x1e, 0x0e, 0x3e, 0x2e, 0x5e, 0x4e, 0x7e, 0x6e,
-    0x18, 0x08, 0x38, 0x28, 0x58, 0x48, 0x78, 0x68, 0x98, 0x88, 0xb8, 0xa8, 0xd8, 0xc8, 0xf8, 0xe8,
-    0xdb, 0xcb, 0xfb, 0xeb, 0x9b, 0x8b, 0xbb, 0xab, 0x5b, 0x4b, 0x7b, 0x6b, 0x1b, 0x0b, 0x3b, 0x2b,
-), (
-    0x00, 0xc2, 0x47, 0x85, 0x8e, 0x4c, 0xc9, 0x0b, 0xdf, 0x1d, 0x98, 0x5a, 0x51, 0x93, 0x16, 0xd4,
-    0x7d, 0xbf, 0x3a, 0xf8, 0xf3, 0x31, 0xb4, 0x76, 0xa2, 0x60, 0xe5, 0x27, 0x2c, 0xee, 0x6b, 0xa9,
-    0xfa, 0x38, 0xbd, 0x7f, 0x74, 0xb6, 0x33, 0xf1, 0x25, 0xe7, 0x62, 0xa0, 0xab, 0x69, 0xec, 0x2e,
-    0x87, 0x45, 0xc0, 0x02, 0x09, 0xcb, 0x4e, 0x8c, 0x58, 0x9a, 0x1f, 0xdd, 0xd6, 0x14, 0x91, 0x53,
-    0x37, 0xf5, 0x70, 0xb2, 0xb9, 0x7b, 0xfe, 0x3c, 0xe8, 0x2a, 0xaf, 0x6d, 0x66, 0xa4, 0x21, 0xe3,
-    0x4a, 0x88, 0x0d, 0xcf, 0xc4, 0x06, 0x83, 0x41, 0x95, 0x57, 0xd2, 0x10, 0x1b, 0xd9, 0x5c, 0x9e,
-    0xcd, 0x0f, 0x8a, 0x48, 0x43, 0x81, 0x04, 0xc6, 0x12, 0xd0, 0x55, 0x97, 0x9c, 0x5e, 0xdb, 0x19,
-    0xb0, 0x72, 0xf7, 0x35, 0x3e, 0xfc, 0x79, 0xbb, 0x6f, 0xad, 0x28, 0xea, 0xe1, 0x23, 0xa6, 0x64,
-    0x6e, 0xac, 0x29, 0xeb, 0xe0, 0x22, 0xa7, 0x65, 0xb1, 0x73, 0xf6, 0x34, 0x3f, 0xfd, 0x78, 0xba,
-    0x13, 0xd1, 0x54, 0x96, 0x9d, 0x5f, 0xda, 0x18, 0xcc, 0x0e, 0x8b, 0x49, 0x42, 0x80, 0x05, 0xc7,
-    0x94, 0x56, 0xd3, 0x11, 0x1a, 0xd8, 0x5d, 0x9f, 0x4b, 0x89, 0x0c, 0xce, 0xc5, 0x07, 0x82, 0x40,
-    0xe9, 0x2b, 0xae, 0x6c, 0x67, 0xa5, 0x20, 0xe2, 0x36, 0xf4, 0x71, 0xb3, 0xb8, 0x7a, 0xff, 0x3d,
-    0x59, 0x9b, 0x1e, 0xdc, 0xd7, 0x15, 0x90, 0x52, 0x86, 0x44, 0xc1, 0x03, 0x08, 0xca, 0x4f, 0x8d,
-    0x24, 0xe6, 0x63, 0xa1, 0xaa, 0x68, 0xed, 0x2f, 0xfb, 0x39, 0xbc, 0x7e, 0x75, 0xb7, 0x32, 0xf0,
-    0xa3, 0x61, 0xe4, 0x26, 0x2d, 0xef, 0x6a, 0xa8, 0x7c, 0xbe, 0x3b, 0xf9, 0xf2, 0x30, 0xb5, 0x77,
-    0xde, 0x1c, 0x99, 0x5b, 0x50, 0x92, 0x17, 0xd5, 0x01, 0xc3, 0x46, 0x84, 0x8f, 0x4d, 0xc8, 0x0a,
-), (
-    0x00, 0xc0, 0x43, 0x83, 0x86, 0x46, 0xc5, 0x05, 0xcf, 0x0f, 0x8c, 0x4c, 0x49, 0x89, 0x0a, 0xca,
-    0x5d, 0x9d, 0x1e, 0xde, 0xdb, 0x1b, 0x98, 0x58, 0x92, 0x52, 0xd1, 0x11, 0x14, 0xd4, 0x57, 0x97,
-    0xba, 0x7a, 0xf9, 0x39, 0x3c, 0xfc, 0x7f, 0xbf, 0x75, 0xb5, 0x36, 0xf6, 0xf3, 0x33, 0xb0, 0x70,
-    0xe7, 0x27, 0xa4, 0x64, 0x61, 0xa1, 0x22, 0xe2, 0x28, 0xe8, 0x6b, 0xab, 0xae, 0x6e, 0xed, 0x2d,
-    0xb7, 0x77, 0xf4, 0x34, 0x31, 0xf1, 0x72, 0xb2, 0x78, 0xb8, 0x3b, 0xfb, 0xfe, 0x3e, 0xbd, 0x7d,
-    0xea, 0x2a, 0xa9, 0x69, 0x6c, 0xac, 0x2f, 0xef, 0x25, 0xe5, 0x66, 0xa6, 0xa3, 0x63, 0xe0, 0x20,
-    0x0d, 0xcd, 0x4e, 0x8e, 0x8b, 0x4b, 0xc8, 0x08, 0xc2, 0x02, 0x81, 0x41, 0x44, 0x84, 0x07, 0xc7,
-    0x50, 0x90, 0x13, 0xd3, 0xd6, 0x16, 0x95, 0x55, 0x9f, 0x5f, 0xdc, 0x1c, 0x19, 0xd9, 0x5a, 0x9a,
-    0xad, 0x6d, 0xee, 0x2e, 0x2b, 0xeb, 0x68, 0xa8, 0x62, 0xa2, 0x21, 0xe1, 0xe4, 0x24, 0xa7, 0x67,
-    0xf0, 0x30, 0xb3, 0x73, 0x76, 0xb6, 0x35, 0xf5, 0x3f, 0xff, 0x7c, 0xbc, 0xb9, 0x79, 0xfa, 0x3a,
-    0x17, 0xd7, 0x54, 0x94, 0x91, 0x51, 0xd2, 0x12, 0xd8, 0x18, 0x9b, 0x5b, 0x5e, 0x9e, 0x1d, 0xdd,
-    0x4a, 0x8a, 0x09, 0xc9, 0xcc, 0x0c, 0x8f, 0x4f, 0x85, 0x45, 0xc6, 0x06, 0x03, 0xc3, 0x40, 0x80,
-    0x1a, 0xda, 0x59, 0x99, 0x9c, 0x5c, 0xdf, 0x1f, 0xd5, 0x15, 0x96, 0x56, 0x53, 0x93, 0x10, 0xd0,
-    0x47, 0x87, 0x04, 0xc4, 0xc1, 0x01, 0x82, 0x42, 0x88, 0x48, 0xcb, 0x0b, 0x0e, 0xce, 0x4d, 0x8d,
-    0xa0, 0x60, 0xe3, 0x23, 0x26, 0xe6, 0x65, 0xa5, 0x6f, 0xaf, 0x2c, 0xec, 0xe9, 0x29, 0xaa, 0x6a,
-    0xfd, 0x3d, 0xbe, 0x7e, 0x7b, 0xbb, 0x38, 0xf8, 0x32, 0xf2, 0x71, 0xb1, 0xb4, 0x74, 0xf7, 0x37,
-), (
-    0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-    0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-    0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-    0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-    0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-    0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-    0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-    0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-    0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-    0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-    0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-    0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-    0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-    0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-    0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-    0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-), (
-    0x00, 0xfb, 0x35, 0xce, 0x6a, 0x91, 0x5f, 0xa4, 0xd4, 0x2f, 0xe1, 0x1a, 0xbe, 0x45, 0x8b, 0x70,
-    0x6b, 0x90, 0x5e, 0xa5, 0x01, 0xfa, 0x34, 0xcf, 0xbf, 0x44, 0x8a, 0x71, 0xd5, 0x2e, 0xe0, 0x1b,
-    0xd6, 0x2d, 0xe3, 0x18, 0xbc, 0x47, 0x89, 0x72, 0x02, 0xf9, 0x37, 0xcc, 0x68, 0x93, 0x5d, 0xa6,
-    0xbd, 0x46, 0x88, 0x73, 0xd7, 0x2c, 0xe2, 0x19, 0x69, 0x92, 0x5c, 0xa7, 0x03, 0xf8, 0x36, 0xcd,
-    0x6f, 0x94, 0x5a, 0xa1, 0x05, 0xfe, 0x30, 0xcb, 0xbb, 0x40, 0x8e, 0x75, 0xd1, 0x2a, 0xe4, 0x1f,
-    0x04, 0xff, 0x31, 0xca, 0x6e, 0x95, 0x5b, 0xa0, 0xd0, 0x2b, 0xe5, 0x1e, 0xba, 0x41, 0x8f, 0x74,
-    0xb9, 0x42, 0x8c, 0x77, 0xd3, 0x28, 0xe6, 0x1d, 0x6d, 0x96, 0x58, 0xa3, 0x07, 0xfc, 0x32, 0xc9,
-    0xd2, 0x29, 0xe7, 0x1c, 0xb8, 0x43, 0x8d, 0x76, 0x06, 0xfd, 0x33, 0xc8, 0x6c, 0x97, 0x59, 0xa2,
-    0xde, 0x25, 0xeb, 0x10, 0xb4, 0x4f, 0x81, 0x7a, 0x0a, 0xf1, 0x3f, 0xc4, 0x60, 0x9b, 0x55, 0xae,
-    0xb5, 0x4e, 0x80, 0x7b, 0xdf, 0x24, 0xea, 0x11, 0x61, 0x9a, 0x54, 0xaf, 0x0b, 0xf0, 0x3e, 0xc5,
-    0x08, 0xf3, 0x3d, 0xc6, 0x62, 0x99, 0x57, 0xac, 0xdc, 0x27, 0xe9, 0x12, 0xb6, 0x4d, 0x83, 0x78,
-    0x63, 0x98, 0x56, 0xad, 0x09, 0xf2, 0x3c, 0xc7, 0xb7, 0x4c, 0x82, 0x79, 0xdd, 0x26, 0xe8, 0x13,
-    0xb1, 0x4a, 0x84, 0x7f, 0xdb, 0x20, 0xee, 0x15, 0x65, 0x9e, 0x50, 0xab, 0x0f, 0xf4, 0x3a, 0xc1,
-    0xda, 0x21, 0xef, 0x14, 0xb0, 0x4b, 0x85, 0x7e, 0x0e, 0xf5, 0x3b, 0xc0, 0x64, 0x9f, 0x51, 0xaa,
-    0x67, 0x9c, 0x52, 0xa9, 0x0d, 0xf6, 0x38, 0xc3, 0xb3, 0x48, 0x86, 0x7d, 0xd9, 0x22, 0xec, 0x17,
-    0x0c, 0xf7, 0x39, 0xc2, 0x66, 0x9d, 0x53, 0xa8, 0xd8, 0x23, 0xed, 0x16, 0xb2, 0x49, 0x87, 0x7c,
-), (
-    0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x0e, 0x0f,
-    0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a, 0x1b, 0x1c, 0x1d, 0x1e, 0x1f,
-    0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f,
-    0x30, 0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-    0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x4d, 0x4e, 0x4f,
-    0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, 0x5d, 0x5e, 0x5f,
-    0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f,
-    0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f,
-    0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f,
-    0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f,
-    0xa0, 0xa1, 0xa2, 0xa3, 0xa4, 0xa5, 0xa6, 0xa7, 0xa8, 0xa9, 0xaa, 0xab, 0xac, 0xad, 0xae, 0xaf,
-    0xb0, 0xb1, 0xb2, 0xb3, 0xb4, 0xb5, 0xb6, 0xb7, 0xb8, 0xb9, 0xba, 0xbb, 0xbc, 0xbd, 0xbe, 0xbf,
-    0xc0, 0xc1, 0xc2, 0xc3, 0xc4, 0xc5, 0xc6, 0xc7, 0xc8, 0xc9, 0xca, 0xcb, 0xcc, 0xcd, 0xce, 0xcf,
-    0xd0, 0xd1, 0xd2, 0xd3, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8, 0xd9, 0xda, 0xdb, 0xdc, 0xdd, 0xde, 0xdf,
-    0xe0, 0xe1, 0xe2, 0xe3, 0xe4, 0xe5, 0xe6, 0xe7, 0xe8, 0xe9, 0xea, 0xeb, 0xec, 0xed, 0xee, 0xef,
-    0xf0, 0xf1, 0xf2, 0xf3, 0xf4, 0xf5, 0xf6, 0xf7, 0xf8, 0xf9, 0xfa, 0xfb, 0xfc, 0xfd, 0xfe, 0xff,
-), (
-    0x00, 0xc0, 0x43, 0x83, 0x86, 0x46, 0xc5, 0x05, 0xcf, 0x0f, 0x8c, 0x4c, 0x49, 0x89, 0x0a, 0xca,
-    0x5d, 0x9d, 0x1e, 0xde, 0xdb, 0x1b, 0x98, 0x58, 0x92, 0x52, 0xd1, 0x11, 0x14, 0xd4, 0x57, 0x97,
-    0xba, 0x7a, 0xf9, 0x39, 0x3c, 0xfc, 0x7f, 0xbf, 0x75, 0xb5, 0x36, 0xf6, 0xf3, 0x33, 0xb0, 0x70,
-    0xe7, 0x27, 0xa4, 0x64, 0x61, 0xa1, 0x22, 0xe2, 0x28, 0xe8, 0x6b, 0xab, 0xae, 0x6e, 0xed, 0x2d,
-    0xb7, 0x77, 0xf4, 0x34, 0x31, 0xf1, 0x72, 0xb2, 0x78, 0xb8, 0x3b, 0xfb, 0xfe, 0x3e, 0xbd, 0x7d,
-    0xea, 0x2a, 0xa9, 0x69, 0x6c, 0xac, 0x2f, 0xef, 0x25, 0xe5, 0x66, 0xa6, 0xa3, 0x63, 0xe0, 0x20,
-    0x0d, 0xcd, 0x4e, 0x8e, 0x8b, 0x4b, 0xc8, 0x08, 0xc2, 0x02, 0x81, 0x41, 0x44, 0x84, 0x07, 0xc7,
-    0x50, 0x90, 0x13, 0xd3, 0xd6, 0x16, 0x95, 0x55, 0x9f, 0x5f, 0xdc, 0x1c, 0x19, 0xd9, 0x5a, 0x9a,
-    0xad, 0x6d, 0xee, 0x2e, 0x2b, 0xeb, 0x68, 0xa8, 0x62, 0xa2, 0x21, 0xe1, 0xe4, 0x24, 0xa7, 0x67,
-    0xf0, 0x30, 0xb3, 0x73, 0x76, 0xb6, 0x35, 0xf5, 0x3f, 0xff, 0x7c, 0xbc, 0xb9, 0x79, 0xfa, 0x3a,
-    0x17, 0xd7, 0x54, 0x94, 0x91, 0x51, 0xd2, 0x12, 0xd8, 0x18, 0x9b, 0x5b, 0x5e, 0x9e, 0x1d, 0xdd,
-    0x4a, 0x8a, 0x09, 0xc9, 0xcc, 0x0c, 0x8f, 0x4f, 0x85, 0x45, 0xc6, 0x06, 0x03, 0xc3, 0x40, 0x80,
-    0x1a, 0xda, 0x59, 0x99, 0x9c, 0x5c, 0xdf, 0x1f, 0xd5, 0x15, 0x96, 0x56, 0x53, 0x93, 0x10, 0xd0,
-    0x47, 0x87, 0x04, 0xc4, 0xc1, 0x01, 0x82, 0x42, 0x88, 0x48, 0xcb, 0x0b, 0x0e, 0xce, 0x4d, 0x8d,
-    0xa0, 0x60, 0xe3, 0x23, 0x26, 0xe6, 0x65, 0xa5, 0x6f, 0xaf, 0x2c, 0xec, 0xe9, 0x29, 0xaa, 0x6a,
-    0xfd, 0x3d, 0xbe, 0x7e, 0x7b, 0xbb, 0x38, 0xf8, 0x32, 0xf2, 0x71, 0xb1, 0xb4, 0x74, 0xf7, 0x37,
-), (
-    0x00, 0xc2, 0x47, 0x85, 0x8e, 0x4c, 0xc9, 0x0b, 0xdf, 0x1d, 0x98, 0x5a, 0x51, 0x93, 0x16, 0xd4,
-    0x7d, 0xbf, 0x3a, 0xf8, 0xf3, 0x31, 0xb4, 0x76, 0xa2, 0x60, 0xe5, 0x27, 0x2c, 0xee, 0x6b, 0xa9,
-    0xfa, 0x38, 0xbd, 0x7f, 0x74, 0xb6, 0x33, 0xf1, 0x25, 0xe7, 0x62, 0xa0, 0xab, 0x69, 0xec, 0x2e,
-    0x87, 0x45, 0xc0, 0x02, 0x09, 0xcb, 0x4e, 0x8c, 0x58, 0x9a, 0x1f, 0xdd, 0xd6, 0x14, 0x91, 0x53,
-    0x37, 0xf5, 0x70, 0xb2, 0xb9, 0x7b, 0xfe, 0x3c, 0xe8, 0x2a, 0xaf, 0x6d, 0x66, 0xa4, 0x21, 0xe3,
-    0x4a, 0x88, 0x0d, 0xcf, 0xc4, 0x06, 0x83, 0x41, 0x95, 0x57, 0xd2, 0x10, 0x1b, 0xd9, 0x5c, 0x9e,
-    0xcd, 0x0f, 0x8a, 0x48, 0x43, 0x81, 0x04, 0xc6, 0x12, 0xd0, 0x55, 0x97, 0x9c, 0x5e, 0xdb, 0x19,
-    0xb0, 0x72, 0xf7, 0x35, 0x3e, 0xfc, 0x79, 0xbb, 0x6f, 0xad, 0x28, 0xea, 0xe1, 0x23, 0xa6, 0x64,
-    0x6e, 0xac, 0x29, 0xeb, 0xe0, 0x22, 0xa7, 0x65, 0xb1, 0x73, 0xf6, 0x34, 0x3f, 0xfd, 0x78, 0xba,
-    0x13, 0xd1, 0x54, 0x96, 0x9d, 0x5f, 0xda, 0x18, 0xcc, 0x0e, 0x8b, 0x49, 0x42, 0x80, 0x05, 0xc7,
-    0x94, 0x56, 0xd3, 0x11, 0x1a, 0xd8, 0x5d, 0x9f, 0x4b, 0x89, 0x0c, 0xce, 0xc5, 0x07, 0x82, 0x40,
-    0xe9, 0x2b, 0xae, 0x6c, 0x67, 0xa5, 0x20, 0xe2, 0x36, 0xf4, 0x71, 0xb3, 0xb8, 0x7a, 0xff, 0x3d,
-    0x59, 0x9b, 0x1e, 0xdc, 0xd7, 0x15, 0x90, 0x52, 0x86, 0x44, 0xc1, 0x03, 0x08, 0xca, 0x4f, 0x8d,
-    0x24, 0xe6, 0x63, 0xa1, 0xaa, 0x68, 0xed, 0x2f, 0xfb, 0x39, 0xbc, 0x7e, 0x75, 0xb7, 0x32, 0xf0,
-    0xa3, 0x61, 0xe4, 0x26, 0x2d, 0xef, 0x6a, 0xa8, 0x7c, 0xbe, 0x3b, 0xf9, 0xf2, 0x30, 0xb5, 0x77,
-    0xde, 0x1c, 0x99, 0x5b, 0x50, 0x92, 0x17, 0xd5, 0x01, 0xc3, 0x46, 0x84, 0x8f, 0x4d, 0xc8, 0x0a,
-), (
-    0x00, 0x10, 0x20, 0x30, 0x40, 0x50, 0x60, 0x70, 0x80, 0x90, 0xa0, 0xb0, 0xc0, 0xd0, 0xe0, 0xf0,
-    0xc3, 0xd3, 0xe3, 0xf3, 0x83, 0x93, 0xa3, 0xb3, 0x43, 0x53, 0x63, 0x73, 0x03, 0x13, 0x23, 0x33,
-    0x45, 0x55, 0x65, 0x75, 0x05, 0x15, 0x25, 0x35, 0xc5, 0xd5, 0xe5, 0xf5, 0x85, 0x95, 0xa5, 0xb5,
-    0x86, 0x96, 0xa6, 0xb6, 0xc6, 0xd6, 0xe6, 0xf6, 0x06, 0x16, 0x26, 0x36, 0x46, 0x56, 0x66, 0x76,
-    0x8a, 0x9a, 0xaa, 0xba, 0xca, 0xda, 0xea, 0xfa, 0x0a, 0x1a, 0x2a, 0x3a, 0x4a, 0x5a, 0x6a, 0x7a,
-    0x49, 0x59, 0x69, 0x79, 0x09, 0x19, 0x29, 0x39, 0xc9, 0xd9, 0xe9, 0xf9, 0x89, 0x99, 0xa9, 0xb9,
-    0xcf, 0xdf, 0xef, 0xff, 0x8f, 0x9f, 0xaf, 0xbf, 0x4f, 0x5f, 0x6f, 0x7f, 0x0f, 0x1f, 0x2f, 0x3f,
-    0x0c, 0x1c, 0x2c, 0x3c, 0x4c, 0x5c, 0x6c, 0x7c, 0x8c, 0x9c, 0xac, 0xbc, 0xcc, 0xdc, 0xec, 0xfc,
-    0xd7, 0xc7, 0xf7, 0xe7, 0x97, 0x87, 0xb7, 0xa7, 0x57, 0x47, 0x77, 0x67, 0x17, 0x07, 0x37, 0x27,
-    0x14, 0x04, 0x34, 0x24, 0x54, 0x44, 0x74, 0x64, 0x94, 0x84, 0xb4, 0xa4, 0xd4, 0xc4, 0xf4, 0xe4,
-    0x92, 0x82, 0xb2, 0xa2, 0xd2, 0xc2, 0xf2, 0xe2, 0x12, 0x02, 0x32, 0x22, 0x52, 0x42, 0x72, 0x62,
-    0x51, 0x41, 0x71, 0x61, 0x11, 0x01, 0x31, 0x21, 0xd1, 0xc1, 0xf1, 0xe1, 0x91, 0x81, 0xb1, 0xa1,
-    0x5d, 0x4d, 0x7d, 0x6d, 0x1d, 0x0d, 0x3d, 0x2d, 0xdd, 0xcd, 0xfd, 0xed, 0x9d, 0x8d, 0xbd, 0xad,
-    0x9e, 0x8e, 0xbe, 0xae, 0xde, 0xce, 0xfe, 0xee, 0x1e, 0x0e, 0x3e, 0x2e, 0x5e, 0x4e, 0x7e, 0x6e,
-    0x18, 0x08, 0x38, 0x28, 0x58, 0x48, 0x78, 0x68, 0x98, 0x88, 0xb8, 0xa8, 0xd8, 0xc8, 0xf8, 0xe8,
-    0xdb, 0xcb, 0xfb, 0xeb, 0x9b, 0x8b, 0xbb, 0xab, 0x5b, 0x4b, 0x7b, 0x6b, 0x1b, 0x0b, 0x3b, 0x2b,
-), (
-    0x00, 0x85, 0xc9, 0x4c, 0x51, 0xd4, 0x98, 0x1d, 0xa2, 0x27, 0x6b, 0xee, 0xf3, 0x76, 0x3a, 0xbf,
-    0x87, 0x02, 0x4e, 0xcb, 0xd6, 0x53, 0x1f, 0x9a, 0x25, 0xa0, 0xec, 0x69, 0x74, 0xf1, 0xbd, 0x38,
-    0xcd, 0x48, 0x04, 0x81, 0x9c, 0x19, 0x55, 0xd0, 0x6f, 0xea, 0xa6, 0x23, 0x3e, 0xbb, 0xf7, 0x72,
-    0x4a, 0xcf, 0x83, 0x06, 0x1b, 0x9e, 0xd2, 0x57, 0xe8, 0x6d, 0x21, 0xa4, 0xb9, 0x3c, 0x70, 0xf5,
-    0x59, 0xdc, 0x90, 0x15, 0x08, 0x8d, 0xc1, 0x44, 0xfb, 0x7e, 0x32, 0xb7, 0xaa, 0x2f, 0x63, 0xe6,
-    0xde, 0x5b, 0x17, 0x92, 0x8f, 0x0a, 0x46, 0xc3, 0x7c, 0xf9, 0xb5, 0x30, 0x2d, 0xa8, 0xe4, 0x61,
-    0x94, 0x11, 0x5d, 0xd8, 0xc5, 0x40, 0x0c, 0x89, 0x36, 0xb3, 0xff, 0x7a, 0x67, 0xe2, 0xae, 0x2b,
-    0x13, 0x96, 0xda, 0x5f, 0x42, 0xc7, 0x8b, 0x0e, 0xb1, 0x34, 0x78, 0xfd, 0xe0, 0x65, 0x29, 0xac,
-    0xb2, 0x37, 0x7b, 0xfe, 0xe3, 0x66, 0x2a, 0xaf, 0x10, 0x95, 0xd9, 0x5c, 0x41, 0xc4, 0x88, 0x0d,
-    0x35, 0xb0, 0xfc, 0x79, 0x64, 0xe1, 0xad, 0x28, 0x97, 0x12, 0x5e, 0xdb, 0xc6, 0x43, 0x0f, 0x8a,
-    0x7f, 0xfa, 0xb6, 0x33, 0x2e, 0xab, 0xe7, 0x62, 0xdd, 0x58, 0x14, 0x91, 0x8c, 0x09, 0x45, 0xc0,
-    0xf8, 0x7d, 0x31, 0xb4, 0xa9, 0x2c, 0x60, 0xe5, 0x5a, 0xdf, 0x93, 0x16, 0x0b, 0x8e, 0xc2, 0x47,
-    0xeb, 0x6e, 0x22, 0xa7, 0xba, 0x3f, 0x73, 0xf6, 0x49, 0xcc, 0x80, 0x05, 0x18, 0x9d, 0xd1, 0x54,
-    0x6c, 0xe9, 0xa5, 0x20, 0x3d, 0xb8, 0xf4, 0x71, 0xce, 0x4b, 0x07, 0x82, 0x9f, 0x1a, 0x56, 0xd3,
-    0x26, 0xa3, 0xef, 0x6a, 0x77, 0xf2, 0xbe, 0x3b, 0x84, 0x01, 0x4d, 0xc8, 0xd5, 0x50, 0x1c, 0x99,
-    0xa1, 0x24, 0x68, 0xed, 0xf0, 0x75, 0x39, 0xbc, 0x03, 0x86, 0xca, 0x4f, 0x52, 0xd7, 0x9b, 0x1e,
-), (
-    0x00, 0x20, 0x40, 0x60, 0x80, 0xa0, 0xc0, 0xe0, 0xc3, 0xe3, 0x83, 0xa3, 0x43, 0x63, 0x03, 0x23,
-    0x45, 0x65, 0x05, 0x25, 0xc5, 0xe5, 0x85, 0xa5, 0x86, 0xa6, 0xc6, 0xe6, 0x06, 0x26, 0x46, 0x66,
-    0x8a, 0xaa, 0xca, 0xea, 0x0a, 0x2a, 0x4a, 0x6a, 0x49, 0x69, 0x09, 0x29, 0xc9, 0xe9, 0x89, 0xa9,
-    0xcf, 0xef, 0x8f, 0xaf, 0x4f, 0x6f, 0x0f, 0x2f, 0x0c, 0x2c, 0x4c, 0x6c, 0x8c, 0xac, 0xcc, 0xec,
-    0xd7, 0xf7, 0x97, 0xb7, 0x57, 0x77, 0x17, 0x37, 0x14, 0x34, 0x54, 0x74, 0x94, 0xb4, 0xd4, 0xf4,
-    0x92, 0xb2, 0xd2, 0xf2, 0x12, 0x32, 0x52, 0x72, 0x51, 0x71, 0x11, 0x31, 0xd1, 0xf1, 0x91, 0xb1,
-    0x5d, 0x7d, 0x1d, 0x3d, 0xdd, 0xfd, 0x9d, 0xbd, 0x9e, 0xbe, 0xde, 0xfe, 0x1e, 0x3e, 0x5e, 0x7e,
-    0x18, 0x38, 0x58, 0x78, 0x98, 0xb8, 0xd8, 0xf8, 0xdb, 0xfb, 0x9b, 0xbb, 0x5b, 0x7b, 0x1b, 0x3b,
-    0x6d, 0x4d, 0x2d, 0x0d, 0xed, 0xcd, 0xad, 0x8d, 0xae, 0x8e, 0xee, 0xce, 0x2e, 0x0e, 0x6e, 0x4e,
-    0x28, 0x08, 0x68, 0x48, 0xa8, 0x88, 0xe8, 0xc8, 0xeb, 0xcb, 0xab, 0x8b, 0x6b, 0x4b, 0x2b, 0x0b,
-    0xe7, 0xc7, 0xa7, 0x87, 0x67, 0x47, 0x27, 0x07, 0x24, 0x04, 0x64, 0x44, 0xa4, 0x84, 0xe4, 0xc4,
-    0xa2, 0x82, 0xe2, 0xc2, 0x22, 0x02, 0x62, 0x42, 0x61, 0x41, 0x21, 0x01, 0xe1, 0xc1, 0xa1, 0x81,
-    0xba, 0x9a, 0xfa, 0xda, 0x3a, 0x1a, 0x7a, 0x5a, 0x79, 0x59, 0x39, 0x19, 0xf9, 0xd9, 0xb9, 0x99,
-    0xff, 0xdf, 0xbf, 0x9f, 0x7f, 0x5f, 0x3f, 0x1f, 0x3c, 0x1c, 0x7c, 0x5c, 0xbc, 0x9c, 0xfc, 0xdc,
-    0x30, 0x10, 0x70, 0x50, 0xb0, 0x90, 0xf0, 0xd0, 0xf3, 0xd3, 0xb3, 0x93, 0x73, 0x53, 0x33, 0x13,
-    0x75, 0x55, 0x35, 0x15, 0xf5, 0xd5, 0xb5, 0x95, 0xb6, 0x96, 0xf6, 0xd6, 0x36, 0x16, 0x76, 0x56,
-), (
-    0x00, 0x94, 0xeb, 0x7f, 0x15, 0x81, 0xfe, 0x6a, 0x2a, 0xbe, 0xc1, 0x55, 0x3f, 0xab, 0xd4, 0x40,
-    0x54, 0xc0, 0xbf, 0x2b, 0x41, 0xd5, 0xaa, 0x3e, 0x7e, 0xea, 0x95, 0x01, 0x6b, 0xff, 0x80, 0x14,
-    0xa8, 0x3c, 0x43, 0xd7, 0xbd, 0x29, 0x56, 0xc2, 0x82, 0x16, 0x69, 0xfd, 0x97, 0x03, 0x7c, 0xe8,
-    0xfc, 0x68, 0x17, 0x83, 0xe9, 0x7d, 0x02, 0x96, 0xd6, 0x42, 0x3d, 0xa9, 0xc3, 0x57, 0x28, 0xbc,
-    0x93, 0x07, 0x78, 0xec, 0x86, 0x12, 0x6d, 0xf9, 0xb9, 0x2d, 0x52, 0xc6, 0xac, 0x38, 0x47, 0xd3,
-    0xc7, 0x53, 0x2c, 0xb8, 0xd2, 0x46, 0x39, 0xad, 0xed, 0x79, 0x06, 0x92, 0xf8, 0x6c, 0x13, 0x87,
-    0x3b, 0xaf, 0xd0, 0x44, 0x2e, 0xba, 0xc5, 0x51, 0x11, 0x85, 0xfa, 0x6e, 0x04, 0x90, 0xef, 0x7b,
-    0x6f, 0xfb, 0x84, 0x10, 0x7a, 0xee, 0x91, 0x05, 0x45, 0xd1, 0xae, 0x3a, 0x50, 0xc4, 0xbb, 0x2f,
-    0xe5, 0x71, 0x0e, 0x9a, 0xf0, 0x64, 0x1b, 0x8f, 0xcf, 0x5b, 0x24, 0xb0, 0xda, 0x4e, 0x31, 0xa5,
-    0xb1, 0x25, 0x5a, 0xce, 0xa4, 0x30, 0x4f, 0xdb, 0x9b, 0x0f, 0x70, 0xe4, 0x8e, 0x1a, 0x65, 0xf1,
-    0x4d, 0xd9, 0xa6, 0x32, 0x58, 0xcc, 0xb3, 0x27, 0x67, 0xf3, 0x8c, 0x18, 0x72, 0xe6, 0x99, 0x0d,
-    0x19, 0x8d, 0xf2, 0x66, 0x0c, 0x98, 0xe7, 0x73, 0x33, 0xa7, 0xd8, 0x4c, 0x26, 0xb2, 0xcd, 0x59,
-    0x76, 0xe2, 0x9d, 0x09, 0x63, 0xf7, 0x88, 0x1c, 0x5c, 0xc8, 0xb7, 0x23, 0x49, 0xdd, 0xa2, 0x36,
-    0x22, 0xb6, 0xc9, 0x5d, 0x37, 0xa3, 0xdc, 0x48, 0x08, 0x9c, 0xe3, 0x77, 0x1d, 0x89, 0xf6, 0x62,
-    0xde, 0x4a, 0x35, 0xa1, 0xcb, 0x5f, 0x20, 0xb4, 0xf4, 0x60, 0x1f, 0x8b, 0xe1, 0x75, 0x0a, 0x9e,
-    0x8a, 0x1e, 0x61, 0xf5, 0x9f, 0x0b, 0x74, 0xe0, 0xa0, 0x34, 0x4b, 0xdf, 0xb5, 0x21, 0x5e, 0xca,
-))
+_GF_DATA: bytes = bytes.fromhex(
+    '00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f'
+    '10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f'
+    '20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f'
+    '30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f'
+    '40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f'
+    '50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f'
+    '60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f'
+    '70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f'
+    '80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f'
+    '90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f'
+    'a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af'
+    'b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf'
+    'c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf'
+    'd0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df'
+    'e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef'
+    'f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff'
+    '00 94 eb 7f 15 81 fe 6a 2a be c1 55 3f ab d4 40'
+    '54 c0 bf 2b 41 d5 aa 3e 7e ea 95 01 6b ff 80 14'
+    'a8 3c 43 d7 bd 29 56 c2 82 16 69 fd 97 03 7c e8'
+    'fc 68 17 83 e9 7d 02 96 d6 42 3d a9 c3 57 28 bc'
+    '93 07 78 ec 86 12 6d f9 b9 2d 52 c6 ac 38 47 d3'
+    'c7 53 2c b8 d2 46 39 ad ed 79 06 92 f8 6c 13 87'
+    '3b af d0 44 2e ba c5 51 11 85 fa 6e 04 90 ef 7b'
+    '6f fb 84 10 7a ee 91 05 45 d1 ae 3a 50 c4 bb 2f'
+    'e5 71 0e 9a f0 64 1b 8f cf 5b 24 b0 da 4e 31 a5'
+    'b1 25 5a ce a4 30 4f db 9b 0f 70 e4 8e 1a 65 f1'
+    '4d d9 a6 32 58 cc b3 27 67 f3 8c 18 72 e6 99 0d'
+    '19 8d f2 66 0c 98 e7 73 33 a7 d8 4c 26 b2 cd 59'
+    '76 e2 9d 09 63 f7 88 1c 5c c8 b7 23 49 dd a2 36'
+    '22 b6 c9 5d 37 a3 dc 48 08 9c e3 77 1d 89 f6 62'
+    'de 4a 35 a1 cb 5f 20 b4 f4 60 1f 8b e1 75 0a 9e'
+    '8a 1e 61 f5 9f 0b 74 e0 a0 34 4b df b5 21 5e ca'
+    '00 20 40 60 80 a0 c0 e0 c3 e3 83 a3 43 63 03 23'
+    '45 65 05 25 c5 e5 85 a5 86 a6 c6 e6 06 26 46 66'
+    '8a aa ca ea 0a 2a 4a 6a 49 69 09 29 c9 e9 89 a9'
+    'cf ef 8f af 4f 6f 0f 2f 0c 2c 4c 6c 8c ac cc ec'
+    'd7 f7 97 b7 57 77 17 37 14 34 54 74 94 b4 d4 f4'
+    '92 b2 d2 f2 12 32 52 72 51 71 11 31 d1 f1 91 b1'
+    '5d 7d 1d 3d dd fd 9d bd 9e be de fe 1e 3e 5e 7e'
+    '18 38 58 78 98 b8 d8 f8 db fb 9b bb 5b 7b 1b 3b'
+    '6d 4d 2d 0d ed cd ad 8d ae 8e ee ce 2e 0e 6e 4e'
+    '28 08 68 48 a8 88 e8 c8 eb cb ab 8b 6b 4b 2b 0b'
+    'e7 c7 a7 87 67 47 27 07 24 04 64 44 a4 84 e4 c4'
+    'a2 82 e2 c2 22 02 62 42 61 41 21 01 e1 c1 a1 81'
+    'ba 9a fa da 3a 1a 7a 5a 79 59 39 19 f9 d9 b9 99'
+    'ff df bf 9f 7f 5f 3f 1f 3c 1c 7c 5c bc 9c fc dc'
+    '30 10 70 50 b0 90 f0 d0 f3 d3 b3 93 73 53 33 13'
+    '75 55 35 15 f5 d5 b5 95 b6 96 f6 d6 36 16 76 56'
+    '00 85 c9 4c 51 d4 98 1d a2 27 6b ee f3 76 3a bf'
+    '87 02 4e cb d6 53 1f 9a 25 a0 ec 69 74 f1 bd 38'
+    'cd 48 04 81 9c 19 55 d0 6f ea a6 23 3e bb f7 72'
+    '4a cf 83 06 1b 9e d2 57 e8 6d 21 a4 b9 3c 70 f5'
+    '59 dc 90 15 08 8d c1 44 fb 7e 32 b7 aa 2f 63 e6'
+    'de 5b 17 92 8f 0a 46 c3 7c f9 b5 30 2d a8 e4 61'
+    '94 11 5d d8 c5 40 0c 89 36 b3 ff 7a 67 e2 ae 2b'
+    '13 96 da 5f 42 c7 8b 0e b1 34 78 fd e0 65 29 ac'
+    'b2 37 7b fe e3 66 2a af 10 95 d9 5c 41 c4 88 0d'
+    '35 b0 fc 79 64 e1 ad 28 97 12 5e db c6 43 0f 8a'
+    '7f fa b6 33 2e ab e7 62 dd 58 14 91 8c 09 45 c0'
+    'f8 7d 31 b4 a9 2c 60 e5 5a df 93 16 0b 8e c2 47'
+    'eb 6e 22 a7 ba 3f 73 f6 49 cc 80 05 18 9d d1 54'
+    '6c e9 a5 20 3d b8 f4 71 ce 4b 07 82 9f 1a 56 d3'
+    '26 a3 ef 6a 77 f2 be 3b 84 01 4d c8 d5 50 1c 99'
+    'a1 24 68 ed f0 75 39 bc 03 86 ca 4f 52 d7 9b 1e'
+    '00 10 20 30 40 50 60 70 80 90 a0 b0 c0 d0 e0 f0'
+    'c3 d3 e3 f3 83 93 a3 b3 43 53 63 73 03 13 23 33'
+    '45 55 65 75 05 15 25 35 c5 d5 e5 f5 85 95 a5 b5'
+    '86 96 a6 b6 c6 d6 e6 f6 06 16 26 36 46 56 66 76'
+    '8a 9a aa ba ca da ea fa 0a 1a 2a 3a 4a 5a 6a 7a'
+    '49 59 69 79 09 19 29 39 c9 d9 e9 f9 89 99 a9 b9'
+    'cf df ef ff 8f 9f af bf 4f 5f 6f 7f 0f 1f 2f 3f'
+    '0c 1c 2c 3c 4c 5c 6c 7c 8c 9c ac bc cc dc ec fc'
+    'd7 c7 f7 e7 97 87 b7 a7 57 47 77 67 17 07 37 27'
+    '14 04 34 24 54 44 74 64 94 84 b4 a4 d4 c4 f4 e4'
+    '92 82 b2 a2 d2 c2 f2 e2 12 02 32 22 52 42 72 62'
+    '51 41 71 61 11 01 31 21 d1 c1 f1 e1 91 81 b1 a1'
+    '5d 4d 7d 6d 1d 0d 3d 2d dd cd fd ed 9d 8d bd ad'
+    '9e 8e be ae de ce fe ee 1e 0e 3e 2e 5e 4e 7e 6e'
+    '18 08 38 28 58 48 78 68 98 88 b8 a8 d8 c8 f8 e8'
+    'db cb fb eb 9b 8b bb ab 5b 4b 7b 6b 1b 0b 3b 2b'
+    '00 c2 47 85 8e 4c c9 0b df 1d 98 5a 51 93 16 d4'
+    '7d bf 3a f8 f3 31 b4 76 a2 60 e5 27 2c ee 6b a9'
+    'fa 38 bd 7f 74 b6 33 f1 25 e7 62 a0 ab 69 ec 2e'
+    '87 45 c0 02 09 cb 4e 8c 58 9a 1f dd d6 14 91 53'
+    '37 f5 70 b2 b9 7b fe 3c e8 2a af 6d 66 a4 21 e3'
+    '4a 88 0d cf c4 06 83 41 95 57 d2 10 1b d9 5c 9e'
+    'cd 0f 8a 48 43 81 04 c6 12 d0 55 97 9c 5e db 19'
+    'b0 72 f7 35 3e fc 79 bb 6f ad 28 ea e1 23 a6 64'
+    '6e ac 29 eb e0 22 a7 65 b1 73 f6 34 3f fd 78 ba'
+    '13 d1 54 96 9d 5f da 18 cc 0e 8b 49 42 80 05 c7'
+    '94 56 d3 11 1a d8 5d 9f 4b 89 0c ce c5 07 82 40'
+    'e9 2b ae 6c 67 a5 20 e2 36 f4 71 b3 b8 7a ff 3d'
+    '59 9b 1e dc d7 15 90 52 86 44 c1 03 08 ca 4f 8d'
+    '24 e6 63 a1 aa 68 ed 2f fb 39 bc 7e 75 b7 32 f0'
+    'a3 61 e4 26 2d ef 6a a8 7c be 3b f9 f2 30 b5 77'
+    'de 1c 99 5b 50 92 17 d5 01 c3 46 84 8f 4d c8 0a'
+    '00 c0 43 83 86 46 c5 05 cf 0f 8c 4c 49 89 0a ca'
+    '5d 9d 1e de db 1b 98 58 92 52 d1 11 14 d4 57 97'
+    'ba 7a f9 39 3c fc 7f bf 75 b5 36 f6 f3 33 b0 70'
+    'e7 27 a4 64 61 a1 22 e2 28 e8 6b ab ae 6e ed 2d'
+    'b7 77 f4 34 31 f1 72 b2 78 b8 3b fb fe 3e bd 7d'
+    'ea 2a a9 69 6c ac 2f ef 25 e5 66 a6 a3 63 e0 20'
+    '0d cd 4e 8e 8b 4b c8 08 c2 02 81 41 44 84 07 c7'
+    '50 90 13 d3 d6 16 95 55 9f 5f dc 1c 19 d9 5a 9a'
+    'ad 6d ee 2e 2b eb 68 a8 62 a2 21 e1 e4 24 a7 67'
+    'f0 30 b3 73 76 b6 35 f5 3f ff 7c bc b9 79 fa 3a'
+    '17 d7 54 94 91 51 d2 12 d8 18 9b 5b 5e 9e 1d dd'
+    '4a 8a 09 c9 cc 0c 8f 4f 85 45 c6 06 03 c3 40 80'
+    '1a da 59 99 9c 5c df 1f d5 15 96 56 53 93 10 d0'
+    '47 87 04 c4 c1 01 82 42 88 48 cb 0b 0e ce 4d 8d'
+    'a0 60 e3 23 26 e6 65 a5 6f af 2c ec e9 29 aa 6a'
+    'fd 3d be 7e 7b bb 38 f8 32 f2 71 b1 b4 74 f7 37'
+    '00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f'
+    '10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f'
+    '20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f'
+    '30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f'
+    '40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f'
+    '50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f'
+    '60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f'
+    '70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f'
+    '80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f'
+    '90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f'
+    'a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af'
+    'b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf'
+    'c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf'
+    'd0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df'
+    'e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef'
+    'f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff'
+    '00 fb 35 ce 6a 91 5f a4 d4 2f e1 1a be 45 8b 70'
+    '6b 90 5e a5 01 fa 34 cf bf 44 8a 71 d5 2e e0 1b'
+    'd6 2d e3 18 bc 47 89 72 02 f9 37 cc 68 93 5d a6'
+    'bd 46 88 73 d7 2c e2 19 69 92 5c a7 03 f8 36 cd'
+    '6f 94 5a a1 05 fe 30 cb bb 40 8e 75 d1 2a e4 1f'
+    '04 ff 31 ca 6e 95 5b a0 d0 2b e5 1e ba 41 8f 74'
+    'b9 42 8c 77 d3 28 e6 1d 6d 96 58 a3 07 fc 32 c9'
+    'd2 29 e7 1c b8 43 8d 76 06 fd 33 c8 6c 97 59 a2'
+    'de 25 eb 10 b4 4f 81 7a 0a f1 3f c4 60 9b 55 ae'
+    'b5 4e 80 7b df 24 ea 11 61 9a 54 af 0b f0 3e c5'
+    '08 f3 3d c6 62 99 57 ac dc 27 e9 12 b6 4d 83 78'
+    '63 98 56 ad 09 f2 3c c7 b7 4c 82 79 dd 26 e8 13'
+    'b1 4a 84 7f db 20 ee 15 65 9e 50 ab 0f f4 3a c1'
+    'da 21 ef 14 b0 4b 85 7e 0e f5 3b c0 64 9f 51 aa'
+    '67 9c 52 a9 0d f6 38 c3 b3 48 86 7d d9 22 ec 17'
+    '0c f7 39 c2 66 9d 53 a8 d8 23 ed 16 b2 49 87 7c'
+    '00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f'
+    '10 11 12 13 14 15 16 17 18 19 1a 1b 1c 1d 1e 1f'
+    '20 21 22 23 24 25 26 27 28 29 2a 2b 2c 2d 2e 2f'
+    '30 31 32 33 34 35 36 37 38 39 3a 3b 3c 3d 3e 3f'
+    '40 41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f'
+    '50 51 52 53 54 55 56 57 58 59 5a 5b 5c 5d 5e 5f'
+    '60 61 62 63 64 65 66 67 68 69 6a 6b 6c 6d 6e 6f'
+    '70 71 72 73 74 75 76 77 78 79 7a 7b 7c 7d 7e 7f'
+    '80 81 82 83 84 85 86 87 88 89 8a 8b 8c 8d 8e 8f'
+    '90 91 92 93 94 95 96 97 98 99 9a 9b 9c 9d 9e 9f'
+    'a0 a1 a2 a3 a4 a5 a6 a7 a8 a9 aa ab ac ad ae af'
+    'b0 b1 b2 b3 b4 b5 b6 b7 b8 b9 ba bb bc bd be bf'
+    'c0 c1 c2 c3 c4 c5 c6 c7 c8 c9 ca cb cc cd ce cf'
+    'd0 d1 d2 d3 d4 d5 d6 d7 d8 d9 da db dc dd de df'
+    'e0 e1 e2 e3 e4 e5 e6 e7 e8 e9 ea eb ec ed ee ef'
+    'f0 f1 f2 f3 f4 f5 f6 f7 f8 f9 fa fb fc fd fe ff'
+    '00 c0 43 83 86 46 c5 05 cf 0f 8c 4c 49 89 0a ca'
+    '5d 9d 1e de db 1b 98 58 92 52 d1 11 14 d4 57 97'
+    'ba 7a f9 39 3c fc 7f bf 75 b5 36 f6 f3 33 b0 70'
+    'e7 27 a4 64 61 a1 22 e2 28 e8 6b ab ae 6e ed 2d'
+    'b7 77 f4 34 31 f1 72 b2 78 b8 3b fb fe 3e bd 7d'
+    'ea 2a a9 69 6c ac 2f ef 25 e5 66 a6 a3 63 e0 20'
+    '0d cd 4e 8e 8b 4b c8 08 c2 02 81 41 44 84 07 c7'
+    '50 90 13 d3 d6 16 95 55 9f 5f dc 1c 19 d9 5a 9a'
+    'ad 6d ee 2e 2b eb 68 a8 62 a2 21 e1 e4 24 a7 67'
+    'f0 30 b3 73 76 b6 35 f5 3f ff 7c bc b9 79 fa 3a'
+    '17 d7 54 94 91 51 d2 12 d8 18 9b 5b 5e 9e 1d dd'
+    '4a 8a 09 c9 cc 0c 8f 4f 85 45 c6 06 03 c3 40 80'
+    '1a da 59 99 9c 5c df 1f d5 15 96 56 53 93 10 d0'
+    '47 87 04 c4 c1 01 82 42 88 48 cb 0b 0e ce 4d 8d'
+    'a0 60 e3 23 26 e6 65 a5 6f af 2c ec e9 29 aa 6a'
+    'fd 3d be 7e 7b bb 38 f8 32 f2 71 b1 b4 74 f7 37'
+    '00 c2 47 85 8e 4c c9 0b df 1d 98 5a 51 93 16 d4'
+    '7d bf 3a f8 f3 31 b4 76 a2 60 e5 27 2c ee 6b a9'
+    'fa 38 bd 7f 74 b6 33 f1 25 e7 62 a0 ab 69 ec 2e'
+    '87 45 c0 02 09 cb 4e 8c 58 9a 1f dd d6 14 91 53'
+    '37 f5 70 b2 b9 7b fe 3c e8 2a af 6d 66 a4 21 e3'
+    '4a 88 0d cf c4 06 83 41 95 57 d2 10 1b d9 5c 9e'
+    'cd 0f 8a 48 43 81 04 c6 12 d0 55 97 9c 5e db 19'
+    'b0 72 f7 35 3e fc 79 bb 6f ad 28 ea e1 23 a6 64'
+    '6e ac 29 eb e0 22 a7 65 b1 73 f6 34 3f fd 78 ba'
+    '13 d1 54 96 9d 5f da 18 cc 0e 8b 49 42 80 05 c7'
+    '94 56 d3 11 1a d8 5d 9f 4b 89 0c ce c5 07 82 40'
+    'e9 2b ae 6c 67 a5 20 e2 36 f4 71 b3 b8 7a ff 3d'
+    '59 9b 1e dc d7 15 90 52 86 44 c1 03 08 ca 4f 8d'
+    '24 e6 63 a1 aa 68 ed 2f fb 39 bc 7e 75 b7 32 f0'
+    'a3 61 e4 26 2d ef 6a a8 7c be 3b f9 f2 30 b5 77'
+    'de 1c 99 5b 50 92 17 d5 01 c3 46 84 8f 4d c8 0a'
+    '00 10 20 30 40 50 60 70 80 90 a0 b0 c0 d0 e0 f0'
+    'c3 d3 e3 f3 83 93 a3 b3 43 53 63 73 03 13 23 33'
+    '45 55 65 75 05 15 25 35 c5 d5 e5 f5 85 95 a5 b5'
+    '86 96 a6 b6 c6 d6 e6 f6 06 16 26 36 46 56 66 76'
+    '8a 9a aa ba ca da ea fa 0a 1a 2a 3a 4a 5a 6a 7a'
+    '49 59 69 79 09 19 29 39 c9 d9 e9 f9 89 99 a9 b9'
+    'cf df ef ff 8f 9f af bf 4f 5f 6f 7f 0f 1f 2f 3f'
+    '0c 1c 2c 3c 4c 5c 6c 7c 8c 9c ac bc cc dc ec fc'
+    'd7 c7 f7 e7 97 87 b7 a7 57 47 77 67 17 07 37 27'
+    '14 04 34 24 54 44 74 64 94 84 b4 a4 d4 c4 f4 e4'
+    '92 82 b2 a2 d2 c2 f2 e2 12 02 32 22 52 42 72 62'
+    '51 41 71 61 11 01 31 21 d1 c1 f1 e1 91 81 b1 a1'
+    '5d 4d 7d 6d 1d 0d 3d 2d dd cd fd ed 9d 8d bd ad'
+    '9e 8e be ae de ce fe ee 1e 0e 3e 2e 5e 4e 7e 6e'
+    '18 08 38 28 58 48 78 68 98 88 b8 a8 d8 c8 f8 e8'
+    'db cb fb eb 9b 8b bb ab 5b 4b 7b 6b 1b 0b 3b 2b'
+    '00 85 c9 4c 51 d4 98 1d a2 27 6b ee f3 76 3a bf'
+    '87 02 4e cb d6 53 1f 9a 25 a0 ec 69 74 f1 bd 38'
+    'cd 48 04 81 9c 19 55 d0 6f ea a6 23 3e bb f7 72'
+    '4a cf 83 06 1b 9e d2 57 e8 6d 21 a4 b9 3c 70 f5'
+    '59 dc 90 15 08 8d c1 44 fb 7e 32 b7 aa 2f 63 e6'
+    'de 5b 17 92 8f 0a 46 c3 7c f9 b5 30 2d a8 e4 61'
+    '94 11 5d d8 c5 40 0c 89 36 b3 ff 7a 67 e2 ae 2b'
+    '13 96 da 5f 42 c7 8b 0e b1 34 78 fd e0 65 29 ac'
+    'b2 37 7b fe e3 66 2a af 10 95 d9 5c 41 c4 88 0d'
+    '35 b0 fc 79 64 e1 ad 28 97 12 5e db c6 43 0f 8a'
+    '7f fa b6 33 2e ab e7 62 dd 58 14 91 8c 09 45 c0'
+    'f8 7d 31 b4 a9 2c 60 e5 5a df 93 16 0b 8e c2 47'
+    'eb 6e 22 a7 ba 3f 73 f6 49 cc 80 05 18 9d d1 54'
+    '6c e9 a5 20 3d b8 f4 71 ce 4b 07 82 9f 1a 56 d3'
+    '26 a3 ef 6a 77 f2 be 3b 84 01 4d c8 d5 50 1c 99'
+    'a1 24 68 ed f0 75 39 bc 03 86 ca 4f 52 d7 9b 1e'
+    '00 20 40 60 80 a0 c0 e0 c3 e3 83 a3 43 63 03 23'
+    '45 65 05 25 c5 e5 85 a5 86 a6 c6 e6 06 26 46 66'
+    '8a aa ca ea 0a 2a 4a 6a 49 69 09 29 c9 e9 89 a9'
+    'cf ef 8f af 4f 6f 0f 2f 0c 2c 4c 6c 8c ac cc ec'
+    'd7 f7 97 b7 57 77 17 37 14 34 54 74 94 b4 d4 f4'
+    '92 b2 d2 f2 12 32 52 72 51 71 11 31 d1 f1 91 b1'
+    '5d 7d 1d 3d dd fd 9d bd 9e be de fe 1e 3e 5e 7e'
+    '18 38 58 78 98 b8 d8 f8 db fb 9b bb 5b 7b 1b 3b'
+    '6d 4d 2d 0d ed cd ad 8d ae 8e ee ce 2e 0e 6e 4e'
+    '28 08 68 48 a8 88 e8 c8 eb cb ab 8b 6b 4b 2b 0b'
+    'e7 c7 a7 87 67 47 27 07 24 04 64 44 a4 84 e4 c4'
+    'a2 82 e2 c2 22 02 62 42 61 41 21 01 e1 c1 a1 81'
+    'ba 9a fa da 3a 1a 7a 5a 79 59 39 19 f9 d9 b9 99'
+    'ff df bf 9f 7f 5f 3f 1f 3c 1c 7c 5c bc 9c fc dc'
+    '30 10 70 50 b0 90 f0 d0 f3 d3 b3 93 73 53 33 13'
+    '75 55 35 15 f5 d5 b5 95 b6 96 f6 d6 36 16 76 56'
+    '00 94 eb 7f 15 81 fe 6a 2a be c1 55 3f ab d4 40'
+    '54 c0 bf 2b 41 d5 aa 3e 7e ea 95 01 6b ff 80 14'
+    'a8 3c 43 d7 bd 29 56 c2 82 16 69 fd 97 03 7c e8'
+    'fc 68 17 83 e9 7d 02 96 d6 42 3d a9 c3 57 28 bc'
+    '93 07 78 ec 86 12 6d f9 b9 2d 52 c6 ac 38 47 d3'
+    'c7 53 2c b8 d2 46 39 ad ed 79 06 92 f8 6c 13 87'
+    '3b af d0 44 2e ba c5 51 11 85 fa 6e 04 90 ef 7b'
+    '6f fb 84 10 7a ee 91 05 45 d1 ae 3a 50 c4 bb 2f'
+    'e5 71 0e 9a f0 64 1b 8f cf 5b 24 b0 da 4e 31 a5'
+    'b1 25 5a ce a4 30 4f db 9b 0f 70 e4 8e 1a 65 f1'
+    '4d d9 a6 32 58 cc b3 27 67 f3 8c 18 72 e6 99 0d'
+    '19 8d f2 66 0c 98 e7 73 33 a7 d8 4c 26 b2 cd 59'
+    '76 e2 9d 09 63 f7 88 1c 5c c8 b7 23 49 dd a2 36'
+    '22 b6 c9 5d 37 a3 dc 48 08 9c e3 77 1d 89 f6 62'
+    'de 4a 35 a1 cb 5f 20 b4 f4 60 1f 8b e1 75 0a 9e'
+    '8a 1e 61 f5 9f 0b 74 e0 a0 34 4b df b5 21 5e ca'
+)
+
+_GF: tuple = tuple(_GF_DATA[256 * i:256 * (i + 1)] for i in range(16))
 # pylint: enable=duplicate-code
 
 _S_BOX_KUZNECHIK: tuple = (
@@ -373,6 +364,8 @@ _S_BOX_REVERSE_KUZNECHIK: tuple = (
     0xd6, 0x20, 0x0a, 0x08, 0x00, 0x4c, 0xd7, 0x74,
 )
 
+_S_BOX_REVERSE_KUZNECHIK_BYTES: bytes = bytes(_S_BOX_REVERSE_KUZNECHIK)
+
 _S_BOX_MAGMA: tuple = (
     (0x0c, 0x04, 0x06, 0x02, 0x0a, 0x05, 0x0b, 0x09,
      0x0e, 0x08, 0x0d, 0x07, 0x00, 0x03, 0x0f, 0x01,),
@@ -423,26 +416,36 @@ class GOST34122015Kuznechik:
         Args:
             key: Encryption key.
         """
-        self._cipher_c: List[bytearray] = []
-        self._cipher_iter_key = []
-        self._cipher_get_c()
         self.oid = ObjectIdentifier('1.2.643.7.1.1.5.2')
-        key_1 = key[:_KEY_SIZE // 2]
-        key_2 = key[_KEY_SIZE // 2:]
-        internal = bytearray(_KEY_SIZE // 2)
-        self._cipher_iter_key.append(key_1)
-        self._cipher_iter_key.append(key_2)
-        for i in range(4):
-            for j in range(8):
-                internal = add_xor(key_1, self._cipher_c[i * 8 + j])
-                internal = GOST34122015Kuznechik._cipher_s(internal)
-                internal = GOST34122015Kuznechik._cipher_l(internal)
-                key_1, key_2 = [add_xor(internal, key_2), key_1]
-            self._cipher_iter_key.append(key_1)
-            self._cipher_iter_key.append(key_2)
-        key_1 = bytearray(self.key_size // 2)
-        key_2 = bytearray(self.key_size // 2)
-        key = bytearray(self.key_size)
+        _, self._cipher_ls, self._cipher_il, self._cipher_ils, _ = _kuznechik_tables()
+        schedule = _KEY_CACHE.get(key)
+        if schedule is None:
+            schedule = self._cipher_expand_key(key)
+            _KEY_CACHE.put(key, schedule)
+        # The working copy of the schedule is overwritten with zeros by
+        # '_set_schedule()' as soon as the iterative keys are taken from it.
+        self._set_schedule(schedule)
+
+    def _rekey(self, key: bytearray) -> None:
+        # Replacing the key of the existing object (the key cache is not used,
+        # since the derived keys are used once).
+        self._set_schedule(self._cipher_expand_key(key))
+
+    def _set_schedule(self, schedule: bytearray) -> None:
+        self._cipher_iter_key = [
+            schedule[i * _BLOCK_SIZE_KUZNECHIK:(i + 1) * _BLOCK_SIZE_KUZNECHIK]
+            for i in range(10)
+        ]
+        self._cipher_iter_key_int = [
+            int.from_bytes(item, byteorder='big') for item in self._cipher_iter_key
+        ]
+        self._cipher_iter_key_dec = [
+            int.from_bytes(
+                schedule[(i + 10) * _BLOCK_SIZE_KUZNECHIK:(i + 11) * _BLOCK_SIZE_KUZNECHIK],
+                byteorder='big'
+            ) for i in range(10)
+        ]
+        schedule[:] = bytes(len(schedule))
 
     def __del__(self) -> None:
         """
@@ -503,11 +506,36 @@ class GOST34122015Kuznechik:
             result = GOST34122015Kuznechik._cipher_r_reverse(result)
         return result
 
-    def _cipher_get_c(self) -> None:
-        for i in range(1, 33):
-            internal = bytearray(_BLOCK_SIZE_KUZNECHIK)
-            internal[15] = i
-            self._cipher_c.append(GOST34122015Kuznechik._cipher_l(internal))
+    def _cipher_ls_int(self, state: int) -> int:
+        (ls_0, ls_1, ls_2, ls_3, ls_4, ls_5, ls_6, ls_7,
+         ls_8, ls_9, ls_10, ls_11, ls_12, ls_13, ls_14, ls_15) = self._cipher_ls
+        data = state.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big')
+        return (
+            ls_0[data[0]] ^ ls_1[data[1]] ^ ls_2[data[2]] ^ ls_3[data[3]] ^
+            ls_4[data[4]] ^ ls_5[data[5]] ^ ls_6[data[6]] ^ ls_7[data[7]] ^
+            ls_8[data[8]] ^ ls_9[data[9]] ^ ls_10[data[10]] ^ ls_11[data[11]] ^
+            ls_12[data[12]] ^ ls_13[data[13]] ^ ls_14[data[14]] ^ ls_15[data[15]]
+        )
+
+    def _cipher_expand_key(self, key: bytearray) -> bytearray:
+        # The result is the iterative keys K1..K10 followed by the values of
+        # the reverse L transformation of them (used for decryption).
+        cipher_c = _kuznechik_tables()[4]
+        key_1 = int.from_bytes(key[:_KEY_SIZE // 2], byteorder='big')
+        key_2 = int.from_bytes(key[_KEY_SIZE // 2:], byteorder='big')
+        iter_key = [key_1, key_2]
+        for i in range(4):
+            for j in range(8):
+                key_1, key_2 = self._cipher_ls_int(key_1 ^ cipher_c[i * 8 + j]) ^ key_2, key_1
+            iter_key.append(key_1)
+            iter_key.append(key_2)
+        iter_key.extend([self._cipher_il_int(item) for item in iter_key])
+        result = bytearray(b''.join(
+            item.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big') for item in iter_key
+        ))
+        key_1 = key_2 = 0
+        iter_key.clear()
+        return result
 
     @property
     def block_size(self) -> int:
@@ -529,10 +557,27 @@ class GOST34122015Kuznechik:
         """
         return _KEY_SIZE
 
+    def _cipher_il_int(self, state: int) -> int:
+        (il_0, il_1, il_2, il_3, il_4, il_5, il_6, il_7,
+         il_8, il_9, il_10, il_11, il_12, il_13, il_14, il_15) = self._cipher_il
+        data = state.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big')
+        return (
+            il_0[data[0]] ^ il_1[data[1]] ^ il_2[data[2]] ^ il_3[data[3]] ^
+            il_4[data[4]] ^ il_5[data[5]] ^ il_6[data[6]] ^ il_7[data[7]] ^
+            il_8[data[8]] ^ il_9[data[9]] ^ il_10[data[10]] ^ il_11[data[11]] ^
+            il_12[data[12]] ^ il_13[data[13]] ^ il_14[data[14]] ^ il_15[data[15]]
+        )
+
     def decrypt(self, block: bytearray) -> bytearray:
         """
         Decrypting a block of ciphertext.
 
+        Since the reverse L transformation is linear, the rounds are
+        rearranged so that each of them is the reverse S transformation
+        followed by the reverse L transformation, performed at once using the
+        lookup tables, and the XOR with the reverse L transformation of the
+        iterative key (computed in advance).
+
         Args:
             block: The block of ciphertext to be decrypted (the block size is
               16 bytes).
@@ -540,18 +585,34 @@ class GOST34122015Kuznechik:
         Returns:
             The block of plaintext.
         """
-        block = bytearray(block)
-        block = add_xor(self._cipher_iter_key[9], block)
-        for i in range(8, -1, -1):
-            block = GOST34122015Kuznechik._cipher_l_reverse(block)
-            block = GOST34122015Kuznechik._cipher_s_reverse(block)
-            block = add_xor(self._cipher_iter_key[i], block)
-        return block
+        (ils_0, ils_1, ils_2, ils_3, ils_4, ils_5, ils_6, ils_7,
+         ils_8, ils_9, ils_10, ils_11, ils_12, ils_13, ils_14, ils_15) = self._cipher_ils
+        iter_key = self._cipher_iter_key_dec
+        state = self._cipher_il_int(
+            int.from_bytes(block, byteorder='big') ^ self._cipher_iter_key_int[9]
+        )
+        for i in range(8, 0, -1):
+            data = state.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big')
+            state = (
+                ils_0[data[0]] ^ ils_1[data[1]] ^ ils_2[data[2]] ^ ils_3[data[3]] ^
+                ils_4[data[4]] ^ ils_5[data[5]] ^ ils_6[data[6]] ^ ils_7[data[7]] ^
+                ils_8[data[8]] ^ ils_9[data[9]] ^ ils_10[data[10]] ^ ils_11[data[11]] ^
+                ils_12[data[12]] ^ ils_13[data[13]] ^ ils_14[data[14]] ^ ils_15[data[15]] ^
+                iter_key[i]
+            )
+        data = state.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big')
+        state = int.from_bytes(data.translate(_S_BOX_REVERSE_KUZNECHIK_BYTES), byteorder='big')
+        state ^= self._cipher_iter_key_int[0]
+        return bytearray(state.to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big'))
 
     def encrypt(self, block: bytearray) -> bytearray:
         """
         Encrypting a block of plaintext.
 
+        The block is processed as a 128-bit integer, and the S and L
+        transformations of each round are performed at once using the LS
+        lookup tables (16 lookups and XORs per round).
+
         Args:
             block: The block of plaintext to be encrypted (the block size is
               16 bytes).
@@ -559,18 +620,154 @@ class GOST34122015Kuznechik:
         Returns:
             The block of ciphertext.
         """
-        block = bytearray(block)
+        return bytearray(self._encrypt_int(int.from_bytes(block, byteorder='big')).to_bytes(
+            _BLOCK_SIZE_KUZNECHIK, byteorder='big'
+        ))
+
+    def _encrypt_int(self, state: int) -> int:
+        # Encrypting the block represented as a big-endian integer.
+        (ls_0, ls_1, ls_2, ls_3, ls_4, ls_5, ls_6, ls_7,
+         ls_8, ls_9, ls_10, ls_11, ls_12, ls_13, ls_14, ls_15) = self._cipher_ls
+        iter_key = self._cipher_iter_key_int
         for i in range(9):
-            block = add_xor(self._cipher_iter_key[i], block)
-            block = GOST34122015Kuznechik._cipher_s(block)
-            block = GOST34122015Kuznechik._cipher_l(block)
-        block = add_xor(self._cipher_iter_key[9], block)
-        return block
+            data = (state ^ iter_key[i]).to_bytes(_BLOCK_SIZE_KUZNECHIK, byteorder='big')
+            state = (
+                ls_0[data[0]] ^ ls_1[data[1]] ^ ls_2[data[2]] ^ ls_3[data[3]] ^
+                ls_4[data[4]] ^ ls_5[data[5]] ^ ls_6[data[6]] ^ ls_7[data[7]] ^
+                ls_8[data[8]] ^ ls_9[data[9]] ^ ls_10[data[10]] ^ ls_11[data[11]] ^
+                ls_12[data[12]] ^ ls_13[data[13]] ^ ls_14[data[14]] ^ ls_15[data[15]]
+            )
+        return state ^ iter_key[9]
+
+    def _get_key(self) -> bytearray:
+        # The first two iterative keys are the halves of the encryption key.
+        return self._cipher_iter_key[0] + self._cipher_iter_key[1]
 
     def clear(self) -> None:
         """Сlearing the values of iterative encryption keys."""
         for i in range(10):
             self._cipher_iter_key[i] = zero_fill(self._cipher_iter_key[i])
+            self._cipher_iter_key_int[i] = 0
+            self._cipher_iter_key_dec[i] = 0
+
+
+@lru_cache(maxsize=None)
+def _kuznechik_tables() -> tuple:
+    # The L transformation is linear, so L(x) is the XOR of the values of L
+    # for the individual bytes of x, and these values are in turn the XOR of
+    # the values for the individual bits.  The tables are built on the first
+    # use: 'l_table[i][b]' is L of the block with the byte 'b' at the
+    # position 'i' and zeros elsewhere, 'ls_table[i][b]' is the same for
+    # 'S(b)'.  The tables 'il_table' and 'ils_table' are the same for the
+    # reverse transformations.  The blocks are represented as big-endian
+    # 128-bit integers.
+    # The iteration constants of the key schedule C1..C32 are L of the
+    # blocks 1..32, that is 'l_table[15][1..32]'.
+    l_table = _kuznechik_linear_table(GOST34122015Kuznechik._cipher_l)
+    il_table = _kuznechik_linear_table(GOST34122015Kuznechik._cipher_l_reverse)
+    ls_table = tuple(
+        tuple(table[_S_BOX_KUZNECHIK[value]] for value in range(256)) for table in l_table
+    )
+    ils_table = tuple(
+        tuple(table[_S_BOX_REVERSE_KUZNECHIK[value]] for value in range(256))
+        for table in il_table
+    )
+    return l_table, ls_table, il_table, ils_table, l_table[15][1:33]
+
+
+def _kuznechik_linear_table(transform: Callable[[bytearray], bytearray]) -> tuple:
+    result = []
+    for i in range(_BLOCK_SIZE_KUZNECHIK):
+        basis = []
+        for j in range(8):
+            block = bytearray(_BLOCK_SIZE_KUZNECHIK)
+            block[i] = 1 << j
+            basis.append(int.from_bytes(transform(block), byteorder='big'))
+        table = [0] * 256
+        for value in range(1, 256):
+            low = value & -value
+            table[value] = table[value ^ low] ^ basis[low.bit_length() - 1]
+        result.append(tuple(table))
+    return tuple(result)
+
+
+class _KeyScheduleCache:
+    # The bounded LRU cache of the expanded 'kuznechik' keys.  The entries are
+    # looked up by the BLAKE2b digest of the key computed with a random secret
+    # generated when the cache is enabled.  The cached schedule is equivalent
+    # to the key (the iterative keys K1 and K2 are the halves of the key), so
+    # the cache holds key material for up to 'size' keys until the entry is
+    # evicted or the cache is disabled; the schedule of an evicted entry is
+    # overwritten with zeros.  The cache is disabled by default.
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._secret = b''
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def _digest(self, key: bytearray) -> bytes:
+        # pylint: disable=import-outside-toplevel
+        from hashlib import blake2b
+        # pylint: enable=import-outside-toplevel
+        # The key is hashed in place, without an immutable copy that could not
+        # be cleared.
+        return blake2b(key, key=self._secret).digest()
+
+    def resize(self, size: int) -> None:
+        with self._lock:
+            self._size = size
+            if size and not self._secret:
+                self._secret = os.urandom(32)
+            while len(self._items) > size:
+                _, schedule = self._items.popitem(last=False)
+                schedule[:] = bytes(len(schedule))
+            if not size:
+                self._secret = b''
+
+    def get(self, key: bytearray) -> Optional[bytearray]:
+        if not self._size:
+            return None
+        with self._lock:
+            digest = self._digest(key)
+            schedule = self._items.get(digest)
+            if schedule is None:
+                return None
+            self._items.move_to_end(digest)
+            return bytearray(schedule)
+
+    def put(self, key: bytearray, schedule: bytearray) -> None:
+        if not self._size:
+            return
+        with self._lock:
+            digest = self._digest(key)
+            if digest in self._items:
+                self._items.move_to_end(digest)
+                return
+            self._items[digest] = bytearray(schedule)
+            while len(self._items) > self._size:
+                _, schedule = self._items.popitem(last=False)
+                schedule[:] = bytes(len(schedule))
+
+
+_KEY_CACHE: _KeyScheduleCache = _KeyScheduleCache()
+
+
+@lru_cache(maxsize=None)
+def _magma_tables() -> tuple:
+    # The T transformation followed by the rotation by 11 bits: 't_table[m][b]'
+    # is the result for the 32-bit value with the byte 'b' at the position 'm'
+    # (0 is the least significant byte) and zeros elsewhere, so the function
+    # 'g' is the XOR of four table values.
+    t_table = []
+    for i in range(4):
+        table = []
+        for value in range(256):
+            result = ((_S_BOX_MAGMA[i * 2 + 1][value >> 4] << 4)
+                      | _S_BOX_MAGMA[i * 2][value & 0x0f]) << (8 * i)
+            table.append(((result << 11) | (result >> 21)) & 0xffffffff)
+        t_table.append(tuple(table))
+    return tuple(t_table)
 
 
 class GOST34122015Magma:
@@ -604,11 +801,8 @@ class GOST34122015Magma:
             key: Encryption key.
         """
         self.oid = ObjectIdentifier('1.2.643.7.1.1.5.1')
-        self._cipher_iter_key: List[bytearray] = []
-        self._expand_iter_key(key)
-        self._expand_iter_key(key)
-        self._expand_iter_key(key)
-        self._expand_iter_key_final(key)
+        self._cipher_t_table = _magma_tables()
+        self._rekey(key)
         key = zero_fill(key)
 
     def __del__(self):
@@ -620,6 +814,18 @@ class GOST34122015Magma:
         """
         self.clear()
 
+    def _rekey(self, key: bytearray) -> None:
+        self._cipher_iter_key: List[bytearray] = []
+        self._expand_iter_key(key)
+        self._expand_iter_key(key)
+        self._expand_iter_key(key)
+        self._expand_iter_key_final(key)
+        self._cipher_iter_key_int = [
+            int.from_bytes(item, byteorder='big') for item in self._cipher_iter_key
+        ]
+        # The decryption uses the iterative keys in the reverse order.
+        self._cipher_iter_key_rev = self._cipher_iter_key_int[::-1]
+
     def _expand_iter_key(self, key: bytearray) -> None:
         iter_key = bytearray(b'')
         for j in range(8):
@@ -733,6 +939,24 @@ class GOST34122015Magma:
         """
         return _KEY_SIZE
 
+    def _cipher_rounds(self, block: bytearray, iter_key: List[int]) -> bytearray:
+        return bytearray(self._cipher_rounds_int(
+            int.from_bytes(block, byteorder='big'), iter_key
+        ).to_bytes(_BLOCK_SIZE_MAGMA, byteorder='big'))
+
+    def _cipher_rounds_int(self, state: int, iter_key: List[int]) -> int:
+        t_0, t_1, t_2, t_3 = self._cipher_t_table
+        a_1 = state >> 32
+        a_0 = state & 0xffffffff
+        for i in range(31):
+            internal = (a_0 + iter_key[i]) & 0xffffffff
+            a_1, a_0 = a_0, (a_1 ^ t_0[internal & 0xff] ^ t_1[(internal >> 8) & 0xff]
+                             ^ t_2[(internal >> 16) & 0xff] ^ t_3[internal >> 24])
+        internal = (a_0 + iter_key[31]) & 0xffffffff
+        a_1 ^= (t_0[internal & 0xff] ^ t_1[(internal >> 8) & 0xff]
+                ^ t_2[(internal >> 16) & 0xff] ^ t_3[internal >> 24])
+        return (a_1 << 32) | a_0
+
     def decrypt(self, block: bytearray) -> bytearray:
         """
         Decrypting a block of ciphertext.
@@ -744,23 +968,16 @@ class GOST34122015Magma:
         Returns:
             The block of plaintext.
         """
-        result = bytearray(_BLOCK_SIZE_MAGMA)
-        result = GOST34122015Magma._cipher_g_prev(
-            self._cipher_iter_key[31], block
-        )
-        for i in range(30, 0, -1):
-            result = GOST34122015Magma._cipher_g_prev(
-                self._cipher_iter_key[i], result
-            )
-        result = GOST34122015Magma._cipher_g_fin(
-            self._cipher_iter_key[0], result
-        )
-        return result
+        return self._cipher_rounds(block, self._cipher_iter_key_rev)
 
     def encrypt(self, block: bytearray) -> bytearray:
         """
         Encrypting a block of plaintext.
 
+        The halves of the block and the iterative keys are processed as
+        32-bit integers, and the substitution with the rotation by 11 bits
+        is performed using four lookup tables.
+
         Args:
             block: The block of plaintext to be encrypted (the block size is
               8 bytes).
@@ -768,20 +985,19 @@ class GOST34122015Magma:
         Returns:
             The block of ciphertext.
         """
-        result = bytearray(_BLOCK_SIZE_MAGMA)
-        result = GOST34122015Magma._cipher_g_prev(
-            self._cipher_iter_key[0], block
-        )
-        for i in range(1, 31):
-            result = GOST34122015Magma._cipher_g_prev(
-                self._cipher_iter_key[i], result
-            )
-        result = GOST34122015Magma._cipher_g_fin(
-            self._cipher_iter_key[31], result
-        )
-        return result
+        return self._cipher_rounds(block, self._cipher_iter_key_int)
+
+    def _encrypt_int(self, state: int) -> int:
+        # Encrypting the block represented as a big-endian integer.
+        return self._cipher_rounds_int(state, self._cipher_iter_key_int)
+
+    def _get_key(self) -> bytearray:
+        # The first eight iterative keys are the parts of the encryption key.
+        return bytearray(b''.join(self._cipher_iter_key[:8]))
 
     def clear(self) -> None:
         """Сlearing the values of iterative encryption keys."""
         for i in range(32):
             self._cipher_iter_key[i] = zero_fill(self._cipher_iter_key[i])
+            self._cipher_iter_key_int[i] = 0
+            self._cipher_iter_key_rev[i] = 0
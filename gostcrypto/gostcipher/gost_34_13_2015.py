@@ -22,6 +22,10 @@ Attributes:
     MODE_CFB: Cipher Feedback mode.
     MODE_OFB: OutputFeedback mode.
     MODE_CTR: Counter mode.
+    MODE_CTR_ACPKM: Counter mode with the key meshing (ACPKM), R
+      1323565.1.017-2018.
+    MODE_MGM: Multilinear Galois Mode (authenticated encryption), R
+      1323565.1.026-2019.
     MODE_MAC: Message Authentication Code algorithm.
     PAD_MODE_1: Message padding procedure No. 1 (paragraph 4.1.1
       GOST 34.13-2015)
@@ -30,25 +34,29 @@ Attributes:
 """
 # pylint: enable=duplicate-code
 
-from copy import deepcopy
-from typing import Any, Union
+import hmac
+import mmap
+import os
+import stat
+from collections import deque
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
-from gostcrypto.utils import add_xor
-from gostcrypto.utils import int_to_bytearray
-from gostcrypto.utils import bytearray_to_int
 from gostcrypto.utils import zero_fill
-from gostcrypto.utils import msb
 from gostcrypto.utils import check_value
+from gostcrypto.gostoid import ObjectIdentifier
 
 from .gost_34_12_2015 import GOST34122015Kuznechik
 from .gost_34_12_2015 import GOST34122015Magma
+from .gost_34_12_2015 import _KEY_CACHE
 
 MODE_ECB: int = 0x01
 MODE_CBC: int = 0x02
 MODE_CFB: int = 0x03
 MODE_OFB: int = 0x05
 MODE_CTR: int = 0x06
+MODE_CTR_ACPKM: int = 0x07
+MODE_MGM: int = 0x08
 MODE_MAC: int = 0xff
 
 PAD_MODE_1: int = 0x800000f0
@@ -91,12 +99,36 @@ _B_128: bytearray = bytearray([
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x87,
 ])
 
+_CHUNK_SIZE: int = 65536
+
+_ACPKM_D: bytes = bytes(range(0x80, 0xa0))
+
+_DEFAULT_SECTION_SIZE_KUZNECHIK: int = 4096
+
+_DEFAULT_SECTION_SIZE_MAGMA: int = 1024
+
+# The low parts of the irreducible polynomials of the fields GF(2^128)
+# (x^128 + x^7 + x^2 + x + 1) and GF(2^64) (x^64 + x^4 + x^3 + x + 1).
+_GF_POLY: dict = {16: 0x87, 8: 0x1b}
+# The constants of the spread form of the elements of the fields (see
+# _gf_spread()): the format of the binary string, the value of the string of
+# zeros and the mask of the least significant bits of the bytes of the product.
+_GF_SPREAD_FORMAT: dict = {16: '0128b', 8: '064b'}
+_GF_SPREAD_ZERO: dict = {
+    size: int.from_bytes(b'0' * 8 * size, byteorder='big') for size in (8, 16, 32)
+}
+_GF_SPREAD_MASK: dict = {
+    size: int.from_bytes(b'\x01' * 16 * size, byteorder='big') for size in (8, 16)
+}
+
 CipherType = Union[
     'GOST34132015ecb',
     'GOST34132015cbc',
     'GOST34132015cfb',
     'GOST34132015ofb',
     'GOST34132015ctr',
+    'GOST34132015ctracpkm',
+    'GOST34132015mgm',
     'GOST34132015mac'
 ]
 
@@ -116,11 +148,12 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
           block size 64 bit).
         key: Byte object with 256-bit encryption key.
         mode: Mode of operation of the block encryption algorithm (valid value:
-          MODE_CBC, MODE_CFB, MODE_CTR, MODE_ECB,MODE_OFB or MODE_MAC).
+          MODE_CBC, MODE_CFB, MODE_CTR, MODE_CTR_ACPKM, MODE_ECB,MODE_OFB,
+          MODE_MGM or MODE_MAC).
         **init_vect: Byte object with initialization vector.  Used in MODE_CTR,
-          MODE_OFB, MODE_CBC and MODE_CFB modes.  For MODE_CTR mode, the
-          initialization vector length is equal to half the block size (default
-          value iz '_DEFAULT_IV_CTR').  For MODE_CBC, MODE_OFB and MODE_CFB
+          MODE_CTR_ACPKM, MODE_OFB, MODE_CBC and MODE_CFB modes.  For MODE_CTR
+          and MODE_CTR_ACPKM modes, the initialization vector length is equal
+          to half the block size (default value iz '_DEFAULT_IV_CTR').  For MODE_CBC, MODE_OFB and MODE_CFB
           modes, it is a multiple of the block size (default value is
           '_DEFAULT_IV').
         **data: The data from which to get the MAC (as a byte object).  For
@@ -131,6 +164,12 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
           'digest' (or 'hexdigest') method.
         **pad_mode: Padding mode for ECB or CBC (the default value is
           PAD_MODE_1).
+        **section_size: The size of the section in bytes for MODE_CTR_ACPKM
+          (the default value is 4096 for 'kuznechik' and 1024 for 'magma').
+        **nonce: Byte object with the nonce for MODE_MGM (the length is equal
+          to the block size, the most significant bit is zero).
+        **tag_size: The size of the authentication tag in bytes for MODE_MGM
+          (from 4 to the block size, the default value is the block size).
 
     Returns:
         New ciphering object.
@@ -138,7 +177,7 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
     Raises:
         GOSTCipherError('GOSTCipherError: unsupported cipher mode'): In case
           of unsupported cipher mode (is not MODE_ECB, MODE_CBC, MODE_CFB,
-          MODE_OFB, MODE_CTR or MODE_MAC).
+          MODE_OFB, MODE_CTR, MODE_CTR_ACPKM, MODE_MGM or MODE_MAC).
         GOSTCipherError('GOSTCipherError: unsupported cipher algorithm'): In
           case of invalid value 'algorithm'.
         GOSTCipherError('GOSTCipherError: invalid key value'): In case of
@@ -151,6 +190,12 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
           modes except ECB mode).
         GOSTCipherError('GOSTCipherError: invalid text data'): In case where
           the text data is not byte object (for MODE_MAC mode).
+        GOSTCipherError('GOSTCipherError: invalid section size'): In case of
+          invalid value 'section_size' (for MODE_CTR_ACPKM mode).
+        GOSTCipherError('GOSTCipherError: invalid nonce value'): In case of
+          invalid value 'nonce' (for MODE_MGM mode).
+        GOSTCipherError('GOSTCipherError: invalid tag size'): In case of
+          invalid value 'tag_size' (for MODE_MGM mode).
     """
     result: Any = None
     if mode == MODE_ECB:
@@ -177,6 +222,17 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
         if algorithm == 'magma':
             init_vect = kwargs.get('init_vect', _DEFAULT_IV_CTR_MAGMA)
         result = GOST34132015ctr(algorithm, key, init_vect)
+    elif mode == MODE_CTR_ACPKM:
+        init_vect = kwargs.get('init_vect', _DEFAULT_IV_CTR_KUZNECHIK)
+        section_size = kwargs.get('section_size', _DEFAULT_SECTION_SIZE_KUZNECHIK)
+        if algorithm == 'magma':
+            init_vect = kwargs.get('init_vect', _DEFAULT_IV_CTR_MAGMA)
+            section_size = kwargs.get('section_size', _DEFAULT_SECTION_SIZE_MAGMA)
+        result = GOST34132015ctracpkm(algorithm, key, init_vect, section_size)
+    elif mode == MODE_MGM:
+        nonce = kwargs.get('nonce', None)
+        tag_size = kwargs.get('tag_size', None)
+        result = GOST34132015mgm(algorithm, key, nonce, tag_size)
     elif mode == MODE_MAC:
         data = kwargs.get('data', bytearray(b''))
         result = GOST34132015mac(algorithm, key, data)
@@ -186,6 +242,206 @@ def new(algorithm: str, key: bytearray, mode: int, **kwargs) -> CipherType:
     return result
 
 
+def set_key_cache_size(size: int) -> None:
+    """
+    Set the size of the cache of the expanded 'kuznechik' keys.
+
+    When the cache is enabled, the iterative keys expanded for the last
+    'size' different keys are kept, so creating a ciphering object with one
+    of these keys does not repeat the key expansion.  The entries are looked
+    up by the keyed digest (BLAKE2b with a random secret) of the key.  The
+    iterative keys are equivalent to the key itself (the first two of them
+    are the halves of the key), so the cache holds the key material of up to
+    'size' keys until the entries are evicted or the cache is disabled with
+    'set_key_cache_size(0)'.  The iterative keys of the evicted entries are
+    overwritten with zeros.  The cache is disabled by default.
+
+    Args:
+        size: The maximum number of the cached keys (0 disables the cache and
+          clears it).
+
+    Raises:
+        GOSTCipherError('GOSTCipherError: invalid cache size'): In case of
+          invalid value 'size'.
+    """
+    if not isinstance(size, int) or size < 0:
+        raise GOSTCipherError('GOSTCipherError: invalid cache size')
+    _KEY_CACHE.resize(size)
+
+
+def encrypt_file(src: Union[str, bytes, os.PathLike], dst: Union[str, bytes, os.PathLike],
+                 algorithm: str, key: bytearray, mode: int, chunk_size: int = _CHUNK_SIZE,
+                 progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+                 **kwargs) -> int:
+    """
+    Encrypt a file.
+
+    The source file is memory-mapped (or read into a single reused buffer if
+    it cannot be memory-mapped) and encrypted in parts of 'chunk_size' bytes,
+    so the memory used does not depend on the size of the file.
+
+    Args:
+        src: The path to the file with the plaintext.
+        dst: The path to the file for the ciphertext.
+        algorithm: The string with the name of the ciphering algorithm
+          ('kuznechik' or 'magma').
+        key: Byte object with 256-bit encryption key.
+        mode: Mode of operation of the block encryption algorithm (valid value:
+          MODE_CBC, MODE_CFB, MODE_CTR, MODE_ECB or MODE_OFB).
+        chunk_size: The size of the processed part of the file in bytes (it
+          is rounded up to a multiple of the block size).
+        progress: The function that is called after each processed part with
+          the number of processed bytes and the size of the file (or None if
+          the size is unknown).
+        **init_vect: Byte object with initialization vector (see 'new()').
+        **pad_mode: Padding mode for ECB or CBC (see 'new()').
+
+    Returns:
+        The number of bytes written to the file with the ciphertext.
+
+    Raises:
+        GOSTCipherError('GOSTCipherError: unsupported cipher mode'): In case
+          of unsupported cipher mode (is not MODE_ECB, MODE_CBC, MODE_CFB,
+          MODE_OFB, MODE_CTR or MODE_CTR_ACPKM).
+        GOSTCipherError('GOSTCipherError: invalid chunk size'): In case of
+          invalid value 'chunk_size'.
+        GOSTCipherError('GOSTCipherError: source and destination are the same
+          file'): In case where 'src' and 'dst' refer to the same file.
+        The exceptions of the 'new()' function.
+    """
+    return _cipher_file(src, dst, algorithm, key, mode, chunk_size, progress, True, kwargs)
+
+
+def decrypt_file(src: Union[str, bytes, os.PathLike], dst: Union[str, bytes, os.PathLike],
+                 algorithm: str, key: bytearray, mode: int, chunk_size: int = _CHUNK_SIZE,
+                 progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+                 **kwargs) -> int:
+    """
+    Decrypt a file.
+
+    The source file is memory-mapped (or read into a single reused buffer if
+    it cannot be memory-mapped) and decrypted in parts of 'chunk_size' bytes,
+    so the memory used does not depend on the size of the file.  As in the
+    'decrypt()' method, the padding is not removed.
+
+    Args:
+        src: The path to the file with the ciphertext.
+        dst: The path to the file for the plaintext.
+        algorithm: The string with the name of the ciphering algorithm
+          ('kuznechik' or 'magma').
+        key: Byte object with 256-bit encryption key.
+        mode: Mode of operation of the block encryption algorithm (valid value:
+          MODE_CBC, MODE_CFB, MODE_CTR, MODE_ECB or MODE_OFB).
+        chunk_size: The size of the processed part of the file in bytes (it
+          is rounded up to a multiple of the block size).
+        progress: The function that is called after each processed part with
+          the number of processed bytes and the size of the file (or None if
+          the size is unknown).
+        **init_vect: Byte object with initialization vector (see 'new()').
+        **pad_mode: Padding mode for ECB or CBC (see 'new()').
+
+    Returns:
+        The number of bytes written to the file with the plaintext.
+
+    Raises:
+        GOSTCipherError('GOSTCipherError: unsupported cipher mode'): In case
+          of unsupported cipher mode (is not MODE_ECB, MODE_CBC, MODE_CFB,
+          MODE_OFB, MODE_CTR or MODE_CTR_ACPKM).
+        GOSTCipherError('GOSTCipherError: invalid chunk size'): In case of
+          invalid value 'chunk_size'.
+        GOSTCipherError('GOSTCipherError: source and destination are the same
+          file'): In case where 'src' and 'dst' refer to the same file.
+        The exceptions of the 'new()' function.
+    """
+    return _cipher_file(src, dst, algorithm, key, mode, chunk_size, progress, False, kwargs)
+
+
+def _cipher_file(src: Union[str, bytes, os.PathLike], dst: Union[str, bytes, os.PathLike],
+                 algorithm: str, key: bytearray, mode: int, chunk_size: int,
+                 progress: Optional[Callable[[int, Optional[int]], Any]],
+                 encrypt: bool, kwargs: dict) -> int:
+    # pylint: disable=too-many-arguments,too-many-locals
+    if mode not in (MODE_ECB, MODE_CBC, MODE_CFB, MODE_OFB, MODE_CTR, MODE_CTR_ACPKM):
+        raise GOSTCipherError('GOSTCipherError: unsupported cipher mode')
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise GOSTCipherError('GOSTCipherError: invalid chunk size')
+    # Opening 'dst' for writing truncates it, so the source file (also as a
+    # hard link) would be lost before it is read.
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise GOSTCipherError('GOSTCipherError: source and destination are the same file')
+    cipher_obj = new(algorithm, key, mode, **kwargs)
+    # The parts of the data must be aligned to the block size, otherwise the
+    # counter or the feedback register would be shifted in the middle of the
+    # data.
+    chunk_size = -(-chunk_size // cipher_obj.block_size) * cipher_obj.block_size
+    context: Any = None
+    if isinstance(cipher_obj, GOST34132015CipherPadding):
+        context = cipher_obj.encryptor() if encrypt else cipher_obj.decryptor()
+    cipher_into = cipher_obj.encrypt_into if encrypt else cipher_obj.decrypt_into
+    result = 0
+    done = 0
+    out = bytearray(chunk_size)
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file, \
+                memoryview(out) as out_view:
+            src_stat = os.fstat(src_file.fileno())
+            total = src_stat.st_size if stat.S_ISREG(src_stat.st_mode) else None
+            chunks = _file_chunks(src_file, chunk_size)
+            try:
+                for chunk in chunks:
+                    if context is not None:
+                        result += dst_file.write(context.update(chunk))
+                    else:
+                        result += dst_file.write(out_view[:cipher_into(chunk, out_view)])
+                    done += len(chunk)
+                    if progress is not None:
+                        progress(done, total)
+            finally:
+                chunks.close()
+            if context is not None:
+                result += dst_file.write(context.finalize())
+    finally:
+        cipher_obj.clear()
+    return result
+
+
+def _file_chunks(file: Any, chunk_size: int) -> Iterator[memoryview]:
+    # Parts of the file of 'chunk_size' bytes (the last part may be shorter).
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        mapped = None
+    if mapped is not None:
+        with mapped, memoryview(mapped) as data_view:
+            for begin in range(0, len(data_view), chunk_size):
+                with data_view[begin:begin + chunk_size] as chunk:
+                    yield chunk
+        return
+    buff = bytearray(chunk_size)
+    with memoryview(buff) as buff_view:
+        while True:
+            # A pipe may return less than requested, so the buffer is filled
+            # up to the end before the part is processed.
+            size = 0
+            while size < chunk_size:
+                read_size = file.readinto(buff_view[size:])
+                if not read_size:
+                    break
+                size += read_size
+            if size:
+                with buff_view[:size] as chunk:
+                    yield chunk
+            if size < chunk_size:
+                return
+
+
+def _xor(op_a: Any, op_b: Any) -> bytes:
+    # XOR of two byte objects of the same length as big integers.
+    return (
+        int.from_bytes(op_a, byteorder='big') ^ int.from_bytes(op_b, byteorder='big')
+    ).to_bytes(len(op_a), byteorder='big')
+
+
 class GOST34132015(ABC):
     """
     Base class of the cipher object.
@@ -278,6 +534,21 @@ class GOST34132015(ABC):
         """
         return self._cipher_obj.block_size
 
+    def _get_data_view(self, data: Any, message: str) -> memoryview:
+        try:
+            data_view = memoryview(data)
+        except TypeError:
+            self.clear()
+            raise GOSTCipherError(message) from None
+        if not data_view.c_contiguous:
+            # The data of a non-contiguous view cannot be read as bytes.
+            data_view.release()
+            self.clear()
+            raise GOSTCipherError(message)
+        if data_view.ndim != 1 or data_view.itemsize != 1:
+            data_view = data_view.cast('B')
+        return data_view
+
 
 class GOST34132015Cipher(GOST34132015, ABC):
     """
@@ -291,6 +562,8 @@ class GOST34132015Cipher(GOST34132015, ABC):
     Methods:
         encrypt(): Encrypting plaintext (abstract method).
         decrypt(): Decrypting ciphertext (abstract method).
+        encrypt_into(): Encrypting plaintext into the output buffer.
+        decrypt_into(): Decrypting ciphertext into the output buffer.
         clear(): Clearing the values of iterative cipher keys.
 
     Attributes:
@@ -338,6 +611,109 @@ class GOST34132015Cipher(GOST34132015, ABC):
             raise GOSTCipherError('GOSTCipherError: invalid ciphertext data')
         return data
 
+    def _encrypt_size(self, size: int) -> int:
+        return size
+
+    def _decrypt_size(self, size: int) -> int:
+        return size
+
+    @abstractmethod
+    def _encrypt_view(self, data: memoryview, out: memoryview) -> None:
+        pass
+
+    @abstractmethod
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        pass
+
+    def _encrypt_data(self, data: bytearray) -> bytearray:
+        result = bytearray(self._encrypt_size(len(data)))
+        with memoryview(data) as data_view, memoryview(result) as result_view:
+            self._encrypt_view(data_view, result_view)
+        return result
+
+    def _decrypt_data(self, data: bytearray) -> bytearray:
+        result = bytearray(self._decrypt_size(len(data)))
+        with memoryview(data) as data_view, memoryview(result) as result_view:
+            self._decrypt_view(data_view, result_view)
+        return result
+
+    def _get_out_view(self, out: Any, size: int) -> memoryview:
+        try:
+            out_view = memoryview(out)
+            if out_view.ndim != 1 or out_view.itemsize != 1:
+                out_view = out_view.cast('B')
+        except TypeError:
+            raise GOSTCipherError('GOSTCipherError: invalid output buffer') from None
+        if out_view.readonly or len(out_view) < size:
+            out_view.release()
+            raise GOSTCipherError('GOSTCipherError: invalid output buffer')
+        return out_view
+
+    def encrypt_into(self, data: Any, out: Any) -> int:
+        """
+        Plaintext encryption into the output buffer.
+
+        The ciphertext is written to the beginning of the output buffer
+        without intermediate copies of the data.  The output buffer may be the
+        same object as the plaintext (the encryption is then performed in
+        place), in padding modes its size must then be sufficient for the
+        padded data.
+
+        Args:
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol: 'bytes', 'bytearray', 'memoryview', 'mmap'
+              and so on).
+            out: The writable output buffer.
+
+        Returns:
+            The number of bytes written to the output buffer.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: invalid output buffer'): In
+              case where the output buffer is not writable or its size is
+              insufficient.
+        """
+        with self._get_data_view(data, 'GOSTCipherError: invalid plaintext data') as data_view:
+            size = self._encrypt_size(len(data_view))
+            with self._get_out_view(out, size) as out_view:
+                self._encrypt_view(data_view, out_view[:size])
+        return size
+
+    def decrypt_into(self, data: Any, out: Any) -> int:
+        """
+        Ciphertext decryption into the output buffer.
+
+        The plaintext is written to the beginning of the output buffer
+        without intermediate copies of the data.  The output buffer may be the
+        same object as the ciphertext (the decryption is then performed in
+        place).
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol: 'bytes', 'bytearray', 'memoryview', 'mmap'
+              and so on).
+            out: The writable output buffer.
+
+        Returns:
+            The number of bytes written to the output buffer.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: invalid output buffer'): In
+              case where the output buffer is not writable or its size is
+              insufficient.
+        """
+        with self._get_data_view(data, 'GOSTCipherError: invalid ciphertext data') as data_view:
+            size = self._decrypt_size(len(data_view))
+            with self._get_out_view(out, size) as out_view:
+                self._decrypt_view(data_view, out_view[:size])
+        return size
+
 
 class GOST34132015CipherPadding(GOST34132015Cipher, ABC):
     """
@@ -351,6 +727,8 @@ class GOST34132015CipherPadding(GOST34132015Cipher, ABC):
     Methods:
         encrypt(): Encrypting plaintext (abstract method).
         decrypt(): Decrypting ciphertext (abstract method).
+        encryptor(): Creating the context of the stream encryption.
+        decryptor(): Creating the context of the stream decryption.
         clear(): Clearing the values of iterative cipher keys.
 
     Attributes:
@@ -387,6 +765,39 @@ class GOST34132015CipherPadding(GOST34132015Cipher, ABC):
             result = self._set_pad_mode_2(data)
         return result
 
+    def _get_pad_len(self, size: int) -> int:
+        if size < self.block_size:
+            pad_size = self.block_size - size
+        else:
+            pad_size = -size % self.block_size
+        if self._pad_mode == PAD_MODE_1:
+            return pad_size
+        return self.block_size + pad_size
+
+    def _get_padding(self, size: int) -> bytes:
+        pad_len = self._get_pad_len(size)
+        if self._pad_mode == PAD_MODE_2:
+            return b'\x80' + b'\x00' * (pad_len - 1)
+        return b'\x00' * pad_len
+
+    def _encrypt_view(self, data: memoryview, out: memoryview) -> None:
+        # Only the incomplete last block is padded, so the data itself is
+        # never copied.
+        full_size = len(data) - len(data) % self.block_size
+        self._encrypt_blocks(data[:full_size], out[:full_size])
+        tail = bytes(data[full_size:]) + self._get_padding(len(data))
+        self._encrypt_blocks(memoryview(tail), out[full_size:])
+
+    @abstractmethod
+    def _encrypt_blocks(self, data: memoryview, out: memoryview) -> None:
+        pass
+
+    def _encrypt_size(self, size: int) -> int:
+        return size + self._get_pad_len(size)
+
+    def _decrypt_size(self, size: int) -> int:
+        return size - size % self.block_size
+
     @abstractmethod
     def encrypt(self, data: bytearray) -> bytearray:
         """
@@ -402,7 +813,7 @@ class GOST34132015CipherPadding(GOST34132015Cipher, ABC):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        data = self._set_padding(GOST34132015Cipher.encrypt(self, data), self._pad_mode)
+        data = GOST34132015Cipher.encrypt(self, data)
         return data
 
     @abstractmethod
@@ -423,6 +834,34 @@ class GOST34132015CipherPadding(GOST34132015Cipher, ABC):
         data = GOST34132015Cipher.decrypt(self, data)
         return data
 
+    def encryptor(self) -> 'GOST34132015Encryptor':
+        """
+        Create the context of the stream encryption.
+
+        The context encrypts the data passed in parts and applies the padding
+        when finalized, so the result is the same as encrypting the whole data
+        by one call of the 'encrypt()' method.  The context changes the state
+        of the cipher object (the initialization vector in CBC mode).
+
+        Returns:
+            The instance of the 'GOST34132015Encryptor' class.
+        """
+        return GOST34132015Encryptor(self)
+
+    def decryptor(self) -> 'GOST34132015Decryptor':
+        """
+        Create the context of the stream decryption.
+
+        The context decrypts the data passed in parts, the result is the same
+        as decrypting the whole data by one call of the 'decrypt()' method
+        (the padding is not removed).  The context changes the state of the
+        cipher object (the initialization vector in CBC mode).
+
+        Returns:
+            The instance of the 'GOST34132015Decryptor' class.
+        """
+        return GOST34132015Decryptor(self)
+
 
 class GOST34132015CipherFeedBack(GOST34132015Cipher, ABC):
     """
@@ -462,23 +901,90 @@ class GOST34132015CipherFeedBack(GOST34132015Cipher, ABC):
         self._init_vect = init_vect
         self._init_vect = bytearray(self._init_vect)
 
-    def _get_gamma(self) -> bytearray:
-        return self._cipher_obj.encrypt(self._init_vect[0:self.block_size])
-
-    def _set_init_vect(self, data: bytearray):
-        iter_iv_hi = self._init_vect[self.block_size:len(self._init_vect)]
-        self._init_vect[0:len(self._init_vect) - self.block_size] = iter_iv_hi
-        begin_iv_low = len(self._init_vect) - self.block_size
-        end_iv_low = len(self._init_vect)
-        self._init_vect[begin_iv_low:end_iv_low] = data
+    def _get_register(self) -> deque:
+        # The shift register of the initialization vector as a queue of
+        # blocks: the first block is used to process the next block of data
+        # and the feedback block (ciphertext or gamma) is appended to the end.
+        return deque(
+            bytes(self._get_block(self._init_vect, i))
+            for i in range(len(self._init_vect) // self.block_size)
+        )
 
-    def _get_final_block(self, data):
-        return data[self.block_size * self._get_num_block(data)::]
+    def _set_register(self, register: deque) -> None:
+        self._init_vect[:] = b''.join(register)
+
+    def _decrypt_feedback(self, data: memoryview, out: memoryview,
+                          decrypt_blocks: Callable[[bytes, bytes], bytes]) -> bytes:
+        # Decryption in CBC and CFB modes depends only on the ciphertext: the
+        # feedback of each block is the ciphertext located 'len(iv)' bytes
+        # before it (or the initialization vector), so the register is not
+        # shifted block by block.  The complete blocks are processed by
+        # chunks: 'decrypt_blocks(cipher_text, feedback)' applies the block
+        # cipher to each block of the chunk and XORs the whole chunk with the
+        # feedback at once.  Returns the new value of the register.
+        register_size = len(self._init_vect)
+        full_size = len(data) - len(data) % self.block_size
+        register = bytes(self._init_vect)
+        for begin in range(0, full_size, _CHUNK_SIZE):
+            end = min(begin + _CHUNK_SIZE, full_size)
+            cipher_text = register + data[begin:end]
+            register = cipher_text[len(cipher_text) - register_size:]
+            out[begin:end] = decrypt_blocks(
+                cipher_text[register_size:], cipher_text[:end - begin]
+            )
+        self._init_vect[:] = register
+        return register
+
+    def _parallel_decrypt(self, data: Any, workers: Optional[int], mode: int) -> bytearray:
+        # pylint: disable=too-many-locals
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            raise GOSTCipherError('GOSTCipherError: invalid number of workers')
+        with self._get_data_view(data, 'GOSTCipherError: invalid ciphertext data') as data_view:
+            size = self._decrypt_size(len(data_view))
+            if workers is None:
+                workers = os.cpu_count() or 1
+            part_size = -(-size // workers)
+            part_size = max(_CHUNK_SIZE, -(-part_size // self.block_size) * self.block_size)
+            if part_size >= size:
+                result = bytearray(size)
+                with memoryview(result) as result_view:
+                    self._decrypt_view(data_view[:size], result_view)
+                return result
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing.shared_memory import SharedMemory
+            # pylint: enable=import-outside-toplevel
+            algorithm = 'kuznechik' if isinstance(self._cipher_obj, GOST34122015Kuznechik) else 'magma'
+            key = self._cipher_obj._get_key()
+            register_size = len(self._init_vect)
+            # The shared memory holds the initialization vector followed by
+            # the ciphertext, and then the plaintext.
+            shared = SharedMemory(create=True, size=register_size + 2 * size)
+            try:
+                shared.buf[:register_size] = self._init_vect
+                shared.buf[register_size:register_size + size] = data_view[:size]
+                with ProcessPoolExecutor(max_workers=-(-size // part_size)) as executor:
+                    futures = [
+                        executor.submit(
+                            _feedback_parallel_part, algorithm, key, mode, shared.name,
+                            register_size, size, begin, min(begin + part_size, size)
+                        ) for begin in range(0, size, part_size)
+                    ]
+                    for future in futures:
+                        future.result()
+                full_size = size - size % self.block_size
+                self._init_vect[:] = shared.buf[full_size:full_size + register_size]
+                result = bytearray(shared.buf[register_size + size:register_size + 2 * size])
+            finally:
+                key = zero_fill(key)
+                shared.close()
+                shared.unlink()
+        return result
 
-    def _final_cipher(self, data):
-        gamma = self._get_gamma()
-        cipher_block = self._get_final_block(data)
-        return add_xor(gamma, cipher_block)
+    def _final_cipher(self, data: memoryview, out: memoryview, feedback: bytes) -> None:
+        begin = self.block_size * self._get_num_block(data)
+        gamma = self._cipher_obj.encrypt(feedback[:self.block_size])
+        out[begin:] = _xor(data[begin:], gamma[:len(data) - begin])
 
     @abstractmethod
     def encrypt(self, data: bytearray) -> bytearray:
@@ -556,11 +1062,7 @@ class GOST34132015ecb(GOST34132015CipherPadding):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        result = bytearray()
-        data = super().encrypt(data)
-        for i in range(self._get_num_block(data)):
-            result = result + self._cipher_obj.encrypt(self._get_block(data, i))
-        return result
+        return self._encrypt_data(super().encrypt(data))
 
     def decrypt(self, data: bytearray) -> bytearray:
         """
@@ -576,11 +1078,19 @@ class GOST34132015ecb(GOST34132015CipherPadding):
             GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
               case where the ciphertext data is not byte object.
         """
-        result = bytearray()
-        data = super().decrypt(data)
-        for i in range(self._get_num_block(data)):
-            result = result + self._cipher_obj.decrypt(self._get_block(data, i))
-        return result
+        return self._decrypt_data(super().decrypt(data))
+
+    def _encrypt_blocks(self, data: memoryview, out: memoryview) -> None:
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        for begin in range(0, len(data), block_size):
+            out[begin:begin + block_size] = encrypt(data[begin:begin + block_size])
+
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        decrypt = self._cipher_obj.decrypt
+        block_size = self.block_size
+        for begin in range(0, len(out), block_size):
+            out[begin:begin + block_size] = decrypt(data[begin:begin + block_size])
 
 
 class GOST34132015cbc(GOST34132015CipherPadding, GOST34132015CipherFeedBack):
@@ -631,14 +1141,7 @@ class GOST34132015cbc(GOST34132015CipherPadding, GOST34132015CipherFeedBack):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        result = bytearray()
-        data = GOST34132015CipherPadding.encrypt(self, data)
-        for i in range(self._get_num_block(data)):
-            internal = add_xor(self._init_vect[0:self.block_size], self._get_block(data, i))
-            cipher_block = self._cipher_obj.encrypt(internal)
-            result = result + cipher_block
-            self._set_init_vect(cipher_block[0:self.block_size])
-        return result
+        return self._encrypt_data(GOST34132015CipherPadding.encrypt(self, data))
 
     def decrypt(self, data: bytearray) -> bytearray:
         """
@@ -654,15 +1157,232 @@ class GOST34132015cbc(GOST34132015CipherPadding, GOST34132015CipherFeedBack):
             GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
               case where the ciphertext data is not byte object.
         """
-        result = bytearray()
-        data = GOST34132015CipherPadding.decrypt(self, data)
-        for i in range(self._get_num_block(data)):
-            internal = self._cipher_obj.decrypt(self._get_block(data, i))
-            cipher_block = add_xor(self._init_vect[0:self.block_size], internal)
-            result = result + cipher_block
-            self._set_init_vect(self._get_block(data, i))
+        return self._decrypt_data(GOST34132015CipherPadding.decrypt(self, data))
+
+    def _encrypt_blocks(self, data: memoryview, out: memoryview) -> None:
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        register = self._get_register()
+        for begin in range(0, len(data), block_size):
+            block = encrypt(_xor(register.popleft(), data[begin:begin + block_size]))
+            out[begin:begin + block_size] = block
+            register.append(bytes(block))
+        self._set_register(register)
+
+    def parallel_decrypt(self, data: Any, workers: Optional[int] = None) -> bytearray:
+        """
+        Ciphertext decryption in CBC mode in a pool of worker processes.
+
+        The ciphertext is split into parts aligned to the block size, each
+        part is decrypted by a separate process with the preceding ciphertext
+        as the initialization vector.  The data is passed to the worker
+        processes through the shared memory.  The value of the 'iv' attribute
+        changes in the same way as after calling the 'decrypt()' method.
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol).
+            workers: The number of worker processes (the default value is the
+              number of processors).
+
+        Returns:
+            Plaintext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid number of workers'): In
+              case of invalid value 'workers'.
+        """
+        return self._parallel_decrypt(data, workers, MODE_CBC)
+
+    def _decrypt_blocks(self, cipher_text: bytes, feedback: bytes) -> bytes:
+        decrypt = self._cipher_obj.decrypt
+        block_size = self.block_size
+        return _xor(feedback, b''.join([
+            decrypt(cipher_text[begin:begin + block_size])
+            for begin in range(0, len(cipher_text), block_size)
+        ]))
+
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        self._decrypt_feedback(data, out, self._decrypt_blocks)
+
+
+class GOST34132015Encryptor:
+    """
+    Class that implements the context of the stream encryption with padding.
+
+    The instance of this class is returned by the 'encryptor()' method of the
+    'GOST34132015ecb' and 'GOST34132015cbc' classes.  No more than one block of
+    the plaintext is kept between calls of the 'update()' method.
+
+    Methods:
+        update(): Encrypting the next part of the plaintext.
+        finalize(): Encrypting the rest of the plaintext with padding.
+    """
+
+    def __init__(self, cipher_obj: GOST34132015CipherPadding) -> None:
+        """
+        Initialize the context of the stream encryption.
+
+        Args:
+            cipher_obj: The cipher object in ECB or CBC mode.
+        """
+        self._cipher_obj = cipher_obj
+        self._buffer = bytearray()
+        self._data_size = 0
+        self._finalized = False
+
+    def update(self, data: Any) -> bytearray:
+        """
+        Encrypt the next part of the plaintext.
+
+        Args:
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Ciphertext of the complete blocks of the plaintext passed so far
+            (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        block_size = self._cipher_obj.block_size
+        with self._cipher_obj._get_data_view(
+                data, 'GOSTCipherError: invalid plaintext data') as data_view:
+            self._data_size += len(data_view)
+            size = len(self._buffer) + len(data_view)
+            result = bytearray(size - size % block_size)
+            with memoryview(result) as result_view:
+                begin = 0
+                offset = 0
+                if self._buffer and result:
+                    # Completing the block kept from the previous call.
+                    begin = block_size - len(self._buffer)
+                    offset = block_size
+                    self._buffer += data_view[:begin]
+                    self._cipher_obj._encrypt_blocks(memoryview(self._buffer), result_view[:offset])
+                    self._buffer.clear()
+                end = begin + len(result) - offset
+                self._cipher_obj._encrypt_blocks(data_view[begin:end], result_view[offset:])
+                self._buffer += data_view[end:]
+        return result
+
+    def finalize(self) -> bytearray:
+        """
+        Encrypt the rest of the plaintext with padding.
+
+        Returns:
+            Ciphertext of the rest of the plaintext (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        self._finalized = True
+        tail = self._buffer + self._cipher_obj._get_padding(self._data_size)
+        self._buffer.clear()
+        result = bytearray(len(tail))
+        with memoryview(tail) as tail_view, memoryview(result) as result_view:
+            self._cipher_obj._encrypt_blocks(tail_view, result_view)
+        return result
+
+
+class GOST34132015Decryptor:
+    """
+    Class that implements the context of the stream decryption with padding.
+
+    The instance of this class is returned by the 'decryptor()' method of the
+    'GOST34132015ecb' and 'GOST34132015cbc' classes.  No more than one block of
+    the ciphertext is kept between calls of the 'update()' method.
+
+    Methods:
+        update(): Decrypting the next part of the ciphertext.
+        finalize(): Completing the decryption.
+    """
+
+    def __init__(self, cipher_obj: GOST34132015CipherPadding) -> None:
+        """
+        Initialize the context of the stream decryption.
+
+        Args:
+            cipher_obj: The cipher object in ECB or CBC mode.
+        """
+        self._cipher_obj = cipher_obj
+        self._buffer = bytearray()
+        self._finalized = False
+
+    def update(self, data: Any) -> bytearray:
+        """
+        Decrypt the next part of the ciphertext.
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Plaintext of the complete blocks of the ciphertext passed so far
+            (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        block_size = self._cipher_obj.block_size
+        with self._cipher_obj._get_data_view(
+                data, 'GOSTCipherError: invalid ciphertext data') as data_view:
+            size = len(self._buffer) + len(data_view)
+            result = bytearray(size - size % block_size)
+            with memoryview(result) as result_view:
+                begin = 0
+                offset = 0
+                if self._buffer and result:
+                    # Completing the block kept from the previous call.
+                    begin = block_size - len(self._buffer)
+                    offset = block_size
+                    self._buffer += data_view[:begin]
+                    self._cipher_obj._decrypt_view(memoryview(self._buffer), result_view[:offset])
+                    self._buffer.clear()
+                end = begin + len(result) - offset
+                self._cipher_obj._decrypt_view(data_view[begin:end], result_view[offset:])
+                self._buffer += data_view[end:]
         return result
 
+    def finalize(self) -> bytearray:
+        """
+        Complete the decryption.
+
+        The incomplete last block of the ciphertext is discarded as in the
+        'decrypt()' method.
+
+        Returns:
+            An empty value of the bytearray type.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        self._finalized = True
+        self._buffer.clear()
+        return bytearray()
+
 
 class GOST34132015cfb(GOST34132015CipherFeedBack):
     """
@@ -697,17 +1417,7 @@ class GOST34132015cfb(GOST34132015CipherFeedBack):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        result = bytearray()
-        gamma = bytearray()
-        data = super().encrypt(data)
-        for i in range(self._get_num_block(data)):
-            gamma = self._get_gamma()
-            cipher_block = add_xor(gamma, self._get_block(data, i))
-            result = result + cipher_block
-            self._set_init_vect(cipher_block[0:self.block_size])
-        if len(data) % self.block_size != 0:
-            result = result + self._final_cipher(data)
-        return result
+        return self._encrypt_data(super().encrypt(data))
 
     def decrypt(self, data: bytearray) -> bytearray:
         """
@@ -723,17 +1433,60 @@ class GOST34132015cfb(GOST34132015CipherFeedBack):
             GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
               case where the ciphertext data is not byte object.
         """
-        result = bytearray()
-        gamma = bytearray()
-        data = super().decrypt(data)
-        for i in range(self._get_num_block(data)):
-            gamma = self._get_gamma()
-            cipher_block = self._get_block(data, i)
-            result = result + add_xor(gamma, cipher_block)
-            self._set_init_vect(cipher_block)
+        return self._decrypt_data(super().decrypt(data))
+
+    def _encrypt_view(self, data: memoryview, out: memoryview) -> None:
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        register = self._get_register()
+        for begin in range(0, self._get_num_block(data) * block_size, block_size):
+            block = _xor(encrypt(register.popleft()), data[begin:begin + block_size])
+            out[begin:begin + block_size] = block
+            register.append(block)
+        if len(data) % block_size != 0:
+            self._final_cipher(data, out, register[0])
+        self._set_register(register)
+
+    def parallel_decrypt(self, data: Any, workers: Optional[int] = None) -> bytearray:
+        """
+        Ciphertext decryption in CFB mode in a pool of worker processes.
+
+        The ciphertext is split into parts aligned to the block size, each
+        part is decrypted by a separate process with the preceding ciphertext
+        as the initialization vector.  The data is passed to the worker
+        processes through the shared memory.  The value of the 'iv' attribute
+        changes in the same way as after calling the 'decrypt()' method.
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol).
+            workers: The number of worker processes (the default value is the
+              number of processors).
+
+        Returns:
+            Plaintext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid number of workers'): In
+              case of invalid value 'workers'.
+        """
+        return self._parallel_decrypt(data, workers, MODE_CFB)
+
+    def _decrypt_blocks(self, cipher_text: bytes, feedback: bytes) -> bytes:
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        return _xor(cipher_text, b''.join([
+            encrypt(feedback[begin:begin + block_size])
+            for begin in range(0, len(feedback), block_size)
+        ]))
+
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        register = self._decrypt_feedback(data, out, self._decrypt_blocks)
         if len(data) % self.block_size != 0:
-            result = result + self._final_cipher(data)
-        return result
+            self._final_cipher(data, out, register)
 
 
 class GOST34132015ofb(GOST34132015CipherFeedBack):
@@ -769,17 +1522,7 @@ class GOST34132015ofb(GOST34132015CipherFeedBack):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        result = bytearray()
-        gamma = bytearray()
-        data = super().encrypt(data)
-        for i in range(self._get_num_block(data)):
-            gamma = self._get_gamma()
-            cipher_block = self._get_block(data, i)
-            result = result + add_xor(gamma, cipher_block)
-            self._set_init_vect(gamma[0:self.block_size])
-        if len(data) % self.block_size != 0:
-            result = result + self._final_cipher(data)
-        return result
+        return self._encrypt_data(super().encrypt(data))
 
     def decrypt(self, data: bytearray) -> bytearray:
         """
@@ -798,6 +1541,25 @@ class GOST34132015ofb(GOST34132015CipherFeedBack):
         super().decrypt(data)
         return self.encrypt(data)
 
+    def _encrypt_view(self, data: memoryview, out: memoryview) -> None:
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        register = self._get_register()
+        full_size = self._get_num_block(data) * block_size
+        for begin in range(0, full_size, _CHUNK_SIZE):
+            end = min(begin + _CHUNK_SIZE, full_size)
+            gamma = []
+            for _ in range((end - begin) // block_size):
+                register.append(encrypt(register.popleft()))
+                gamma.append(register[-1])
+            out[begin:end] = _xor(b''.join(gamma), data[begin:end])
+        if len(data) % block_size != 0:
+            self._final_cipher(data, out, register[0])
+        self._set_register(register)
+
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        self._encrypt_view(data, out)
+
 
 class GOST34132015ctr(GOST34132015Cipher):
     """
@@ -810,6 +1572,12 @@ class GOST34132015ctr(GOST34132015Cipher):
     Methods:
         decrypt(): Decrypting a ciphertext.
         encrypt(): Encrypting a plaintext.
+        seek(): Setting the position of the gamma.
+        encrypt_at(): Encrypting the data at the specified offset.
+        mac_encryptor(): Creating the context of the stream encryption with
+          authentication.
+        mac_decryptor(): Creating the context of the stream decryption with
+          authentication.
         clear(): Clearing the values of iterative cipher keys.
 
     Attributes:
@@ -837,15 +1605,7 @@ class GOST34132015ctr(GOST34132015Cipher):
         self._init_vect = bytearray(self._init_vect)
         self._counter = init_vect + b'\x00' * (self.block_size // 2)
         self._counter = bytearray(self._counter)
-
-    def _inc_ctr(self, ctr: bytearray) -> bytearray:
-        internal = 0
-        bit = bytearray(self.block_size)
-        bit[self.block_size - 1] = 0x01
-        for i in range(self.block_size):
-            internal = ctr[i] + bit[i] + (internal << 8)
-            ctr[i] = internal & 0xff
-        return ctr
+        self._skip = 0
 
     @property
     def counter(self) -> bytearray:
@@ -866,20 +1626,7 @@ class GOST34132015ctr(GOST34132015Cipher):
             GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
               case where the plaintext data is not byte object.
         """
-        result = bytearray()
-        gamma = bytearray()
-        data = super().encrypt(data)
-        for i in range(self._get_num_block(data)):
-            gamma = self._cipher_obj.encrypt(self._counter)
-            self._counter = self._inc_ctr(self._counter)
-            result = result + add_xor(self._get_block(data, i), gamma)
-        if len(data) % self.block_size != 0:
-            gamma = self._cipher_obj.encrypt(self._counter)
-            self._counter = self._inc_ctr(self._counter)
-            result = result + add_xor(
-                data[self.block_size * self._get_num_block(data)::], gamma
-            )
-        return result
+        return self._encrypt_data(super().encrypt(data))
 
     def decrypt(self, data: bytearray) -> bytearray:
         """
@@ -898,6 +1645,800 @@ class GOST34132015ctr(GOST34132015Cipher):
         data = super().decrypt(data)
         return self.encrypt(data)
 
+    def seek(self, offset: int) -> None:
+        """
+        Set the position of the gamma to the specified offset.
+
+        The counter block is calculated from the initialization vector and
+        the offset, so the next call of the 'encrypt()' (or 'decrypt()')
+        method processes the data located at this offset from the beginning
+        of the message.
+
+        Args:
+            offset: The offset from the beginning of the message in bytes.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid offset'): In case of
+              invalid value 'offset'.
+        """
+        self._counter[:] = self._get_counter(offset).to_bytes(self.block_size, byteorder='big')
+        self._skip = offset % self.block_size
+
+    def encrypt_at(self, offset: int, data: Any) -> bytearray:
+        """
+        Encrypt the data located at the specified offset of the message.
+
+        The counter block is calculated from the initialization vector and
+        the offset, the state of the ciphering object is not changed.  Since
+        encryption and decryption are the same in CTR mode, the method is
+        also used to decrypt any part of the ciphertext.
+
+        Args:
+            offset: The offset of the data from the beginning of the message
+              in bytes.
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Ciphertext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid offset'): In case of
+              invalid value 'offset'.
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol.
+        """
+        counter = self._get_counter(offset)
+        with self._get_data_view(data, 'GOSTCipherError: invalid plaintext data') as data_view:
+            result = bytearray(len(data_view))
+            with memoryview(result) as result_view:
+                self._apply_gamma(data_view, result_view, counter, offset % self.block_size)
+        return result
+
+    def mac_encryptor(self, mac_key: bytearray,
+                      mac_size: Optional[int] = None) -> 'GOST34132015MacEncryptor':
+        """
+        Return the context of the stream encryption with authentication.
+
+        The plaintext is encrypted in CTR mode and the MAC (GOST 34.13-2015)
+        is calculated over the ciphertext in the same pass over the data.
+
+        Args:
+            mac_key: The key of the MAC algorithm.
+            mac_size: Message authentication code size in bytes (the default
+              value is the block size).
+
+        Returns:
+            The instance of the 'GOST34132015MacEncryptor' class.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid key value'): In case of
+              invalid 'mac_key' value.
+            GOSTCipherError('GOSTCipherError: invalid message authentication
+              code size'): In case of the invalid message authentication code
+              size.
+        """
+        return GOST34132015MacEncryptor(self, mac_key, mac_size)
+
+    def mac_decryptor(self, mac_key: bytearray,
+                      mac_size: Optional[int] = None) -> 'GOST34132015MacDecryptor':
+        """
+        Return the context of the stream decryption with authentication.
+
+        The MAC (GOST 34.13-2015) is calculated over the ciphertext and the
+        ciphertext is decrypted in CTR mode in the same pass over the data.
+
+        Args:
+            mac_key: The key of the MAC algorithm.
+            mac_size: Message authentication code size in bytes (the default
+              value is the block size).
+
+        Returns:
+            The instance of the 'GOST34132015MacDecryptor' class.
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid key value'): In case of
+              invalid 'mac_key' value.
+            GOSTCipherError('GOSTCipherError: invalid message authentication
+              code size'): In case of the invalid message authentication code
+              size.
+        """
+        return GOST34132015MacDecryptor(self, mac_key, mac_size)
+
+    def _get_mac_oid(self) -> Optional[ObjectIdentifier]:
+        # The identifier of the encryption with authentication.
+        return None
+
+    def parallel_encrypt(self, data: Any, workers: Optional[int] = None) -> bytearray:
+        """
+        Plaintext encryption in CTR mode in a pool of worker processes.
+
+        The data is split into parts aligned to the block size, each part is
+        encrypted by a separate process with the counter block calculated
+        from its offset.  The data is passed to the worker processes through
+        the shared memory and encrypted there in place.  The state of the
+        ciphering object changes in the same way as after calling the
+        'encrypt()' method.
+
+        Args:
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+            workers: The number of worker processes (the default value is the
+              number of processors).
+
+        Returns:
+            Ciphertext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid number of workers'): In
+              case of invalid value 'workers'.
+        """
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            raise GOSTCipherError('GOSTCipherError: invalid number of workers')
+        with self._get_data_view(data, 'GOSTCipherError: invalid plaintext data') as data_view:
+            if workers is None:
+                workers = os.cpu_count() or 1
+            part_size = -(-len(data_view) // workers)
+            part_size = max(_CHUNK_SIZE, -(-part_size // self.block_size) * self.block_size)
+            if part_size >= len(data_view):
+                result = bytearray(len(data_view))
+                with memoryview(result) as result_view:
+                    self._encrypt_view(data_view, result_view)
+                return result
+            result = self._parallel_encrypt(data_view, part_size)
+        counter = int.from_bytes(self._counter, byteorder='big')
+        counter += -(-(self._skip + len(result)) // self.block_size)
+        counter &= (1 << (8 * self.block_size)) - 1
+        self._counter[:] = counter.to_bytes(self.block_size, byteorder='big')
+        self._skip = 0
+        return result
+
+    def _parallel_encrypt(self, data: memoryview, part_size: int) -> bytearray:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+        # pylint: enable=import-outside-toplevel
+        algorithm = 'kuznechik' if isinstance(self._cipher_obj, GOST34122015Kuznechik) else 'magma'
+        key, mode, kwargs = self._get_worker_args()
+        kwargs['init_vect'] = self._init_vect
+        counter = int.from_bytes(self._counter, byteorder='big')
+        mask = (1 << (8 * self.block_size)) - 1
+        shared = SharedMemory(create=True, size=len(data))
+        try:
+            shared.buf[:len(data)] = data
+            num_part = -(-len(data) // part_size)
+            with ProcessPoolExecutor(max_workers=num_part) as executor:
+                futures = [
+                    executor.submit(
+                        _ctr_parallel_part, algorithm, key, mode, kwargs, shared.name,
+                        begin, min(begin + part_size, len(data)),
+                        (counter + (self._skip + begin) // self.block_size) & mask,
+                        (self._skip + begin) % self.block_size
+                    ) for begin in range(0, len(data), part_size)
+                ]
+                for future in futures:
+                    future.result()
+            result = bytearray(shared.buf[:len(data)])
+        finally:
+            key = zero_fill(key)
+            shared.close()
+            shared.unlink()
+        return result
+
+    def _get_worker_args(self) -> tuple:
+        # The key, the mode and the arguments of the 'new()' function to
+        # create the same ciphering object in the worker process.
+        return self._cipher_obj._get_key(), MODE_CTR, {}
+
+    def _get_counter(self, offset: int) -> int:
+        if not isinstance(offset, int) or offset < 0:
+            raise GOSTCipherError('GOSTCipherError: invalid offset')
+        counter = int.from_bytes(self._init_vect, byteorder='big') << (4 * self.block_size)
+        return (counter + offset // self.block_size) & ((1 << (8 * self.block_size)) - 1)
+
+    def _apply_gamma(self, data: memoryview, out: memoryview, counter: int, skip: int) -> int:
+        # XOR of the data with the gamma starting from the byte 'skip' of the
+        # counter block 'counter', returns the next unused counter block.
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        mask = (1 << (8 * block_size)) - 1
+        start = 0
+        if skip and data:
+            start = min(block_size - skip, len(data))
+            gamma = encrypt(counter.to_bytes(block_size, byteorder='big'))
+            out[:start] = _xor(data[:start], gamma[skip:skip + start])
+            counter = (counter + 1) & mask
+        for begin in range(start, len(data), _CHUNK_SIZE):
+            end = min(begin + _CHUNK_SIZE, len(data))
+            num_block = -(-(end - begin) // block_size)
+            gamma = b''.join([
+                encrypt(((counter + i) & mask).to_bytes(block_size, byteorder='big'))
+                for i in range(num_block)
+            ])
+            counter = (counter + num_block) & mask
+            out[begin:end] = _xor(data[begin:end], gamma[:end - begin])
+        return counter
+
+    def _encrypt_view(self, data: memoryview, out: memoryview) -> None:
+        counter = int.from_bytes(self._counter, byteorder='big')
+        counter = self._apply_gamma(data, out, counter, self._skip)
+        self._counter[:] = counter.to_bytes(self.block_size, byteorder='big')
+        self._skip = 0
+
+    def _decrypt_view(self, data: memoryview, out: memoryview) -> None:
+        self._encrypt_view(data, out)
+
+
+class GOST34132015ctracpkm(GOST34132015ctr):
+    """
+    Class that implements CTR-ACPKM mode of block encryption.
+
+    The mode is described in R 1323565.1.017-2018.  The data is divided into
+    sections of 'section_size' bytes and the key of each next section is
+    derived from the key of the previous one by the ACPKM transformation.  The
+    counter block is not reset at the section boundaries.  The new key is
+    expanded into the existing block cipher object, so the change of the
+    section is as cheap as a key schedule.
+
+    This class is the subclass of the 'GOST34132015ctr' class and inherits
+    the 'clear()', 'encrypt()', 'decrypt()', 'seek()',
+    'parallel_encrypt()', 'mac_encryptor()' and 'mac_decryptor()' methods and
+    the 'block_size' and 'counter' attributes.
+
+    Attributes:
+        block_size: An integer value the internal block size of the cipher
+          algorithm in bytes.
+        counter: The counter block value.
+        section_size: An integer value the section size in bytes.
+    """
+
+    def __init__(self, algorithm: str, key: bytearray,
+                 init_vect: bytearray, section_size: int) -> None:
+        """
+        Initialize the ciphering object in CTR-ACPKM mode.
+
+        Args:
+            algorithm: The string with the name of the ciphering algorithm.
+            key: Encryption key.
+            init_vect: Initialization vector value.
+            section_size: The size of the section in bytes.
+        """
+        self._acpkm_key = bytearray(key) if isinstance(key, (bytes, bytearray)) else bytearray()
+        super().__init__(algorithm, key, init_vect)
+        if (not isinstance(section_size, int) or section_size <= 0
+                or section_size % self.block_size != 0):
+            self.clear()
+            raise GOSTCipherError('GOSTCipherError: invalid section size')
+        self._section_size = section_size
+        self._section = 0
+        self.oid = ObjectIdentifier(str(self._cipher_obj.oid) + '.1')
+
+    @property
+    def section_size(self) -> int:
+        """Return the section size in bytes."""
+        return self._section_size
+
+    def _set_section(self, section: int) -> None:
+        # Derivation of the key of the section: the keys of the sections
+        # are computed forward from the initial key.
+        if section < self._section:
+            self._cipher_obj._rekey(bytearray(self._acpkm_key))
+            self._section = 0
+        encrypt = self._cipher_obj.encrypt
+        while self._section < section:
+            key = bytearray(b''.join([
+                encrypt(_ACPKM_D[i:i + self.block_size])
+                for i in range(0, len(_ACPKM_D), self.block_size)
+            ]))
+            self._cipher_obj._rekey(key)
+            key = zero_fill(key)
+            self._section += 1
+
+    def _apply_gamma(self, data: memoryview, out: memoryview, counter: int, skip: int) -> int:
+        block_size = self.block_size
+        section_block = self._section_size // block_size
+        mask = (1 << (8 * block_size)) - 1
+        first_counter = int.from_bytes(self._init_vect, byteorder='big') << (4 * block_size)
+        begin = 0
+        while begin < len(data):
+            index = (counter - first_counter) & mask
+            self._set_section(index // section_block)
+            end = min(len(data), begin + (section_block - index % section_block) * block_size - skip)
+            counter = super()._apply_gamma(data[begin:end], out[begin:end], counter, skip)
+            skip = 0
+            begin = end
+        return counter
+
+    def encrypt_at(self, offset: int, data: Any) -> bytearray:
+        """
+        Encrypt the data located at the specified offset of the message.
+
+        The counter block and the key of the section are calculated from the
+        initialization vector and the offset.  The key of the current section
+        is restored after the call, so the state of the ciphering object is
+        not changed and the calls of the 'encrypt()' and 'decrypt()' methods
+        can be mixed with the calls of this method.
+
+        Args:
+            offset: The offset of the data from the beginning of the message
+              in bytes.
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Ciphertext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid offset'): In case of
+              invalid value 'offset'.
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol.
+        """
+        section = self._section
+        key = self._cipher_obj._get_key()
+        try:
+            return super().encrypt_at(offset, data)
+        finally:
+            if self._section != section:
+                self._cipher_obj._rekey(key)
+                self._section = section
+            key = zero_fill(key)
+
+    def _get_worker_args(self) -> tuple:
+        return (
+            bytearray(self._acpkm_key), MODE_CTR_ACPKM, {'section_size': self._section_size}
+        )
+
+    def _get_mac_oid(self) -> Optional[ObjectIdentifier]:
+        return ObjectIdentifier(str(self._cipher_obj.oid) + '.2')
+
+    def clear(self) -> None:
+        """Сlearing the values of iterative encryption keys."""
+        if hasattr(self, '_acpkm_key'):
+            self._acpkm_key[:] = bytes(len(self._acpkm_key))
+        super().clear()
+
+
+class GOST34132015MacEncryptor:
+    """
+    Class that implements the context of the stream encryption with MAC.
+
+    The instance of this class is returned by the 'mac_encryptor()' method of
+    the 'GOST34132015ctr' and 'GOST34132015ctracpkm' classes.  The data is
+    encrypted by chunks and each chunk of the ciphertext is passed to the MAC
+    while it is in the cache (encrypt-then-MAC).  The parts of the data of any
+    size can be passed to the 'update()' method.
+
+    Methods:
+        update(): Encrypting the next part of the plaintext.
+        finalize(): Calculating the message authentication code.
+
+    Attributes:
+        oid: The identifier of the encryption with authentication (for the
+          CTR-ACPKM mode) or None.
+    """
+
+    def __init__(self, cipher_obj: GOST34132015ctr, mac_key: bytearray,
+                 mac_size: Optional[int]) -> None:
+        """
+        Initialize the context of the stream encryption with MAC.
+
+        Args:
+            cipher_obj: The cipher object in CTR or CTR-ACPKM mode.
+            mac_key: The key of the MAC algorithm.
+            mac_size: Message authentication code size in bytes.
+        """
+        if mac_size is None:
+            mac_size = cipher_obj.block_size
+        if not isinstance(mac_size, int) or not 0 < mac_size <= cipher_obj.block_size:
+            raise GOSTCipherError('GOSTCipherError: invalid message authentication code size')
+        algorithm = (
+            'kuznechik' if isinstance(cipher_obj._cipher_obj, GOST34122015Kuznechik) else 'magma'
+        )
+        self._mac_obj = new(algorithm, mac_key, MODE_MAC)
+        self._cipher_obj = cipher_obj
+        self._mac_size = mac_size
+        self._finalized = False
+        self.oid = cipher_obj._get_mac_oid()
+
+    def update(self, data: Any) -> bytearray:
+        """
+        Encrypt the next part of the plaintext.
+
+        Args:
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Ciphertext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        return self._process(data, 'GOSTCipherError: invalid plaintext data', True)
+
+    def finalize(self) -> bytearray:
+        """
+        Calculate the message authentication code of the ciphertext.
+
+        Returns:
+            Message authentication code value (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        return self._get_mac()
+
+    def _process(self, data: Any, message: str, encrypt: bool) -> bytearray:
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        cipher_obj = self._cipher_obj
+        block_size = cipher_obj.block_size
+        with cipher_obj._get_data_view(data, message) as data_view:
+            result = bytearray(len(data_view))
+            with memoryview(result) as result_view:
+                for begin in range(0, len(data_view), _CHUNK_SIZE):
+                    end = min(begin + _CHUNK_SIZE, len(data_view))
+                    if not encrypt:
+                        self._mac_obj.update(data_view[begin:end])
+                    # The counter block and the offset in it are kept in the
+                    # cipher object, so the parts may be of any size.
+                    counter = int.from_bytes(cipher_obj._counter, byteorder='big')
+                    skip = cipher_obj._skip
+                    cipher_obj._apply_gamma(
+                        data_view[begin:end], result_view[begin:end], counter, skip
+                    )
+                    counter += (skip + end - begin) // block_size
+                    counter &= (1 << (8 * block_size)) - 1
+                    cipher_obj._counter[:] = counter.to_bytes(block_size, byteorder='big')
+                    cipher_obj._skip = (skip + end - begin) % block_size
+                    if encrypt:
+                        self._mac_obj.update(result_view[begin:end])
+        return result
+
+    def _get_mac(self) -> bytearray:
+        if self._finalized:
+            raise GOSTCipherError('GOSTCipherError: context already finalized')
+        self._finalized = True
+        result = self._mac_obj.digest(self._mac_size)
+        self._mac_obj.clear()
+        return result
+
+
+class GOST34132015MacDecryptor(GOST34132015MacEncryptor):
+    """
+    Class that implements the context of the stream decryption with MAC.
+
+    The instance of this class is returned by the 'mac_decryptor()' method of
+    the 'GOST34132015ctr' and 'GOST34132015ctracpkm' classes.  The ciphertext
+    is passed to the MAC and decrypted by chunks.  The plaintext returned by
+    the 'update()' method must not be used until the 'finalize()' method has
+    verified the message authentication code.
+
+    Methods:
+        update(): Decrypting the next part of the ciphertext.
+        finalize(): Verifying the message authentication code.
+
+    Attributes:
+        oid: The identifier of the encryption with authentication (for the
+          CTR-ACPKM mode) or None.
+    """
+
+    def update(self, data: Any) -> bytearray:
+        """
+        Decrypt the next part of the ciphertext.
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol).
+
+        Returns:
+            Plaintext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol or is a non-contiguous 'memoryview'.
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        return self._process(data, 'GOSTCipherError: invalid ciphertext data', False)
+
+    def finalize(self, mac: Any) -> bytearray:  # pylint: disable=arguments-differ
+        """
+        Verify the message authentication code of the ciphertext.
+
+        Args:
+            mac: The expected message authentication code.
+
+        Returns:
+            Message authentication code value (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid authentication tag'): In
+              case where the message authentication code does not match the
+              ciphertext.
+            GOSTCipherError('GOSTCipherError: context already finalized'): In
+              case where the context has already been finalized.
+        """
+        result = self._get_mac()
+        if (not isinstance(mac, (bytes, bytearray))
+                or not hmac.compare_digest(bytes(mac), bytes(result))):
+            raise GOSTCipherError('GOSTCipherError: invalid authentication tag')
+        return result
+
+
+class GOST34132015mgm(GOST34132015):
+    """
+    Class that implements MGM mode of authenticated encryption.
+
+    The mode (Multilinear Galois Mode) is described in R 1323565.1.026-2019.
+    The data is encrypted in counter mode and authenticated together with the
+    associated data in the same pass.  The products in the field GF(2^128)
+    (GF(2^64) for 'magma') are calculated as integer products of the values
+    with the bits spread to separate bytes and are reduced by the field
+    polynomial once for the whole message.
+
+    This class is the subclass of the 'GOST3413205' class and inherits the
+    'clear()' method and the 'block_size' attribute.
+
+    Methods:
+        encrypt_and_digest(): Encrypting and authenticating the data.
+        decrypt_and_verify(): Verifying and decrypting the data.
+        clear(): Clearing the values of iterative cipher keys.
+
+    Attributes:
+        block_size: An integer value the internal block size of the cipher
+          algorithm in bytes.
+        nonce: The nonce value.
+        tag_size: An integer value the size of the authentication tag in bytes.
+    """
+
+    def __init__(self, algorithm: str, key: bytearray, nonce: bytearray,
+                 tag_size: Optional[int]) -> None:
+        """
+        Initialize the ciphering object in MGM mode.
+
+        Args:
+            algorithm: The string with the name of the ciphering algorithm.
+            key: Encryption key.
+            nonce: The nonce value (the length is equal to the block size, the
+              most significant bit is zero).
+            tag_size: The size of the authentication tag in bytes (the default
+              value is the block size).
+        """
+        super().__init__(algorithm, key)
+        if (not isinstance(nonce, (bytes, bytearray)) or len(nonce) != self.block_size
+                or nonce[0] & 0x80):
+            self.clear()
+            raise GOSTCipherError('GOSTCipherError: invalid nonce value')
+        if tag_size is None:
+            tag_size = self.block_size
+        if not isinstance(tag_size, int) or not 4 <= tag_size <= self.block_size:
+            self.clear()
+            raise GOSTCipherError('GOSTCipherError: invalid tag size')
+        self._nonce = bytearray(nonce)
+        self._tag_size = tag_size
+
+    @property
+    def nonce(self) -> bytearray:
+        """Return the nonce value."""
+        return self._nonce
+
+    @property
+    def tag_size(self) -> int:
+        """Return the size of the authentication tag in bytes."""
+        return self._tag_size
+
+    def encrypt_and_digest(self, data: Any,
+                           associated_data: Any = b'') -> Tuple[bytearray, bytearray]:
+        """
+        Encrypt and authenticate the data in MGM mode.
+
+        Args:
+            data: Plaintext data to be encrypted (as an object that supports
+              the buffer protocol).
+            associated_data: The data that is authenticated but not encrypted
+              (as an object that supports the buffer protocol).
+
+        Returns:
+            The tuple with the ciphertext and the authentication tag (as byte
+            objects).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid plaintext data'): In
+              case where the plaintext data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid associated data'): In
+              case where the associated data does not support the buffer
+              protocol.
+        """
+        with self._get_data_view(data, 'GOSTCipherError: invalid plaintext data') as data_view, \
+                self._get_data_view(associated_data, 'GOSTCipherError: invalid associated data') as ad_view:
+            result = bytearray(len(data_view))
+            with memoryview(result) as result_view:
+                tag = self._mgm(data_view, result_view, ad_view, result_view)
+        return result, tag
+
+    def decrypt_and_verify(self, data: Any, tag: Any,
+                           associated_data: Any = b'') -> bytearray:
+        """
+        Verify and decrypt the data in MGM mode.
+
+        Args:
+            data: Ciphertext data to be decrypted (as an object that supports
+              the buffer protocol).
+            tag: The authentication tag.
+            associated_data: The data that is authenticated but not encrypted
+              (as an object that supports the buffer protocol).
+
+        Returns:
+            Plaintext data (as a byte object).
+
+        Raises:
+            GOSTCipherError('GOSTCipherError: invalid ciphertext data'): In
+              case where the ciphertext data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid associated data'): In
+              case where the associated data does not support the buffer
+              protocol.
+            GOSTCipherError('GOSTCipherError: invalid authentication tag'): In
+              case where the authentication tag does not match the data.
+        """
+        with self._get_data_view(data, 'GOSTCipherError: invalid ciphertext data') as data_view, \
+                self._get_data_view(associated_data, 'GOSTCipherError: invalid associated data') as ad_view:
+            result = bytearray(len(data_view))
+            with memoryview(result) as result_view:
+                expected_tag = self._mgm(data_view, result_view, ad_view, data_view)
+        if (not isinstance(tag, (bytes, bytearray))
+                or not hmac.compare_digest(bytes(tag), bytes(expected_tag))):
+            result[:] = bytes(len(result))
+            raise GOSTCipherError('GOSTCipherError: invalid authentication tag')
+        return result
+
+    def _update_mgm_sum(self, data: memoryview, counter_z: int,
+                        result: int) -> Tuple[int, int]:
+        # Adds the products H_i * X_i (H_i = E(Z_i)) for the blocks of the
+        # data to the sum and returns the next counter Z_i and the sum.  The
+        # last block is padded with zeros.  The sum is kept in the spread form
+        # without the reduction (see _gf_spread()).
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        step = 1 << 4 * block_size
+        block_mask = (1 << 8 * block_size) - 1
+        num_block = -(-len(data) // block_size)
+        h_blocks = b''.join([
+            encrypt(((counter_z + i * step) & block_mask).to_bytes(block_size, byteorder='big'))
+            for i in range(num_block)
+        ])
+        x_blocks = data.tobytes() + bytes(-len(data) % block_size)
+        spread = _gf_spread
+        for begin in range(0, len(x_blocks), block_size):
+            result ^= spread(h_blocks[begin:begin + block_size]) * spread(
+                x_blocks[begin:begin + block_size]
+            ) & _GF_SPREAD_MASK[block_size]
+        return (counter_z + num_block * step) & block_mask, result
+
+    def _mgm(self, data: memoryview, out: memoryview,
+             associated_data: memoryview, cipher_text: memoryview) -> bytearray:
+        # Encryption of the data with the gamma E(Y_i) and calculation of the
+        # authentication tag E(sum(H_i * A_i) + sum(H_i * C_i) +
+        # H * (len(A) || len(C))).  'cipher_text' is 'out' when encrypting
+        # and 'data' when decrypting.
+        encrypt = self._cipher_obj.encrypt
+        block_size = self.block_size
+        half_mask = (1 << 4 * block_size) - 1
+        nonce = int.from_bytes(self._nonce, byteorder='big')
+        counter_y = int.from_bytes(
+            encrypt(nonce.to_bytes(block_size, byteorder='big')), byteorder='big'
+        )
+        counter_z = int.from_bytes(
+            encrypt((nonce | 1 << (8 * block_size - 1)).to_bytes(block_size, byteorder='big')),
+            byteorder='big'
+        )
+        y_high = counter_y & ~half_mask
+        y_low = counter_y & half_mask
+        result = 0
+        for begin in range(0, len(associated_data), _CHUNK_SIZE):
+            counter_z, result = self._update_mgm_sum(
+                associated_data[begin:begin + _CHUNK_SIZE], counter_z, result
+            )
+        for begin in range(0, len(data), _CHUNK_SIZE):
+            end = min(begin + _CHUNK_SIZE, len(data))
+            num_block = -(-(end - begin) // block_size)
+            gamma = b''.join([
+                encrypt((y_high | (y_low + i) & half_mask).to_bytes(block_size, byteorder='big'))
+                for i in range(num_block)
+            ])
+            y_low = (y_low + num_block) & half_mask
+            out[begin:end] = _xor(data[begin:end], gamma[:end - begin])
+            counter_z, result = self._update_mgm_sum(cipher_text[begin:end], counter_z, result)
+        length = (8 * len(associated_data) << 4 * block_size) | 8 * len(data)
+        with memoryview(length.to_bytes(block_size, byteorder='big')) as length_view:
+            counter_z, result = self._update_mgm_sum(length_view, counter_z, result)
+        tag = encrypt(_gf_reduce(_gf_gather(result, block_size), block_size).to_bytes(
+            block_size, byteorder='big'
+        ))
+        return bytearray(tag[:self._tag_size])
+
+
+def _gf_spread(block: bytes) -> int:
+    # Spreads the bits of the block to the separate bytes, so that the integer
+    # product of two spread values contains in each byte the number of the
+    # pairs of bits of the carry-less product (at most 128, i.e. without the
+    # carry to the next byte).  The least significant bit of each byte is the
+    # bit of the carry-less product.
+    return int.from_bytes(
+        format(int.from_bytes(block, byteorder='big'), _GF_SPREAD_FORMAT[len(block)]).encode(),
+        byteorder='big'
+    ) - _GF_SPREAD_ZERO[len(block)]
+
+
+def _gf_gather(value: int, block_size: int) -> int:
+    # Collects the bits of the carry-less product from the spread form.
+    return int((value + _GF_SPREAD_ZERO[2 * block_size]).to_bytes(
+        16 * block_size, byteorder='big'
+    ), 2)
+
+
+def _gf_reduce(value: int, block_size: int) -> int:
+    # Reduction of the carry-less product modulo the polynomial of the field
+    # GF(2^n).  The degree of the low part of the polynomial is less than 8,
+    # so two steps are enough.
+    bits = 8 * block_size
+    mask = (1 << bits) - 1
+    for _ in range(2):
+        high = value >> bits
+        value &= mask
+        for i in range(8):
+            if _GF_POLY[block_size] >> i & 1:
+                value ^= high << i
+    return value
+
+
+def _ctr_parallel_part(algorithm: str, key: bytearray, mode: int, kwargs: dict,
+                       name: str, begin: int, end: int, counter: int, skip: int) -> None:
+    # pylint: disable=too-many-arguments
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing.shared_memory import SharedMemory
+    # pylint: enable=import-outside-toplevel
+    cipher_obj = new(algorithm, bytearray(key), mode, **kwargs)
+    shared = SharedMemory(name=name)
+    try:
+        with shared.buf[begin:end] as part:
+            cipher_obj._apply_gamma(part, part, counter, skip)
+    finally:
+        shared.close()
+        cipher_obj.clear()
+
+
+def _feedback_parallel_part(algorithm: str, key: bytearray, mode: int, name: str,
+                            register_size: int, size: int, begin: int, end: int) -> None:
+    # pylint: disable=too-many-arguments
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing.shared_memory import SharedMemory
+    # pylint: enable=import-outside-toplevel
+    shared = SharedMemory(name=name)
+    try:
+        cipher_obj = new(algorithm, bytearray(key), mode,
+                         init_vect=bytearray(shared.buf[begin:begin + register_size]))
+        with shared.buf[register_size + begin:register_size + end] as part, \
+                shared.buf[register_size + size + begin:register_size + size + end] as out:
+            cipher_obj._decrypt_view(part, out)
+        cipher_obj.clear()
+    finally:
+        shared.close()
+
 
 class GOST34132015mac(GOST34132015):
     """
@@ -932,10 +2473,8 @@ class GOST34132015mac(GOST34132015):
         super().__init__(algorithm, key)
         value_r = self._cipher_obj.encrypt(bytearray(self._cipher_obj.block_size * b'\x00'))
         self._key_1, self._key_2 = self._get_mac_key(value_r)
-        self._fin_buff = bytearray()
         self._iter_buf = bytearray()
-        self._prev_mac = bytearray(self._cipher_obj.block_size)
-        self._cur_mac = bytearray(self._cipher_obj.block_size)
+        self._cur_mac = 0
         if data != bytearray(b''):
             self.update(data)
 
@@ -946,83 +2485,71 @@ class GOST34132015mac(GOST34132015):
             result = data + b'\x80' + b'\x00' * (self._get_pad_size(data) - 1)
         return result
 
-    def _get_mac_key(self, value_r):
-        value_b = b''
-        if self.block_size == 16:
-            value_b = _B_128
-        elif self.block_size == 8:
-            value_b = _B_64
-        if msb(value_r) == 0:
-            int_value = bytearray_to_int(value_r) << 1
-            key_1 = int_to_bytearray(int_value, self.block_size)
-        else:
-            int_value = bytearray_to_int(value_r) << 1
-            key_1 = add_xor(int_to_bytearray(int_value, self.block_size), value_b)
-        if msb(key_1) == 0:
-            int_value = bytearray_to_int(key_1) << 1
-            key_2 = int_to_bytearray(int_value, self.block_size)
-        else:
-            int_value = bytearray_to_int(key_1) << 1
-            key_2 = add_xor(int_to_bytearray(int_value, self.block_size), value_b)
-        return [key_1, key_2]
-
-    def update(self, data: bytearray) -> None:
+    def _get_mac_key(self, value_r: bytearray) -> Tuple[int, int]:
+        # The keys K1 and K2 are the values R * x and R * x^2 in the field
+        # GF(2^n) (the shift to the left with the reduction by B).
+        bits = 8 * self.block_size
+        mask = (1 << bits) - 1
+        value_b = int.from_bytes(_B_128 if self.block_size == 16 else _B_64, byteorder='big')
+        value = int.from_bytes(value_r, byteorder='big')
+        key_1 = (value << 1) & mask ^ (value_b if value >> (bits - 1) else 0)
+        key_2 = (key_1 << 1) & mask ^ (value_b if key_1 >> (bits - 1) else 0)
+        return key_1, key_2
+
+    def update(self, data: Any) -> None:
         """
         Update the MAC object with the bytes-like object.
 
+        Only the last block of the data passed so far is kept between calls,
+        the data is read through the 'memoryview' without copying.
+
         Args:
-            data: The data from which to get the MAC (as a byte object).
-              Repeated calls are equivalent to a single call with the
-              concatenation of all the arguments: 'm.update(a)'; 'm.update(b)'
-              is equivalent to 'm.update(a+b)'.
+            data: The data from which to get the MAC (as an object that
+              supports the buffer protocol).  Repeated calls are equivalent to
+              a single call with the concatenation of all the arguments:
+              'm.update(a)'; 'm.update(b)' is equivalent to 'm.update(a+b)'.
 
         Raises:
             GOSTCipherError('GOSTCipherError: invalid text data'): In case
-              where the text data is not byte object.
+              where the text data does not support the buffer protocol or is
+              a non-contiguous 'memoryview'.
         """
-        if not isinstance(data, (bytes, bytearray)):
-            self.clear()
-            raise GOSTCipherError('GOSTCipherError: invalid text data')
-        data = self._iter_buf + data
-        block = bytearray()
-        prev_block = self._cur_mac
-        for i in range(0, self._get_num_block(data) - 1):
-            block = self._cipher_obj.encrypt(add_xor(prev_block, self._get_block(data, i)))
-            prev_block = block
-        if self._get_pad_size(data) == 0:
-            block = (
-                self._cipher_obj.encrypt(
-                    add_xor(prev_block, data[len(data) - self.block_size:len(data)])
-                )
-            )
-            self._cur_mac = block
-            self._prev_mac = prev_block
-            self._iter_buf = bytearray(b'')
-        else:
-            begin_data = len(data) - 2 * self.block_size + self._get_pad_size(data)
-            end_data = len(data) - self.block_size + self._get_pad_size(data)
-            block = (
-                self._cipher_obj.encrypt(
-                    add_xor(prev_block, data[begin_data:end_data])
+        with self._get_data_view(data, 'GOSTCipherError: invalid text data') as data_view:
+            if not data_view:
+                return
+            block_size = self.block_size
+            encrypt = self._cipher_obj._encrypt_int
+            from_bytes = int.from_bytes
+            cur_mac = self._cur_mac
+            begin = 0
+            if self._iter_buf:
+                # Completing the block kept from the previous call, it is
+                # processed only if it is not the last one.
+                begin = block_size - len(self._iter_buf)
+                self._iter_buf += data_view[:begin]
+                if begin >= len(data_view):
+                    return
+                cur_mac = encrypt(cur_mac ^ from_bytes(self._iter_buf, byteorder='big'))
+            # The last block (complete or not) is kept until 'mac_final()',
+            # since it is processed with the final key.
+            end = begin + (len(data_view) - begin - 1) // block_size * block_size
+            for block_begin in range(begin, end, block_size):
+                cur_mac = encrypt(
+                    cur_mac ^ from_bytes(data_view[block_begin:block_begin + block_size], byteorder='big')
                 )
-            )
-            self._cur_mac = block
-            self._prev_mac = block
-            self._iter_buf = data[len(data) - self.block_size + self._get_pad_size(data):]
-        self._fin_buff = data[self.block_size * (self._get_num_block(data) - 1):]
+            self._cur_mac = cur_mac
+            self._iter_buf[:] = data_view[end:]
 
     def mac_final(self) -> bytearray:
         """Return the final value of the MAC."""
-        if self._get_pad_size(self._fin_buff) == 0:
+        if len(self._iter_buf) == self.block_size:
             final_key = self._key_1
+            final_block = self._iter_buf
         else:
             final_key = self._key_2
-            self._fin_buff = self._set_pad_mode_3(self._fin_buff[self.block_size:])
-        result = bytearray()
-        result = self._cipher_obj.encrypt(
-            add_xor(add_xor(self._fin_buff, self._prev_mac), final_key)
-        )
-        return result
+            final_block = self._set_pad_mode_3(self._iter_buf)
+        value = int.from_bytes(final_block, byteorder='big') ^ self._cur_mac ^ final_key
+        return bytearray(self._cipher_obj._encrypt_int(value).to_bytes(self.block_size, byteorder='big'))
 
     def digest(self, mac_size: int) -> bytearray:
         """
@@ -1030,7 +2557,8 @@ class GOST34132015mac(GOST34132015):
 
         This method can be called after applying the 'update ()' method, or
         after calling the 'new ()' function with the data passed to it for MAC
-        calculation.
+        calculation.  The state of the MAC object is not changed, so the
+        'update()' method can be called after this method.
 
         Args:
             mac_size: Message authentication code size (in bytes).
@@ -1043,11 +2571,16 @@ class GOST34132015mac(GOST34132015):
               code size'): In case of the invalid message authentication code
               size.
         """
-        temp = deepcopy(self)
-        if mac_size > temp.block_size:
-            temp.clear()
+        if mac_size > self.block_size:
             raise GOSTCipherError('GOSTCipherError: invalid message authentication code size')
-        return temp.mac_final()[0:mac_size:]
+        return self.mac_final()[0:mac_size:]
+
+    def clear(self) -> None:
+        """Сlearing the values of iterative encryption keys and MAC keys."""
+        if hasattr(self, '_iter_buf'):
+            self._key_1 = self._key_2 = self._cur_mac = 0
+            self._iter_buf[:] = bytes(len(self._iter_buf))
+        super().clear()
 
     def hexdigest(self, mac_size: int) -> str:
         """
@@ -9,11 +9,24 @@ several general functions.
 
 from .gost_34_11_2012 import (
     GOST34112012,
+    GOST34112012State,
+    GOST34112012Tree,
+    AsyncGOST34112012,
     new,
+    hash_buffer,
+    hash_file,
+    hash_many,
+    hash_batch,
+    async_hash_stream,
     GOSTHashError
 )
 
 __all__ = (
     'new',
+    'hash_buffer',
+    'hash_file',
+    'hash_many',
+    'hash_batch',
+    'async_hash_stream',
     'GOSTHashError'
 )
@@ -14,8 +14,6 @@ class and 'GOSTHMACError' class and several general functions.
 """
 # pylint: enable=duplicate-code
 
-from copy import deepcopy
-
 from gostcrypto.gosthash import GOST34112012
 from gostcrypto.utils import zero_fill
 from gostcrypto.utils import add_xor
@@ -199,7 +197,12 @@ class R5011132016:
         This can be used to efficiently compute the digests of data sharing
         a common initial substring.
         """
-        return deepcopy(self)
+        result = R5011132016.__new__(R5011132016)
+        result.oid = self.oid
+        result._key = bytearray(self._key)
+        result._hasher_obj = self._hasher_obj.copy()
+        result._counter = self._counter
+        return result
 
     def reset(self) -> None:
         """Reset the values of all class attributes."""
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import pytest
 
@@ -189,6 +191,54 @@ class TestKuznechik(unittest.TestCase):
         test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
         self.assertEqual(test_cipher.encrypt(self.ENCRYPT_TEST_STRING), self.DECRYPT_TEST_STRING)
 
+    def test_encrypt_random(self):
+        test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
+        for _ in range(16):
+            test_data = bytearray(os.urandom(16))
+            test_result = bytearray(test_data)
+            for i in range(9):
+                test_result = bytearray(a ^ b for a, b in zip(test_result, test_cipher._cipher_iter_key[i]))
+                test_result = gostcrypto.gostcipher.GOST34122015Kuznechik._cipher_s(test_result)
+                test_result = gostcrypto.gostcipher.GOST34122015Kuznechik._cipher_l(test_result)
+            test_result = bytearray(a ^ b for a, b in zip(test_result, test_cipher._cipher_iter_key[9]))
+            self.assertEqual(test_cipher.encrypt(test_data), test_result)
+            self.assertEqual(test_cipher.encrypt(bytes(test_data)), test_result)
+
+    def test_decrypt_random(self):
+        test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
+        for _ in range(16):
+            test_data = bytearray(os.urandom(16))
+            test_result = bytearray(a ^ b for a, b in zip(test_data, test_cipher._cipher_iter_key[9]))
+            for i in range(8, -1, -1):
+                test_result = gostcrypto.gostcipher.GOST34122015Kuznechik._cipher_l_reverse(test_result)
+                test_result = gostcrypto.gostcipher.GOST34122015Kuznechik._cipher_s_reverse(test_result)
+                test_result = bytearray(a ^ b for a, b in zip(test_result, test_cipher._cipher_iter_key[i]))
+            self.assertEqual(test_cipher.decrypt(test_data), test_result)
+            self.assertEqual(test_cipher.decrypt(test_cipher.encrypt(test_data)), test_data)
+
+    def test_key_cache(self):
+        test_key_cache = gostcrypto.gostcipher.gost_34_12_2015._KEY_CACHE
+        gostcrypto.gostcipher.set_key_cache_size(1)
+        try:
+            test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
+            test_schedule = list(test_key_cache._items.values())[0]
+            test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
+            self.assertEqual(test_cipher.encrypt(self.ENCRYPT_TEST_STRING), self.DECRYPT_TEST_STRING)
+            self.assertEqual(test_cipher.decrypt(self.DECRYPT_TEST_STRING), self.ENCRYPT_TEST_STRING)
+            test_cipher.clear()
+            test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
+            self.assertEqual(test_cipher.encrypt(self.ENCRYPT_TEST_STRING), self.DECRYPT_TEST_STRING)
+            self.assertNotEqual(test_schedule, bytearray(len(test_schedule)))
+            gostcrypto.gostcipher.GOST34122015Kuznechik(bytearray(32))
+            self.assertEqual(test_schedule, bytearray(len(test_schedule)))
+            self.assertEqual(len(test_key_cache._items), 1)
+        finally:
+            gostcrypto.gostcipher.set_key_cache_size(0)
+        self.assertEqual(len(test_key_cache._items), 0)
+        with self.assertRaises(GOSTCipherError) as context:
+            gostcrypto.gostcipher.set_key_cache_size(-1)
+        self.assertTrue('invalid cache size' in str(context.exception))
+
     def test_key_size(self):
         test_cipher = gostcrypto.gostcipher.GOST34122015Kuznechik(self.TEST_KEY)
         self.assertEqual(test_cipher.key_size, 32)
@@ -240,10 +290,31 @@ class TestMagma(unittest.TestCase):
         test_cipher = gostcrypto.gostcipher.GOST34122015Magma(self.TEST_KEY)
         self.assertEqual(test_cipher.decrypt(self.DECRYPT_TEST_STRING), self.ENCRYPT_TEST_STRING)
 
+    def test_encrypt_random(self):
+        test_cipher = gostcrypto.gostcipher.GOST34122015Magma(self.TEST_KEY)
+        for _ in range(16):
+            test_data = bytearray(os.urandom(8))
+            test_result = bytearray(test_data)
+            for i in range(31):
+                test_result = gostcrypto.gostcipher.GOST34122015Magma._cipher_g_prev(
+                    test_cipher._cipher_iter_key[i], test_result)
+            test_result = gostcrypto.gostcipher.GOST34122015Magma._cipher_g_fin(
+                test_cipher._cipher_iter_key[31], test_result)
+            self.assertEqual(test_cipher.encrypt(test_data), test_result)
+            self.assertEqual(test_cipher.decrypt(test_result), test_data)
+
     def test_key_size(self):
         test_cipher = gostcrypto.gostcipher.GOST34122015Magma(self.TEST_KEY)
         self.assertEqual(test_cipher.key_size, 32)
 
+    def test_clear(self):
+        test_cipher = gostcrypto.gostcipher.GOST34122015Magma(bytearray(os.urandom(32)))
+        test_cipher._rekey(bytearray(self.TEST_KEY))
+        self.assertEqual(test_cipher.decrypt(self.DECRYPT_TEST_STRING), self.ENCRYPT_TEST_STRING)
+        test_cipher.clear()
+        self.assertEqual(test_cipher._cipher_iter_key_int, [0] * 32)
+        self.assertEqual(test_cipher._cipher_iter_key_rev, [0] * 32)
+
 @pytest.mark.cipher
 class TestGOST34132015Kuznechik(unittest.TestCase):
 
@@ -625,6 +696,94 @@ class TestGOST34132015Kuznechik(unittest.TestCase):
             test_obj.decrypt('test_ciphertext')
         self.assertTrue('invalid ciphertext data' in str(context.exception))
 
+    def test_ctr_acpkm_encrypt(self):
+        test_plain_text = bytearray.fromhex(
+            '1122334455667700ffeeddccbbaa9988' '00112233445566778899aabbcceeff0a'
+            '112233445566778899aabbcceeff0a00' '2233445566778899aabbcceeff0a0011'
+            '33445566778899aabbcceeff0a001122' '445566778899aabbcceeff0a00112233'
+            '5566778899aabbcceeff0a0011223344'
+        )
+        test_cipher_text = bytearray.fromhex(
+            'f195d8bec10ed1dbd57b5fa240bda1b8' '85eee733f6a13e5df33ce4b33c45dee4'
+            '4bceeb8f646f4c55001706275e85e800' '587c4df568d094393e4834afd0805046'
+            'cf30f57686aeece11cfc6c316b8a896e' 'dffd07ec813636460c4f3b743423163e'
+            '6409a9c282fac8d469d221e7fbd6de5d'
+        )
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=32)
+        self.assertEqual(test_obj.encrypt(test_plain_text[:48]) + test_obj.encrypt(test_plain_text[48:]),
+                         test_cipher_text)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=32)
+        self.assertEqual(test_obj.encrypt_at(50, test_cipher_text[50:]), test_plain_text[50:])
+        self.assertEqual(test_obj.decrypt(test_cipher_text), test_plain_text)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=32)
+        test_result = test_obj.encrypt(test_plain_text[:48])
+        self.assertEqual(test_obj.encrypt_at(100, test_plain_text[100:]), test_cipher_text[100:])
+        self.assertEqual(test_obj.encrypt_at(3, test_plain_text[3:20]), test_cipher_text[3:20])
+        test_result += test_obj.encrypt(test_plain_text[48:80])
+        self.assertEqual(test_obj.encrypt_at(0, test_plain_text[:10]), test_cipher_text[:10])
+        test_result += test_obj.encrypt(test_plain_text[80:])
+        self.assertEqual(test_result, test_cipher_text)
+        self.assertEqual(test_obj.oid.name, 'id-tc26-cipher-gostr3412-2015-kuznyechik-ctracpkm')
+        with self.assertRaises(GOSTCipherError) as context:
+            gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+                                      section_size=40)
+        self.assertTrue('invalid section size' in str(context.exception))
+
+    def test_ctr_mac_encryptor(self):
+        test_data = os.urandom(16 * 20 + 5)
+        test_mac_key = bytearray(os.urandom(32))
+        test_cipher_text = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=64).encrypt(test_data)
+        test_mac = gostcrypto.gostcipher.new('kuznechik', test_mac_key, gostcrypto.gostcipher.MODE_MAC,
+            data=test_cipher_text).digest(16)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=64)
+        test_context = test_obj.mac_encryptor(test_mac_key)
+        test_result = test_context.update(test_data[:7]) + test_context.update(test_data[7:])
+        self.assertEqual(test_result, test_cipher_text)
+        self.assertEqual(test_context.finalize(), test_mac)
+        self.assertEqual(test_context.oid.name, 'id-tc26-cipher-gostr3412-2015-kuznyechik-ctracpkm-omac')
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=64)
+        test_context = test_obj.mac_decryptor(test_mac_key)
+        self.assertEqual(test_context.update(test_cipher_text), test_data)
+        with self.assertRaises(GOSTCipherError) as context:
+            test_context.finalize(test_mac[:-1] + bytes([test_mac[-1] ^ 1]))
+        self.assertTrue('invalid authentication tag' in str(context.exception))
+        with self.assertRaises(GOSTCipherError) as context:
+            test_context.update(test_cipher_text)
+        self.assertTrue('context already finalized' in str(context.exception))
+
+    def test_mgm_encrypt(self):
+        test_nonce = bytearray.fromhex('1122334455667700ffeeddccbbaa9988')
+        test_associated_data = bytearray.fromhex(
+            '02020202020202020101010101010101' '04040404040404040303030303030303'
+            'ea0505050505050505'
+        )
+        test_plain_text = bytearray.fromhex(
+            '1122334455667700ffeeddccbbaa9988' '00112233445566778899aabbcceeff0a'
+            '112233445566778899aabbcceeff0a00' '2233445566778899aabbcceeff0a0011'
+            'aabbcc'
+        )
+        test_tag = bytearray.fromhex('cf5d656f40c34f5c46e8bb0e29fcdb4c')
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+            nonce=test_nonce)
+        test_cipher_text, tag = test_obj.encrypt_and_digest(test_plain_text, test_associated_data)
+        self.assertEqual(tag, test_tag)
+        self.assertEqual(test_cipher_text[:16], bytearray.fromhex('a9757b8147956e9055b8a33de89f42fc'))
+        self.assertEqual(test_obj.decrypt_and_verify(test_cipher_text, tag, test_associated_data),
+                         test_plain_text)
+        with self.assertRaises(GOSTCipherError) as context:
+            test_obj.decrypt_and_verify(test_cipher_text, tag, test_associated_data[1:])
+        self.assertTrue('invalid authentication tag' in str(context.exception))
+        with self.assertRaises(GOSTCipherError) as context:
+            gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+                                      nonce=bytearray([0x80]) + test_nonce[1:])
+        self.assertTrue('invalid nonce value' in str(context.exception))
+
     def test_ofb_encrypt(self):
         test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_OFB,
             init_vect=self.TEST_INIT_VECT)
@@ -708,12 +867,33 @@ class TestGOST34132015Kuznechik(unittest.TestCase):
         test_obj.update(self.TEST_PLAIN_TEXT_NO_MUL)
         self.assertEqual(test_obj.digest(test_obj.block_size), self.TEST_MAC_VALUE_PAD)
 
+    def test_mac_calculate_parts(self):
+        for part_size in (1, 5, 16, 17):
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MAC)
+            for i in range(0, len(self.TEST_PLAIN_TEXT_NO_MUL), part_size):
+                test_obj.update(self.TEST_PLAIN_TEXT_NO_MUL[i:i + part_size])
+            self.assertEqual(test_obj.digest(test_obj.block_size), self.TEST_MAC_VALUE_PAD)
+
+    def test_mac_calculate_memoryview(self):
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MAC)
+        test_obj.update(memoryview(self.TEST_PLAIN_TEXT)[:20])
+        test_obj.digest(test_obj.block_size)
+        test_obj.update(memoryview(self.TEST_PLAIN_TEXT)[20:])
+        self.assertEqual(test_obj.digest(test_obj.block_size), self.TEST_MAC_VALUE)
+        test_obj.update(self.TEST_PLAIN_TEXT)
+        self.assertEqual(test_obj.digest(test_obj.block_size), self.TEST_MAC_VALUE_DOUBLE)
+
     def test_mac_calculate_raises(self):
         test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MAC)
         with self.assertRaises(GOSTCipherError) as context:
             test_obj.update('test_text_mac')
         self.assertTrue('invalid text data' in str(context.exception))
         test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MAC)
+        test_obj.update(self.TEST_PLAIN_TEXT[:5])
+        with self.assertRaises(GOSTCipherError) as context:
+            test_obj.update(memoryview(self.TEST_PLAIN_TEXT)[::2])
+        self.assertTrue('invalid text data' in str(context.exception))
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_MAC)
         with self.assertRaises(GOSTCipherError) as context:
             test_obj.update(self.TEST_PLAIN_TEXT)
             test_obj.digest(test_obj.block_size + 1)
@@ -737,6 +917,200 @@ class TestGOST34132015Kuznechik(unittest.TestCase):
         test_counter = bytearray(test_counter)
         self.assertEqual(test_obj.counter, test_counter)
 
+    def test_split_data(self):
+        test_modes = (
+            gostcrypto.gostcipher.MODE_CTR,
+            gostcrypto.gostcipher.MODE_CBC,
+            gostcrypto.gostcipher.MODE_CFB,
+            gostcrypto.gostcipher.MODE_OFB,
+        )
+        test_data = os.urandom(16 * 4200 + 5)
+        for test_mode in test_modes:
+            test_init_vect = self.TEST_INIT_VECT_CTR if test_mode == gostcrypto.gostcipher.MODE_CTR else self.TEST_INIT_VECT
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            test_result = test_obj.encrypt(test_data)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            test_result_split = test_obj.encrypt(test_data[:16]) + test_obj.encrypt(test_data[16:16 * 4100])
+            test_result_split += test_obj.encrypt(test_data[16 * 4100:])
+            self.assertEqual(test_result_split, test_result)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            self.assertEqual(test_obj.decrypt(test_result)[:len(test_data)], test_data)
+
+    def test_encrypt_into(self):
+        test_modes = (
+            gostcrypto.gostcipher.MODE_ECB,
+            gostcrypto.gostcipher.MODE_CBC,
+            gostcrypto.gostcipher.MODE_CTR,
+            gostcrypto.gostcipher.MODE_CFB,
+            gostcrypto.gostcipher.MODE_OFB,
+        )
+        test_data = os.urandom(16 * 300 + 5)
+        for test_mode in test_modes:
+            test_init_vect = self.TEST_INIT_VECT_CTR if test_mode == gostcrypto.gostcipher.MODE_CTR else self.TEST_INIT_VECT
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            test_result = test_obj.encrypt(test_data)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            test_out = bytearray(len(test_result) + 16)
+            self.assertEqual(test_obj.encrypt_into(memoryview(test_data), test_out), len(test_result))
+            self.assertEqual(test_out[:len(test_result)], test_result)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            test_out = bytearray(test_result)
+            test_size = test_obj.decrypt_into(test_out, test_out)
+            self.assertEqual(test_out[:len(test_data)], test_data)
+            self.assertEqual(test_size, len(test_result))
+            with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                test_obj.encrypt_into(memoryview(test_data)[::2], bytearray(len(test_data)))
+            self.assertTrue('GOSTCipherError: invalid plaintext data' in str(context.exception))
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+            with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                test_obj.decrypt_into(memoryview(test_result)[::2], bytearray(len(test_result)))
+            self.assertTrue('GOSTCipherError: invalid ciphertext data' in str(context.exception))
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR,
+                                             init_vect=self.TEST_INIT_VECT_CTR)
+        test_result = test_obj.encrypt(test_data)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR,
+                                             init_vect=self.TEST_INIT_VECT_CTR)
+        test_out = bytearray(test_data)
+        test_obj.encrypt_into(test_out, test_out)
+        self.assertEqual(test_out, test_result)
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.encrypt_into(test_data, bytearray(len(test_data) - 1))
+        self.assertTrue('GOSTCipherError: invalid output buffer' in str(context.exception))
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.encrypt_into(test_data, bytes(len(test_data)))
+        self.assertTrue('GOSTCipherError: invalid output buffer' in str(context.exception))
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.encrypt_into('test', bytearray(16))
+        self.assertTrue('GOSTCipherError: invalid plaintext data' in str(context.exception))
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.encrypt_at(16, memoryview(test_data)[::2])
+        self.assertTrue('GOSTCipherError: invalid plaintext data' in str(context.exception))
+
+    def test_encryptor(self):
+        test_data = os.urandom(16 * 20 + 5)
+        for test_mode in (gostcrypto.gostcipher.MODE_ECB, gostcrypto.gostcipher.MODE_CBC):
+            for test_pad_mode in (gostcrypto.gostcipher.PAD_MODE_1, gostcrypto.gostcipher.PAD_MODE_2):
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode,
+                                                     init_vect=self.TEST_INIT_VECT, pad_mode=test_pad_mode)
+                test_result = test_obj.encrypt(test_data)
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode,
+                                                     init_vect=self.TEST_INIT_VECT, pad_mode=test_pad_mode)
+                test_ctx = test_obj.encryptor()
+                test_result_split = test_ctx.update(test_data[:7]) + test_ctx.update(test_data[7:100])
+                test_result_split += test_ctx.update(test_data[100:]) + test_ctx.finalize()
+                self.assertEqual(test_result_split, test_result)
+                with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                    test_ctx.update(test_data)
+                self.assertTrue('GOSTCipherError: context already finalized' in str(context.exception))
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode,
+                                                     init_vect=self.TEST_INIT_VECT, pad_mode=test_pad_mode)
+                test_ctx = test_obj.decryptor()
+                test_result_split = test_ctx.update(test_result[:7]) + test_ctx.update(test_result[7:100])
+                test_result_split += test_ctx.update(test_result[100:]) + test_ctx.finalize()
+                self.assertEqual(test_result_split[:len(test_data)], test_data)
+                if test_mode == gostcrypto.gostcipher.MODE_CBC:
+                    self.assertEqual(test_obj.iv, test_result[len(test_result) - 16:])
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode,
+                                                     init_vect=self.TEST_INIT_VECT, pad_mode=test_pad_mode)
+                test_ctx = test_obj.encryptor()
+                test_ctx.update(test_data[:7])
+                with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                    test_ctx.update(memoryview(test_data)[::2])
+                self.assertTrue('GOSTCipherError: invalid plaintext data' in str(context.exception))
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode,
+                                                     init_vect=self.TEST_INIT_VECT, pad_mode=test_pad_mode)
+                test_ctx = test_obj.decryptor()
+                test_ctx.update(test_result[:7])
+                with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                    test_ctx.update(memoryview(test_result)[::2])
+                self.assertTrue('GOSTCipherError: invalid ciphertext data' in str(context.exception))
+
+    def test_cipher_file(self):
+        test_data = os.urandom(16 * 100 + 5)
+        with tempfile.TemporaryDirectory() as test_dir:
+            test_plain_path = os.path.join(test_dir, 'plain_file')
+            test_cipher_path = os.path.join(test_dir, 'cipher_file')
+            with open(test_plain_path, 'wb') as test_file:
+                test_file.write(test_data)
+            for test_mode in (gostcrypto.gostcipher.MODE_CBC, gostcrypto.gostcipher.MODE_CTR):
+                test_init_vect = self.TEST_INIT_VECT_CTR if test_mode == gostcrypto.gostcipher.MODE_CTR else self.TEST_INIT_VECT
+                test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=test_init_vect)
+                test_result = test_obj.encrypt(test_data)
+                test_progress = []
+                test_size = gostcrypto.gostcipher.encrypt_file(
+                    test_plain_path, test_cipher_path, 'kuznechik', self.TEST_KEY, test_mode,
+                    chunk_size=100, progress=lambda done, total: test_progress.append((done, total)),
+                    init_vect=test_init_vect)
+                self.assertEqual(test_size, len(test_result))
+                self.assertEqual(test_progress[-1], (len(test_data), len(test_data)))
+                with open(test_cipher_path, 'rb') as test_file:
+                    self.assertEqual(test_file.read(), test_result)
+                gostcrypto.gostcipher.decrypt_file(test_cipher_path, test_plain_path + '.dec', 'kuznechik',
+                                                   self.TEST_KEY, test_mode, init_vect=test_init_vect)
+                with open(test_plain_path + '.dec', 'rb') as test_file:
+                    self.assertEqual(test_file.read()[:len(test_data)], test_data)
+            with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                gostcrypto.gostcipher.encrypt_file(test_plain_path, test_cipher_path, 'kuznechik',
+                                                   self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR, chunk_size=0)
+            self.assertTrue('GOSTCipherError: invalid chunk size' in str(context.exception))
+            with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                gostcrypto.gostcipher.encrypt_file(test_plain_path, test_plain_path + '.mgm', 'kuznechik',
+                                                   self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+                                                   nonce=bytearray(16))
+            self.assertTrue('GOSTCipherError: unsupported cipher mode' in str(context.exception))
+            self.assertFalse(os.path.exists(test_plain_path + '.mgm'))
+            os.link(test_plain_path, test_plain_path + '.link')
+            for test_dst_path in (test_plain_path, test_plain_path + '.link'):
+                with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+                    gostcrypto.gostcipher.encrypt_file(test_plain_path, test_dst_path, 'kuznechik',
+                                                       self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR)
+                self.assertTrue('source and destination are the same file' in str(context.exception))
+            with open(test_plain_path, 'rb') as test_file:
+                self.assertEqual(test_file.read(), test_data)
+
+    def test_ctr_seek(self):
+        test_data = os.urandom(16 * 10 + 5)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR,
+                                             init_vect=self.TEST_INIT_VECT_CTR)
+        test_result = test_obj.encrypt(test_data)
+        for test_begin, test_end in ((0, 16), (5, 7), (17, 100), (40, len(test_data))):
+            self.assertEqual(test_obj.encrypt_at(test_begin, test_data[test_begin:test_end]),
+                             test_result[test_begin:test_end])
+            test_obj.seek(test_begin)
+            self.assertEqual(test_obj.decrypt(test_result[test_begin:test_end]), test_data[test_begin:test_end])
+        test_obj.seek(16 * 3)
+        self.assertEqual(test_obj.counter, self.TEST_INIT_VECT_CTR + bytearray([0, 0, 0, 0, 0, 0, 0, 3]))
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.seek(-1)
+        self.assertTrue('GOSTCipherError: invalid offset' in str(context.exception))
+
+    def test_ctr_parallel_encrypt(self):
+        test_data = os.urandom(16 * 10000 + 5)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR,
+                                             init_vect=self.TEST_INIT_VECT_CTR)
+        test_result = test_obj.encrypt(test_data)
+        test_counter = bytearray(test_obj.counter)
+        test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR,
+                                             init_vect=self.TEST_INIT_VECT_CTR)
+        self.assertEqual(test_obj.parallel_encrypt(test_data, workers=2), test_result)
+        self.assertEqual(test_obj.counter, test_counter)
+        with self.assertRaises(gostcrypto.gostcipher.GOSTCipherError) as context:
+            test_obj.parallel_encrypt(test_data, workers=0)
+        self.assertTrue('GOSTCipherError: invalid number of workers' in str(context.exception))
+
+    def test_parallel_decrypt(self):
+        test_data = os.urandom(16 * 10000 + 5)
+        for test_mode in (gostcrypto.gostcipher.MODE_CBC, gostcrypto.gostcipher.MODE_CFB):
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=self.TEST_INIT_VECT)
+            test_result = test_obj.encrypt(test_data)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=self.TEST_INIT_VECT)
+            test_plain = test_obj.decrypt(test_result)
+            test_iv = bytearray(test_obj.iv)
+            test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, test_mode, init_vect=self.TEST_INIT_VECT)
+            self.assertEqual(test_obj.parallel_decrypt(test_result, workers=2), test_plain)
+            self.assertEqual(test_obj.iv, test_iv)
+            self.assertEqual(test_plain[:len(test_data)], test_data)
+
     def test_oid(self):
         test_obj = gostcrypto.gostcipher.new('kuznechik', self.TEST_KEY, gostcrypto.gostcipher.MODE_ECB)
         self.assertEqual(test_obj.oid.__str__(), '1.2.643.7.1.1.5.2')
@@ -920,6 +1294,56 @@ class TestGOST34132015Magma(unittest.TestCase):
         test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_CFB)    
         self.assertEqual(test_obj.decrypt(self.TEST_CIPHER_TEXT_CFB_NO_MUL), self.TEST_PLAIN_TEXT_NO_MUL)
 
+    def test_ctr_acpkm_decrypt(self):
+        test_data = os.urandom(8 * 50 + 3)
+        test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=16)
+        test_result = test_obj.encrypt(test_data)
+        self.assertEqual(test_result[:16], gostcrypto.gostcipher.new('magma', self.TEST_KEY,
+            gostcrypto.gostcipher.MODE_CTR, init_vect=self.TEST_INIT_VECT_CTR).encrypt(test_data[:16]))
+        test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_CTR_ACPKM,
+            init_vect=self.TEST_INIT_VECT_CTR, section_size=16)
+        self.assertEqual(test_obj.decrypt(test_result), test_data)
+        self.assertEqual(test_obj.oid.name, 'id-tc26-cipher-gostr3412-2015-magma-ctracpkm')
+
+    def test_mgm_decrypt(self):
+        test_nonce = bytearray.fromhex('12def06b3c130a59')
+        test_associated_data = bytearray.fromhex(
+            '0101010101010101' '0202020202020202' '0303030303030303' '0404040404040404'
+            '0505050505050505' 'ea'
+        )
+        test_plain_text = bytearray.fromhex(
+            'ffeeddccbbaa9988' '1122334455667700' '8899aabbcceeff0a' '0011223344556677'
+            '99aabbcceeff0a00' '1122334455667788' 'aabbcceeff0a0011' '2233445566778899'
+            'aabbcc'
+        )
+        test_cipher_text = bytearray.fromhex(
+            'c795066c5f9ea03b' '85113342459185ae' '1f2e00d6bf2b785d' '940470b8bb9c8e7d'
+            '9a5dd3731f7ddc70' 'ec27cb0ace6fa576' '70f65c646abb75d5' '47aa37c3bcb5c34e'
+            '03bb9c'
+        )
+        test_tag = bytearray.fromhex('a7928069aa10fd10')
+        test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+            nonce=test_nonce)
+        self.assertEqual(test_obj.encrypt_and_digest(test_plain_text, test_associated_data),
+                         (test_cipher_text, test_tag))
+        self.assertEqual(test_obj.decrypt_and_verify(test_cipher_text, test_tag, test_associated_data),
+                         test_plain_text)
+        test_data = os.urandom(8 * 50 + 3)
+        test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+            nonce=test_nonce, tag_size=4)
+        test_cipher_text, tag = test_obj.encrypt_and_digest(test_data, b'header')
+        self.assertEqual(len(tag), 4)
+        self.assertEqual(test_obj.decrypt_and_verify(test_cipher_text, tag, b'header'), test_data)
+        test_cipher_text[0] ^= 1
+        with self.assertRaises(GOSTCipherError) as context:
+            test_obj.decrypt_and_verify(test_cipher_text, tag, b'header')
+        self.assertTrue('invalid authentication tag' in str(context.exception))
+        with self.assertRaises(GOSTCipherError) as context:
+            gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_MGM,
+                                      nonce=test_nonce, tag_size=9)
+        self.assertTrue('invalid tag size' in str(context.exception))
+
     def test_ofb_encrypt(self):
         test_obj = gostcrypto.gostcipher.new('magma', self.TEST_KEY, gostcrypto.gostcipher.MODE_OFB,
             init_vect=self.TEST_INIT_VECT)
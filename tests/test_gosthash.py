@@ -1,9 +1,14 @@
+import asyncio
+import os
+import tempfile
+import threading
 import unittest
 import pytest
 
 import gostcrypto
 
 from gostcrypto.gosthash import GOSTHashError
+from gostcrypto.gosthash import GOST34112012State
 from gostcrypto.gostoid import ObjectIdentifier
 
 @pytest.mark.hasher
@@ -102,6 +107,22 @@ class Test(unittest.TestCase):
             test_hasher.update('test_data')
         self.assertTrue('invalid data value' in str(context.exception))
 
+    def test_update_block_boundary(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        test_hasher.update(self.TEST_MSG_LONG[:32])
+        test_hasher.update(self.TEST_MSG_LONG[32:64])
+        test_hasher.update(self.TEST_MSG_LONG[64:])
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        self.assertEqual(test_hasher.hexdigest(), test_result)
+
+    def test_update_small_chunks(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        for i in range(0, len(self.TEST_MSG_LONG), 5):
+            test_hasher.update(self.TEST_MSG_LONG[i:i + 5])
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        self.assertEqual(test_hasher.hexdigest(), test_result)
+        self.assertEqual(len(test_hasher._buff), len(self.TEST_MSG_LONG) % test_hasher.block_size)
+
     def test_reset_512(self):
         test_hasher = gostcrypto.gosthash.new('streebog512')
         test_hasher.update(self.TEST_MSG_LONG)
@@ -147,6 +168,230 @@ class Test(unittest.TestCase):
         test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
         self.assertEqual(result, test_result)
 
+    def test_copy(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        test_hasher.update(u'Се ветри, Стрибожи внуци, веютъ с моря '.encode('cp1251'))
+        test_hasher_copy = test_hasher.copy()
+        test_hasher_copy.update(u'стрелами на храбрыя плъкы Игоревы'.encode('cp1251'))
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        self.assertEqual(test_hasher_copy.hexdigest(), test_result)
+        self.assertNotEqual(test_hasher.hexdigest(), test_result)
+        self.assertEqual(test_hasher_copy.oid.__str__(), '1.2.643.7.1.1.2.3')
+
+    def test_export_import_state(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        test_hasher.update(u'Се ветри, Стрибожи внуци, веютъ с моря '.encode('cp1251'))
+        test_state = test_hasher.export_state()
+        test_hasher.update(b'test_data')
+        _test_hasher = gostcrypto.gosthash.new('streebog256')
+        _test_hasher.import_state(test_state)
+        _test_hasher.update(u'стрелами на храбрыя плъкы Игоревы'.encode('cp1251'))
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        self.assertEqual(_test_hasher.hexdigest(), test_result)
+        self.assertEqual(_test_hasher.name, 'streebog512')
+        self.assertEqual(_test_hasher.oid.__str__(), '1.2.643.7.1.1.2.3')
+
+    def test_export_import_state_bytes(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        test_hasher.update(u'Се ветри, Стрибожи внуци, веютъ с моря '.encode('cp1251'))
+        test_state = test_hasher.export_state().to_bytes()
+        self.assertEqual(len(test_state), 259)
+        self.assertEqual(test_state[0:3], bytes([0x01, 0x03, 39]))
+        self.assertEqual(GOST34112012State.from_bytes(test_state), test_hasher.export_state())
+        _test_hasher = gostcrypto.gosthash.new('streebog512')
+        _test_hasher.import_state(test_state)
+        _test_hasher.update(u'стрелами на храбрыя плъкы Игоревы'.encode('cp1251'))
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        self.assertEqual(_test_hasher.hexdigest(), test_result)
+
+    def test_import_state_raises(self):
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        with self.assertRaises(GOSTHashError) as context:
+            test_hasher.import_state('test_state')
+        self.assertTrue('invalid state value' in str(context.exception))
+        test_state = bytearray(test_hasher.export_state().to_bytes())
+        test_state[0] = 0x02
+        with self.assertRaises(GOSTHashError) as context:
+            test_hasher.import_state(test_state)
+        self.assertTrue('invalid state value' in str(context.exception))
+        with self.assertRaises(GOSTHashError) as context:
+            test_hasher.import_state(test_state[:-1])
+        self.assertTrue('invalid state value' in str(context.exception))
+
+    def test_hash_buffer(self):
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        test_hasher = gostcrypto.gosthash.hash_buffer(memoryview(self.TEST_MSG_LONG), 'streebog512')
+        self.assertEqual(test_hasher.hexdigest(), test_result)
+        test_hasher = gostcrypto.gosthash.hash_buffer(memoryview(self.TEST_MSG_LONG).cast('H'), 'streebog512')
+        self.assertEqual(test_hasher.hexdigest(), test_result)
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.hash_buffer('test_data')
+        self.assertTrue('invalid data value' in str(context.exception))
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.hash_buffer(memoryview(self.TEST_MSG_LONG)[::2])
+        self.assertTrue('invalid data value' in str(context.exception))
+        test_hasher = gostcrypto.gosthash.new('streebog512')
+        with self.assertRaises(GOSTHashError) as context:
+            test_hasher.update(memoryview(bytearray(self.TEST_MSG_LONG))[::2])
+        self.assertTrue('invalid data value' in str(context.exception))
+
+    def test_hash_file(self):
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        with tempfile.TemporaryDirectory() as test_dir:
+            test_path = os.path.join(test_dir, 'test_file')
+            with open(test_path, 'wb') as test_file:
+                test_file.write(self.TEST_MSG_LONG)
+            test_hasher = gostcrypto.gosthash.hash_file(test_path, 'streebog512')
+            self.assertEqual(test_hasher.hexdigest(), test_result)
+            open(test_path, 'wb').close()
+            test_hasher = gostcrypto.gosthash.hash_file(test_path, 'streebog512')
+            self.assertEqual(test_hasher.digest(), gostcrypto.gosthash.new('streebog512').digest())
+            with self.assertRaises(GOSTHashError) as context:
+                gostcrypto.gosthash.hash_file(test_path, chunk_size=0)
+            self.assertTrue('invalid chunk size' in str(context.exception))
+
+    def test_hash_many(self):
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+        with tempfile.TemporaryDirectory() as test_dir:
+            test_path = os.path.join(test_dir, 'test_file')
+            with open(test_path, 'wb') as test_file:
+                test_file.write(self.TEST_MSG_LONG)
+            test_items = [test_path, self.TEST_MSG_LONG, memoryview(self.TEST_MSG_LONG)]
+            result = list(gostcrypto.gosthash.hash_many(test_items, 'streebog512', workers=2))
+        self.assertEqual(len(result), 3)
+        for item, digest in result:
+            self.assertTrue(any(item is test_item for test_item in test_items))
+            self.assertEqual(digest.hex(), test_result)
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.hash_many([], 'streebog512', workers=0)
+        self.assertTrue('invalid number of workers' in str(context.exception))
+
+    def test_hash_batch(self):
+        test_messages = [self.TEST_MSG_LONG, bytes(reversed(self.TEST_MSG_LONG)), bytearray(len(self.TEST_MSG_LONG))]
+        for test_name in ('streebog256', 'streebog512'):
+            test_result = [gostcrypto.gosthash.new(test_name, data=item).digest() for item in test_messages]
+            self.assertEqual(gostcrypto.gosthash.hash_batch(test_messages, test_name), test_result)
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.hash_batch([self.TEST_MSG_LONG, self.TEST_MSG_SHORT])
+        self.assertTrue('invalid data value' in str(context.exception))
+
+    def test_async_hash_stream(self):
+        test_result = '1e88e62226bfca6f9994f1f2d51569e0daf8475a3b0fe61a5300eee46d961376035fe83549ada2b8620fcd7c496ce5b33f0cb9dddc2b6460143b03dabac9fb28'
+
+        async def test_chunks():
+            for i in range(0, len(self.TEST_MSG_LONG), 5):
+                yield self.TEST_MSG_LONG[i:i + 5]
+
+        async def test_stream():
+            test_reader = asyncio.StreamReader()
+            test_reader.feed_data(self.TEST_MSG_LONG)
+            test_reader.feed_eof()
+            test_hasher = await gostcrypto.gosthash.async_hash_stream(
+                test_reader, 'streebog512', chunk_size=7, max_blocks=1)
+            _test_hasher = await gostcrypto.gosthash.async_hash_stream(
+                test_chunks(), 'streebog512')
+            test_async = gostcrypto.gosthash.AsyncGOST34112012('streebog512', max_blocks=1)
+            test_data = bytearray(self.TEST_MSG_LONG[:10])
+            await test_async.update(test_data)
+            test_data[:] = bytes(10)
+            await test_async.update(memoryview(self.TEST_MSG_LONG)[10:])
+            self.assertEqual(test_async.hexdigest(), test_result)
+            return test_hasher.hexdigest(), _test_hasher.hexdigest()
+
+        test_loop = asyncio.new_event_loop()
+        try:
+            result = test_loop.run_until_complete(test_stream())
+        finally:
+            test_loop.close()
+        self.assertEqual(result, (test_result, test_result))
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.AsyncGOST34112012('streebog512', max_blocks=0)
+        self.assertTrue('invalid number of blocks' in str(context.exception))
+
+    def test_tree(self):
+        def test_hash(data):
+            return bytes(gostcrypto.gosthash.new('streebog256', data=data).digest())
+
+        test_data = bytearray(os.urandom(64 * 3 + 10))
+        test_tree = gostcrypto.gosthash.GOST34112012Tree('streebog256', leaf_size=64)
+        self.assertEqual(test_tree.update_buffer(test_data), [0, 1, 2, 3])
+        test_leaves = [test_hash(b'\x00' + test_data[i:i + 64]) for i in range(0, len(test_data), 64)]
+        test_result = test_hash(b'\x01' + test_hash(b'\x01' + test_leaves[0] + test_leaves[1])
+                                + test_hash(b'\x01' + test_leaves[2] + test_leaves[3]))
+        self.assertEqual(test_tree.digest(), test_result)
+        test_data[70] ^= 0xff
+        self.assertEqual(test_tree.update_buffer(test_data), [1])
+        self.assertEqual(test_tree.digest(), self._test_tree_digest(test_data))
+        test_data[150] ^= 0xff
+        self.assertEqual(test_tree.update_buffer(test_data, changed=[(150, 1)]), [2])
+        with self.assertRaises(GOSTHashError) as context:
+            test_tree.update_buffer(memoryview(test_data)[::2])
+        self.assertTrue('invalid data value' in str(context.exception))
+        self.assertEqual(test_tree.hexdigest(), self._test_tree_digest(test_data).hex())
+        test_data += os.urandom(100)
+        self.assertEqual(test_tree.update_buffer(test_data, changed=[]), [3, 4])
+        self.assertEqual(test_tree.digest(), self._test_tree_digest(test_data))
+        del test_data[100:]
+        self.assertEqual(test_tree.update_buffer(test_data), [1])
+        self.assertEqual(test_tree.digest(), self._test_tree_digest(test_data))
+        test_tree = gostcrypto.gosthash.GOST34112012Tree.from_bytes(test_tree.to_bytes())
+        self.assertEqual(test_tree.digest(), self._test_tree_digest(test_data))
+        self.assertEqual(test_tree.update_buffer(test_data), [])
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.GOST34112012Tree.from_bytes(test_tree.to_bytes()[:-1])
+        self.assertTrue('invalid tree value' in str(context.exception))
+        with self.assertRaises(GOSTHashError) as context:
+            gostcrypto.gosthash.GOST34112012Tree('streebog256', leaf_size=100)
+        self.assertTrue('invalid leaf size' in str(context.exception))
+
+    def test_tree_file(self):
+        test_data = bytearray(os.urandom(4096))
+        with tempfile.TemporaryDirectory() as test_dir:
+            test_path = os.path.join(test_dir, 'test_file')
+            with open(test_path, 'wb') as test_file:
+                test_file.write(test_data)
+            test_tree = gostcrypto.gosthash.GOST34112012Tree('streebog512', leaf_size=1024)
+            self.assertEqual(test_tree.update_file(test_path), [0, 1, 2, 3])
+            with open(test_path, 'r+b') as test_file:
+                test_file.seek(2000)
+                test_file.write(b'test')
+            test_data[2000:2004] = b'test'
+            self.assertEqual(test_tree.update_file(test_path, changed=[(2000, 4)]), [1])
+            test_result = gostcrypto.gosthash.GOST34112012Tree('streebog512', leaf_size=1024)
+            test_result.update_buffer(test_data)
+            self.assertEqual(test_tree.digest(), test_result.digest())
+            open(test_path, 'wb').close()
+            test_tree.update_file(test_path)
+            self.assertEqual(test_tree.digest(),
+                             gostcrypto.gosthash.GOST34112012Tree('streebog512', leaf_size=1024).digest())
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'named pipes are not supported')
+    def test_tree_file_pipe(self):
+        def test_writer(path, data):
+            with open(path, 'wb') as test_file:
+                test_file.write(data)
+
+        test_data = os.urandom(4096 + 10)
+        test_result = gostcrypto.gosthash.GOST34112012Tree('streebog512', leaf_size=1024)
+        test_result.update_buffer(test_data)
+        with tempfile.TemporaryDirectory() as test_dir:
+            test_path = os.path.join(test_dir, 'test_pipe')
+            os.mkfifo(test_path)
+            test_thread = threading.Thread(target=test_writer, args=(test_path, test_data))
+            test_thread.start()
+            test_tree = gostcrypto.gosthash.GOST34112012Tree('streebog512', leaf_size=1024)
+            try:
+                self.assertEqual(test_tree.update_file(test_path), [0, 1, 2, 3, 4])
+            finally:
+                test_thread.join()
+        self.assertEqual(test_tree.digest(), test_result.digest())
+
+    @staticmethod
+    def _test_tree_digest(data):
+        test_tree = gostcrypto.gosthash.GOST34112012Tree('streebog256', leaf_size=64)
+        test_tree.update_buffer(data)
+        return test_tree.digest()
+
     def test_habr_144(self):
         test_hasher = gostcrypto.gosthash.new('streebog256')
         test_hasher.update(bytearray.fromhex('d0cf11e0a1b11ae1000000000000000000000000000000003e000300feff0900060000000000000000000000010000000100\